@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+"""
+지오코딩 쿼리 정규 키 (캐시 조회용)
+- 쿼리를 (행정구역, 도로명, 본번-부번, 건물명)으로 분해 후 고정 순서로 재조립
+- 시/도/구 접두어 유무, 공백, '번지' 위치/유무, 층·호 같은 건물 세부 표기만 다른 쿼리는 같은 키
+  예) '천안시 두정동 1556번지' == '충청남도 천안시 두정동 1556' == '충청남도 천안시 서북구 두정동1556 번지'
+- 숫자+'동' 토큰은 번지/건물명 뒤에서만 건물 세부('101동')로 제외, 그 앞에서는 행정동 일부('성정 2동' → '성정2동')
+- 행정구역만 남는 쿼리는 정규 키를 만들지 않음 (원문 키로만 조회)
+- 키는 조회에만 사용 (API에는 원본 쿼리를 그대로 보냄)
+"""
+
+import re
+
+# 키에서 빼는 상위 행정구역 (천안 단일 도시 데이터)
+_PREFIX_TOKENS = {"충청남도", "충남", "천안시", "천안", "동남구", "서북구"}
+
+_ADMIN_RE = re.compile(r"^[가-힣]+\d*(동|읍|면|리)$")
+_ROAD_RE = re.compile(r"^[가-힣A-Za-z0-9]+(로|길)(\d+(번)?길)?$")
+_NUMBER_RE = re.compile(r"^(산)?(\d+)(?:-(\d+))?(번지|번)?$")
+_UNIT_RE = re.compile(r"^(지하|B)?\d+(층|호)$|^(지하|B)\d+동$|^B\d+$|^번지$")  # 건물 세부(층/호) + 떨어진 '번지'
+_UNIT_DONG_RE = re.compile(r"^\d+동$")   # '101동'(건물 동) 또는 '성정 2동'(띄어 쓴 행정동 번호)
+
+# '두정동1556' / '천흥리322-1' / '대흥로217' → 행정구역·도로명과 번지 분리
+_GLUED_RE = re.compile(r"([가-힣](?:동|읍|면|리|로|길))(산?\d)")
+
+
+def parse_address(q) -> dict:
+    """
+    쿼리 → {'admin': '성환읍 성환리', 'road': '', 'number': '305-2', 'building': ''}
+    - number: 본번[-부번], 산번지는 '산' 접두
+    - building: 나머지 토큰을 공백 없이 연결 (장소명/건물명)
+    """
+    s = re.sub(r"\(.*?\)|[,]", " ", str(q or ""))
+    s = _GLUED_RE.sub(r"\1 \2", s)
+    admin, road, number, building = [], "", "", []
+    for tok in s.split():
+        if tok in _PREFIX_TOKENS or _UNIT_RE.match(tok):
+            continue
+        if _UNIT_DONG_RE.match(tok):
+            # '성정 2동' → 앞 토큰(행정동 이름 앞부분, 3자 이하)에 붙여 행정동, 번지/건물명 뒤의 '101동'은 건물 세부로 제외
+            if (not admin and not road and not number and len(building) == 1 and len(building[0]) <= 3
+                    and _ADMIN_RE.match(building[0] + tok)):
+                admin.append(building.pop() + tok)
+                continue
+            if number or building:
+                continue
+        m = _NUMBER_RE.match(tok)
+        if m and not number:
+            number = (m.group(1) or "") + str(int(m.group(2)))
+            if m.group(3) is not None:
+                number += f"-{int(m.group(3))}"
+            continue
+        if not road and not number and not building and _ADMIN_RE.match(tok):
+            admin.append(tok)
+            continue
+        if not road and not number and _ROAD_RE.match(tok):
+            road = tok
+            continue
+        building.append(tok)
+    return {"admin": " ".join(admin), "road": road, "number": number, "building": "".join(building)}
+
+
+def canonical_key(q) -> str:
+    """
+    정규 키 '행정구역|도로명|번지|건물명'
+    - 행정구역만 남거나 분해 결과가 비면 빈 문자열 (동 이름만으로는 서로 다른 장소를 묶을 수 있음)
+    """
+    p = parse_address(q)
+    if not (p["road"] or p["number"] or p["building"]):
+        return ""
+    return f"{p['admin']}|{p['road']}|{p['number']}|{p['building']}"
+
+
+def is_number_only(q) -> bool:
+    """동/도로명/건물명 없이 번지만 남는 쿼리 (예: '천안시 874') → 주소 검색 불가"""
+    p = parse_address(q)
+    return bool(p["number"]) and not (p["admin"] or p["road"] or p["building"])
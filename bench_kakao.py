@@ -0,0 +1,198 @@
+# -*- coding: utf-8 -*-
+"""
+카카오 수집/지오코딩 처리량 벤치마크 (로컬 목서버 대상, API 키 불필요)
+- 수집기: kakao_async.run_crawl_jobs (카테고리 + 키워드 보강 작업)
+- 지오코더: 스레드풀 + 전역 간격 제한(기존 2_02 방식) vs 비동기 엔진(kakao_geocoder_async), 임시 저장소
+- 리포트: 총 요청 수, 429 수, req/s, 문서 수, 중복 문서 수, 소요 시간
+"""
+
+import importlib.util
+import os
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
+
+from shapely.geometry import box
+
+from kakao_mock_server import serve_in_thread
+
+# =========================
+# 설정
+# =========================
+BENCH_GROUPS = ["MT1", "SC4", "CT1", "PO3", "HP8"]
+BENCH_KEYWORDS = ["우체국", "보건지소", "요양병원", "재활병원"]
+BENCH_GRID = (6, 4)
+BENCH_RPS = 25.0
+BENCH_IN_FLIGHT = 16
+
+BENCH_N_ADDR = 400
+BENCH_GEOCODE_WORKERS = 6
+BENCH_GEOCODE_DELAY = 0.04   # 2_02 RATE_LIMIT_DELAY 대응 (목서버 상한 30 req/s 아래로 축소, 비동기 엔진 QPS = 1/간격)
+
+MOCK_OPTIONS = {"latency_ms": 40.0, "latency_jitter_ms": 20.0, "max_rps": 30.0, "p_429": 0.01}
+
+GEOCODE_PIPELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                "불법주정차_분석", "2_02_Cheonan_illegal_parking_geocoding_pipeline.py")
+
+
+def _load_module(path: str, name: str):
+    script_dir = os.path.dirname(path)      # 스크립트 옆 _repo_path 등 import 가능하도록
+    if script_dir not in sys.path:
+        sys.path.append(script_dir)
+    spec = importlib.util.spec_from_file_location(name, path)
+    mod = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(mod)
+    return mod
+
+
+def _report(title: str, rows: dict):
+    print(f"\n[BENCH] {title}")
+    for k, v in rows.items():
+        print(f"  {k:<18} {v}")
+
+
+# =========================
+# 수집기
+# =========================
+def bench_crawl(server) -> dict:
+    import kakao_async as ka  # KAKAO_API_BASE 설정 후 import
+
+    poly = box(*server.bbox)
+    jobs = ([ka.make_job("category", gc) for gc in BENCH_GROUPS]
+            + [ka.make_job("keyword", kw) for kw in BENCH_KEYWORDS])
+    server.reset_counts()
+    t0 = time.monotonic()
+    docs_by_job = ka.run_crawl_jobs(jobs, server.bbox, BENCH_GRID[0], BENCH_GRID[1], poly,
+                                    headers={"Authorization": "KakaoAK mock"},
+                                    rate=BENCH_RPS, max_in_flight=BENCH_IN_FLIGHT)
+    wall = time.monotonic() - t0
+
+    n_docs = sum(len(v) for v in docs_by_job.values())
+    n_dup = sum(len(v) - len({d["id"] for d in v}) for v in docs_by_job.values())
+    n_req = sum(v for k, v in server.counts.items() if k != "429")
+    n_429 = server.counts.get("429", 0)
+    expected = {gc: int((server.pois.groups == gc).sum()) for gc in BENCH_GROUPS}
+    missing = sum(expected[gc] - len({d["id"] for d in docs_by_job[f"category:{gc}"]}) for gc in BENCH_GROUPS)
+    out = {
+        "wall_sec": round(wall, 2),
+        "requests": n_req,
+        "429s": n_429,
+        "req_per_sec": round((n_req + n_429) / max(wall, 1e-9), 1),
+        "documents": n_docs,
+        "duplicates": n_dup,
+        "missing(category)": missing,
+    }
+    _report("crawl (kakao_async.run_crawl_jobs)", out)
+    return out
+
+
+# =========================
+# 지오코더
+# =========================
+def _bench_queries(n: int) -> list:
+    dongs = ["성정동", "쌍용동", "불당동", "두정동", "신부동", "원성동", "봉명동", "백석동"]
+    return [f"충청남도 천안시 {dongs[i % len(dongs)]} {100 + i}번지" for i in range(n)]
+
+
+def _make_fetch_json(session, headers: dict, timeout, rate_limit_sleep=None):
+    """동기 KakaoGeocoder용 전송 함수 (2_02 세션): 전역 간격 제한 → GET → 오류 시 예외 (결과 저장 안 함)"""
+    def fetch_json(url: str, params: dict) -> dict:
+        if rate_limit_sleep is not None:
+            rate_limit_sleep()
+        r = session.get(url, headers=headers, params=params, timeout=timeout)
+        r.raise_for_status()
+        return r.json()
+    return fetch_json
+
+
+def bench_geocode_threaded(server) -> dict:
+    from geocode_store import GeocodeStore
+    from kakao_geocoder import KakaoGeocoder
+
+    gp = _load_module(GEOCODE_PIPELINE, "geocode_pipeline_bench")
+    session = gp.make_session()
+    queries = _bench_queries(BENCH_N_ADDR)
+
+    rate_lock = Lock()
+    last_call_time = [0.0]
+
+    def rate_limit_sleep():
+        with rate_lock:
+            now = time.time()
+            elapsed = now - last_call_time[0]
+            if elapsed < BENCH_GEOCODE_DELAY:
+                time.sleep(BENCH_GEOCODE_DELAY - elapsed)
+            last_call_time[0] = time.time()
+
+    tmp_dir = tempfile.mkdtemp(prefix="bench_geocode_")
+    store = GeocodeStore(os.path.join(tmp_dir, "geocode_store.sqlite"))   # 공용 저장소 오염 방지
+    fetch_json = _make_fetch_json(session, gp.make_headers(), gp.REQUEST_TIMEOUT, rate_limit_sleep)
+    geocoder = KakaoGeocoder(fetch_json, store, city_prefix=gp.CITY_PREFIX)
+
+    def fetch(q):
+        return geocoder.geocode_with_centroid(q)
+
+    server.reset_counts()
+    t0 = time.monotonic()
+    with ThreadPoolExecutor(max_workers=BENCH_GEOCODE_WORKERS) as ex:
+        results = list(ex.map(fetch, queries))
+    wall = time.monotonic() - t0
+
+    n_ok = sum(1 for lat, lng in results if lat is not None and lng is not None)
+    n_req = sum(v for k, v in server.counts.items() if k != "429")
+    n_429 = server.counts.get("429", 0)
+    out = {
+        "wall_sec": round(wall, 2),
+        "queries": len(queries),
+        "requests": n_req,
+        "429s": n_429,
+        "req_per_sec": round((n_req + n_429) / max(wall, 1e-9), 1),
+        "success_rate": f"{n_ok / max(len(queries), 1) * 100:.1f}%",
+    }
+    store.close()
+    _report("geocode (KakaoGeocoder, threaded + global lock)", out)
+    return out
+
+
+def bench_geocode_async(server) -> dict:
+    from geocode_store import GeocodeStore
+    from kakao_geocoder_async import geocode_many
+
+    queries = _bench_queries(BENCH_N_ADDR)
+    tmp_dir = tempfile.mkdtemp(prefix="bench_geocode_async_")
+    store = GeocodeStore(os.path.join(tmp_dir, "geocode_store.sqlite"))
+
+    server.reset_counts()
+    t0 = time.monotonic()
+    results = geocode_many(queries, headers={"Authorization": "KakaoAK mock"}, store=store,
+                           rate=1.0 / BENCH_GEOCODE_DELAY, max_in_flight=BENCH_GEOCODE_WORKERS)
+    wall = time.monotonic() - t0
+
+    n_ok = sum(1 for lat, lng in results.values() if lat is not None and lng is not None)
+    n_req = sum(v for k, v in server.counts.items() if k != "429")
+    n_429 = server.counts.get("429", 0)
+    out = {
+        "wall_sec": round(wall, 2),
+        "queries": len(queries),
+        "requests": n_req,
+        "429s": n_429,
+        "req_per_sec": round((n_req + n_429) / max(wall, 1e-9), 1),
+        "success_rate": f"{n_ok / max(len(queries), 1) * 100:.1f}%",
+    }
+    store.close()
+    _report("geocode (kakao_geocoder_async, token bucket)", out)
+    return out
+
+
+if __name__ == "__main__":
+    server = serve_in_thread(**MOCK_OPTIONS)
+    os.environ["KAKAO_API_BASE"] = server.base_url
+    print(f"[INFO] Mock server {server.base_url}: {len(server.pois)} POIs, options={MOCK_OPTIONS}")
+    try:
+        bench_crawl(server)
+        bench_geocode_threaded(server)
+        bench_geocode_async(server)
+    finally:
+        server.shutdown()
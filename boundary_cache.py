@@ -0,0 +1,114 @@
+# -*- coding: utf-8 -*-
+"""
+천안 경계 피처만 읽기 (N3A_G0100000 전국 행정경계 SHP → 천안 3개 피처)
+- 읽기 단계에서 천안 bbox(공간 필터) + BJCD 앞 5자리(44130/44131/44133, 속성 필터)로 거름 (pyogrio)
+  → 전국 피처를 파싱·재투영하지 않음
+- 결과(WGS84)는 GeoParquet으로 1회 저장, 원본 .shp/.dbf 크기·수정 시각이 같으면 SHP를 열지 않음
+  (pyarrow 없으면 GeoPackage)
+- BJCD가 없거나 필터 결과가 비면 None → 호출 측은 기존 전체 읽기 + 이름 매칭으로 폴백
+"""
+
+import json
+import os
+
+import geopandas as gpd
+from shapely.geometry import box
+
+try:
+    import pyarrow  # noqa: F401  GeoParquet 저장용
+except ImportError:
+    pyarrow = None
+
+CHEONAN_SIG5 = ("44130", "44131", "44133")
+CHEONAN_BBOX = (126.99, 36.67, 127.38, 36.99)   # lon/lat, 약간 여유 있는 근사 bbox
+_BBOX_MARGIN_DEG = 0.05
+
+
+def _sources(shp_path: str) -> list:
+    out = []
+    for ext in (".shp", ".dbf"):
+        p = os.path.splitext(shp_path)[0] + ext
+        if os.path.exists(p):
+            st = os.stat(p)
+            out.append({"path": os.path.abspath(p), "size": st.st_size, "mtime_ns": st.st_mtime_ns})
+    return out
+
+
+def _cache_file(cache_path: str) -> str:
+    """pyarrow 있으면 .parquet, 없으면 같은 이름의 .gpkg"""
+    return cache_path if pyarrow is not None else os.path.splitext(cache_path)[0] + ".gpkg"
+
+
+def _read_cache(cache_path: str, meta: dict):
+    path = _cache_file(cache_path)
+    if not os.path.exists(path + ".json") or not os.path.exists(path):
+        return None
+    with open(path + ".json", "r", encoding="utf-8") as f:
+        if json.load(f) != meta:
+            return None
+    return gpd.read_parquet(path) if path.endswith(".parquet") else gpd.read_file(path, engine="pyogrio")
+
+
+def _write_cache(cache_path: str, meta: dict, gdf):
+    path = _cache_file(cache_path)
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    if os.path.exists(path):
+        os.remove(path)
+    if path.endswith(".parquet"):
+        gdf.to_parquet(path)
+    else:
+        gdf.to_file(path, driver="GPKG", engine="pyogrio")
+    with open(path + ".json", "w", encoding="utf-8") as f:
+        json.dump(meta, f, ensure_ascii=False, indent=1)
+
+
+def _where_bjcd(dtype: str, sig5) -> str:
+    """BJCD(10자리 법정동 코드) 앞 5자리 필터 (문자열/숫자 필드 모두)"""
+    if dtype == "object":
+        return " OR ".join(f"BJCD LIKE '{s}%'" for s in sig5)
+    return " OR ".join(f"(BJCD >= {s}00000 AND BJCD < {int(s) + 1}00000)" for s in sig5)
+
+
+def read_cheonan_features(shp_path: str, cache_path: str = None, *, sig5=CHEONAN_SIG5, bbox=CHEONAN_BBOX):
+    """
+    천안 피처 GeoDataFrame(EPSG:4326) | None
+    - cache_path: GeoParquet 경로 (None이면 캐시 없이 필터 읽기만)
+    """
+    import pyogrio
+
+    meta = {"sources": _sources(shp_path), "sig5": list(sig5), "bbox": list(bbox)}
+    if cache_path:
+        try:
+            cached = _read_cache(cache_path, meta)
+            if cached is not None:
+                return cached
+        except Exception as e:
+            print(f"[WARN] Boundary cache read failed: {e}")
+
+    info = pyogrio.read_info(shp_path)
+    fields = list(info["fields"])
+    if "BJCD" not in fields:
+        return None
+    bjcd_dtype = str(info["dtypes"][fields.index("BJCD")])
+
+    # bbox는 레이어 좌표계로 변환 후 전달 (좌표계를 모르면 속성 필터만)
+    layer_bbox = None
+    if info["crs"]:
+        minx, miny, maxx, maxy = bbox
+        m = _BBOX_MARGIN_DEG
+        area = gpd.GeoSeries([box(minx - m, miny - m, maxx + m, maxy + m)], crs="EPSG:4326")
+        layer_bbox = tuple(area.to_crs(info["crs"]).total_bounds)
+
+    gdf = gpd.read_file(shp_path, engine="pyogrio", bbox=layer_bbox, where=_where_bjcd(bjcd_dtype, sig5))
+    if len(gdf) == 0:
+        return None
+    if gdf.crs is not None and gdf.crs.to_epsg() != 4326:
+        gdf = gdf.to_crs(epsg=4326)
+    print(f"[INFO] Boundary: {len(gdf)}/{info['features']} features read from {shp_path}")
+
+    if cache_path:
+        try:
+            _write_cache(cache_path, meta, gdf)
+        except Exception as e:
+            print(f"[WARN] Boundary cache write failed: {e}")
+    return gdf
@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+"""
+증분(delta) 수집용 타일 스냅샷
+- 리프 타일(kind, code, rect)별 마지막 meta.total_count + 문서 목록 저장
+- 다음 수집 때 1페이지(probe)만 받아 total_count가 같으면 저장 문서 재사용,
+  다르면 그 타일만 전체 페이지 재수집 → 정기 갱신 비용을 전체 수집의 일부로
+- 스냅샷 문서는 병합 단계(필터 규칙·폴리곤 판정·POIAccumulator)가 읽는 필드(SNAPSHOT_FIELDS)만 보관
+- 스냅샷 간 place id 추가/삭제 diff
+"""
+
+import glob
+import json
+import os
+
+import pandas as pd
+
+from crawl_quadtree import rect_key, tree_key
+
+# 타일 스냅샷에 남기는 문서 필드 (project2 병합: id/이름/분류/좌표/주소/URL)
+SNAPSHOT_FIELDS = ("id", "place_name", "category_name", "x", "y",
+                   "road_address_name", "address_name", "place_url")
+
+
+def _slim(doc: dict) -> dict:
+    return {k: doc[k] for k in SNAPSHOT_FIELDS if k in doc}
+
+
+class TileSnapshot:
+    """
+    구조(JSON):
+      {"category:MT1": {"<rect_key>": {"count": 123, "docs": [doc(SNAPSHOT_FIELDS), ...]}}, ...}
+    - 이번 수집에서 확인된 타일만 save() 대상 (사라진 리프 타일은 자연히 정리)
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.prev = {}
+        self.fresh = {}
+        self.n_reused = 0      # count 동일 → 저장 문서 재사용한 타일 수
+        self.n_changed = 0     # count 변경/신규 → 재수집한 타일 수
+        if path and os.path.exists(path):
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    self.prev = json.load(f)
+            except Exception:
+                self.prev = {}
+
+    def reuse(self, kind: str, code: str, rect, total_count: int):
+        """직전 스냅샷과 total_count가 같으면 저장 문서(복사본), 아니면 None"""
+        key = rect_key(rect)
+        row = self.prev.get(tree_key(kind, code), {}).get(key)
+        if row is None or int(row["count"]) != int(total_count):
+            self.n_changed += 1
+            return None
+        self.n_reused += 1
+        docs = [_slim(d) for d in row["docs"]]
+        self.fresh.setdefault(tree_key(kind, code), {})[key] = {"count": int(row["count"]), "docs": docs}
+        return [dict(d) for d in docs]
+
+    def put(self, kind: str, code: str, rect, total_count: int, docs: list):
+        self.fresh.setdefault(tree_key(kind, code), {})[rect_key(rect)] = {
+            "count": int(total_count),
+            "docs": [_slim(d) for d in docs],
+        }
+
+    def save(self):
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        tmp = self.path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(self.fresh, f, ensure_ascii=False, separators=(",", ":"))
+        os.replace(tmp, self.path)
+
+    def summary(self) -> str:
+        total = self.n_reused + self.n_changed
+        return f"reused {self.n_reused}/{total} tiles, re-fetched {self.n_changed}"
+
+
+# =========================
+# 스냅샷 diff
+# =========================
+def latest_snapshot(save_dir: str, pattern: str = "cheonan_POI_category_*.csv", exclude: str = None):
+    """save_dir 내 가장 최근 스냅샷 CSV 경로 (파일명 타임스탬프 기준, 없으면 None)"""
+    paths = sorted(p for p in glob.glob(os.path.join(save_dir, pattern))
+                   if exclude is None or os.path.abspath(p) != os.path.abspath(exclude))
+    return paths[-1] if paths else None
+
+
+def diff_poi_snapshots(df_prev: pd.DataFrame, df_new: pd.DataFrame) -> pd.DataFrame:
+    """
+    place id 기준 추가/삭제 목록
+    반환 컬럼: change('added' | 'removed'), id, name, group_code
+    """
+    cols = ["id", "name", "group_code"]
+    prev_ids = set(df_prev["id"].astype(str))
+    new_ids = set(df_new["id"].astype(str))
+    added = df_new[df_new["id"].astype(str).isin(new_ids - prev_ids)][cols].assign(change="added")
+    removed = df_prev[df_prev["id"].astype(str).isin(prev_ids - new_ids)][cols].assign(change="removed")
+    out = pd.concat([added, removed], ignore_index=True)
+    return out[["change"] + cols]
@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+"""
+재시작 가능한 수집 저널 (append-only JSONL)
+- 완료된 작업 단위 1건 = 한 줄: (kind, code, rect, page) + 응답(meta, documents)
+- 재시작 시 저널을 재생(replay)해 완료 단위는 네트워크 없이 복원,
+  첫 미완료 단위부터 이어서 수집 → 일시 장애/쿼터 소진에도 전체 재수집 불필요
+- 메모리에는 재생 대상(이전 실행이 남긴 단위)만 보관, 이번 실행의 새 단위는 파일에만 기록
+- 정상 종료(결과 CSV 저장) 후 clear()로 비움
+"""
+
+import json
+import os
+import threading
+
+
+def unit_key(kind: str, code: str, rect: str, page: int) -> tuple:
+    return (str(kind), str(code), str(rect), int(page))
+
+
+class CrawlJournal:
+
+    def __init__(self, path: str):
+        self.path = path
+        self.units = {}          # 재생 대상 (시작 시 읽은 완료 단위)
+        self.n_replayed = 0
+        self.n_recorded = 0
+        self._lock = threading.Lock()
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._load()
+        self._fh = open(path, "a", encoding="utf-8")
+
+    def _load(self):
+        if not os.path.exists(self.path):
+            return
+        with open(self.path, "r", encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    rec = json.loads(line)
+                except json.JSONDecodeError:
+                    # 비정상 종료로 잘린 마지막 줄은 무시 (해당 단위는 다시 수집)
+                    continue
+                key = unit_key(rec["kind"], rec["code"], rec["rect"], rec["page"])
+                self.units[key] = rec["payload"]
+        if self.units:
+            print(f"[INFO] Crawl journal: {len(self.units)} completed units found → resume ({self.path})")
+
+    def get(self, kind: str, code: str, rect: str, page: int):
+        payload = self.units.get(unit_key(kind, code, rect, page))
+        if payload is not None:
+            self.n_replayed += 1
+        return payload
+
+    def record(self, kind: str, code: str, rect: str, page: int, payload: dict):
+        line = json.dumps({"kind": kind, "code": code, "rect": rect, "page": int(page), "payload": payload},
+                          ensure_ascii=False, separators=(",", ":"))
+        with self._lock:
+            self._fh.write(line + "\n")
+            self._fh.flush()
+            self.n_recorded += 1
+
+    def close(self):
+        with self._lock:
+            if not self._fh.closed:
+                self._fh.close()
+
+    def clear(self):
+        """수집 완료 후 저널 삭제 (다음 실행은 새로 시작)"""
+        self.close()
+        self.units = {}
+        if os.path.exists(self.path):
+            os.remove(self.path)
@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+"""
+카카오 검색 밀도 쿼드트리 (디스크 저장)
+- 키: (kind, code) → kind='category'(그룹코드) | 'keyword'(검색어)
+- 값: 그리드 셀별 '675건(MAX_FETCHABLE) 이하로 떨어지는 리프 사각형' + 마지막 total_count
+- 다음 수집 때 셀을 다시 4분할 탐색(probe)하지 않고 리프 타일로 바로 이동
+"""
+
+import json
+import os
+
+
+def rect_key(rect) -> str:
+    minX, minY, maxX, maxY = rect
+    return f"{minX:.7f},{minY:.7f},{maxX:.7f},{maxY:.7f}"
+
+
+def tree_key(kind: str, code: str) -> str:
+    return f"{kind}:{code}"
+
+
+class DensityQuadtree:
+    """
+    구조(JSON):
+      {"category:MT1": {"<cell rect_key>": [[minX, minY, maxX, maxY, total_count], ...]}, ...}
+    """
+
+    def __init__(self, path: str = None):
+        self.path = path
+        self.trees = {}
+        self.n_hits = 0     # 저장된 리프로 바로 간 셀 수
+        self.n_misses = 0   # 처음 탐색한 셀 수
+        if path and os.path.exists(path):
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    self.trees = json.load(f)
+            except Exception:
+                self.trees = {}
+
+    def leaves(self, kind: str, code: str, cell) -> list:
+        """셀에 대해 저장된 리프 [(rect, count), ...] (없으면 [])"""
+        rows = self.trees.get(tree_key(kind, code), {}).get(rect_key(cell), [])
+        out = [((r[0], r[1], r[2], r[3]), int(r[4])) for r in rows]
+        if out:
+            self.n_hits += 1
+        else:
+            self.n_misses += 1
+        return out
+
+    def update(self, kind: str, code: str, cell, leaves):
+        """leaves: [(rect, total_count), ...] — 셀의 리프 목록을 통째로 교체"""
+        rows = [[float(r[0]), float(r[1]), float(r[2]), float(r[3]), int(c)] for r, c in leaves]
+        rows.sort(key=lambda r: (r[0], r[1], r[2], r[3]))
+        self.trees.setdefault(tree_key(kind, code), {})[rect_key(cell)] = rows
+
+    def save(self):
+        if not self.path:
+            return
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        tmp = self.path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(self.trees, f, ensure_ascii=False)
+        os.replace(tmp, self.path)
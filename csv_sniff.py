@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+"""
+공공데이터 CSV 인코딩/구분자 판별 (파일당 1회, 전체 파싱 없이)
+- 앞부분 바이트 표본만 읽어 BOM(UTF-8/UTF-16, 겹친 UTF-8 BOM 포함) 확인
+  BOM 없으면 표본을 UTF-8로 디코딩해 보고 실패하면 cp949(euc-kr 상위 호환)
+- 구분자: 첫 줄의 탭/쉼표 개수 비교 (탭 구분 cp949 파일 대응)
+- 판별 결과는 (경로, 크기, 수정 시각) 기준으로 기억 → 같은 파일은 다시 판별하지 않음
+- read_csv_auto(): 판별 결과로 한 번만 파싱, 열 이름에 남은 BOM 제거
+"""
+
+import codecs
+import os
+
+import pandas as pd
+
+_SNIFF_BYTES = 64 * 1024
+_UTF16_BOMS = (codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE)
+
+_sniffed = {}
+
+
+def _fingerprint(path: str):
+    st = os.stat(path)
+    return os.path.abspath(path), st.st_size, st.st_mtime_ns
+
+
+def _sniff_bytes(head: bytes, full: bool) -> dict:
+    n_bom = 0
+    while head.startswith(codecs.BOM_UTF8, n_bom * 3):
+        n_bom += 1
+    if n_bom:
+        encoding, body = "utf-8-sig", head[n_bom * 3:]
+    elif head.startswith(_UTF16_BOMS):
+        encoding, body = "utf-16", head
+    else:
+        try:
+            head.decode("utf-8")
+            encoding = "utf-8"
+        except UnicodeDecodeError as e:
+            # 표본 끝에서 멀티바이트 문자가 잘린 경우는 UTF-8로 인정
+            encoding = "utf-8" if (not full and e.start >= len(head) - 3) else "cp949"
+        body = head
+    text = body.decode(encoding, errors="ignore")
+    first = next((line for line in text.splitlines() if line.strip()), "")
+    sep = "\t" if first.count("\t") > first.count(",") else ","
+    return {"encoding": encoding, "sep": sep, "bom": n_bom}
+
+
+def sniff_csv(path: str) -> dict:
+    """{'encoding': 'utf-8-sig' | 'utf-8' | 'utf-16' | 'cp949', 'sep': ',' | '\\t', 'bom': 앞쪽 UTF-8 BOM 개수}"""
+    key = _fingerprint(path)
+    info = _sniffed.get(key)
+    if info is None:
+        with open(path, "rb") as f:
+            head = f.read(_SNIFF_BYTES)
+        info = _sniff_bytes(head, full=len(head) < _SNIFF_BYTES)
+        _sniffed[key] = info
+    return dict(info)
+
+
+def clean_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """겹친 BOM이 첫 열 이름에 남은 경우 제거 ('\\ufeff\\ufeff일자' → '일자')"""
+    cols = [c.lstrip("\ufeff") if isinstance(c, str) else c for c in df.columns]
+    if cols != list(df.columns):
+        df.columns = cols
+    return df
+
+
+def read_csv_auto(path: str, **kwargs) -> pd.DataFrame:
+    """
+    sniff_csv() 결과(인코딩/구분자)로 pd.read_csv 1회 (kwargs의 encoding/sep이 있으면 우선)
+    - 표본 이후에서 UTF-8 디코딩이 깨지면 cp949로 한 번 더 읽고 판별 결과 갱신
+    """
+    info = sniff_csv(path)
+    kwargs.setdefault("low_memory", False)
+    kwargs.setdefault("sep", info["sep"])
+    if "encoding" in kwargs:
+        return clean_columns(pd.read_csv(path, **kwargs))
+    try:
+        return clean_columns(pd.read_csv(path, encoding=info["encoding"], **kwargs))
+    except UnicodeDecodeError:
+        if info["encoding"] != "utf-8":
+            raise
+        _sniffed[_fingerprint(path)] = dict(info, encoding="cp949")
+        print(f"[WARN] {path}: 표본 이후 UTF-8 디코딩 실패 → cp949로 다시 읽음")
+        return clean_columns(pd.read_csv(path, encoding="cp949", **kwargs))
@@ -0,0 +1,122 @@
+# -*- coding: utf-8 -*-
+"""
+로컬 행정동 위치 조회 (동 센트로이드 대체용, API 호출 없음)
+- BND_ADM_DONG_PG(행정동 경계)에서 천안시(동남구 34011 / 서북구 34012) 행정동만 골라
+  representative_point(폴리곤 내부 보장점)를 미리 계산 → data/dong_points.json
+- 이름 정규화: 센서스 공간정보 지역 코드 CSV의 행정동명 + 번호 없는 이름('성정1동'/'성정2동' → '성정동')
+  여러 행정동에 걸친 이름은 합친 폴리곤의 내부점 사용
+- SHP(.shp)가 없으면 빈 조회기 → 호출 측은 기존 카카오 센트로이드 폴백 사용
+"""
+
+import json
+import os
+import re
+
+import pandas as pd
+from shapely.ops import unary_union
+
+_REPO_ROOT = os.path.dirname(os.path.abspath(__file__))
+_DATA_DIR = os.path.join(_REPO_ROOT, "intro-dashboard", "dashboard", "cheonan_data")
+
+DONG_SHP_PATH = os.path.join(_DATA_DIR, "BND_ADM_DONG_PG", "BND_ADM_DONG_PG.shp")
+REGION_CODE_CSV = os.path.join(_DATA_DIR, "센서스 공간정보 지역 코드.csv")
+DONG_POINTS_JSON = os.path.join(_REPO_ROOT, "data", "dong_points.json")
+
+CHEONAN_SIGUNGU = ("34011", "34012")   # 센서스 코드: 천안시 동남구 / 서북구
+_GU_NAMES = ("천안시", "동남구", "서북구")
+
+
+def normalize_dong(name) -> str:
+    """'천안시 서북구 성정1동' → '성정1동' (시/구 접두어, 공백 제거)"""
+    toks = [t for t in str(name or "").split() if t not in _GU_NAMES]
+    return "".join(toks)
+
+
+def _base_name(name: str) -> str:
+    """번호 붙은 행정동 → 기본 이름 ('성정1동' → '성정동'), 그 외는 그대로"""
+    return re.sub(r"\d+(동)$", r"\1", name)
+
+
+def load_region_aliases(csv_path: str = REGION_CODE_CSV, sigungu=CHEONAN_SIGUNGU) -> dict:
+    """{별칭: [행정동 코드(8자리), ...]} — 행정동명 그대로 + 번호 없는 기본 이름"""
+    df = pd.read_csv(csv_path, encoding="utf-8-sig", header=1, dtype=str)
+    code = df["시도코드"].str.strip() + df["시군구코드"].str.strip() + df["읍면동코드"].str.strip()
+    df = df.assign(adm_cd=code)[code.str.slice(0, 5).isin(sigungu)]
+    aliases = {}
+    for adm_cd, name in zip(df["adm_cd"], df["읍면동명칭"].map(normalize_dong)):
+        for alias in {name, _base_name(name)}:
+            aliases.setdefault(alias, [])
+            if adm_cd not in aliases[alias]:
+                aliases[alias].append(adm_cd)
+    return aliases
+
+
+def build_dong_points(shp_path: str = DONG_SHP_PATH, csv_path: str = REGION_CODE_CSV,
+                      out_path: str = DONG_POINTS_JSON) -> dict:
+    """별칭별 내부점 계산 후 JSON 저장. 반환: {별칭: [lat, lng]}"""
+    import geopandas as gpd  # SHP 재계산 때만 필요
+
+    aliases = load_region_aliases(csv_path)
+    gdf = gpd.read_file(shp_path, encoding="cp949")
+    gdf["ADM_CD"] = gdf["ADM_CD"].astype(str).str.strip()
+    gdf = gdf[gdf["ADM_CD"].str.slice(0, 5).isin(CHEONAN_SIGUNGU)]
+    if gdf.crs is None:
+        raise ValueError(f"좌표계(.prj)를 알 수 없습니다: {shp_path}")
+    geom_by_code = dict(zip(gdf["ADM_CD"], gdf.geometry))   # 투영 좌표(m)에서 내부점 계산
+
+    names, pts = [], []
+    for alias, codes in aliases.items():
+        geoms = [geom_by_code[c] for c in codes if c in geom_by_code]
+        if not geoms:
+            continue
+        merged = unary_union(geoms) if len(geoms) > 1 else geoms[0]
+        names.append(alias)
+        pts.append(merged.representative_point())
+    ll = gpd.GeoSeries(pts, crs=gdf.crs).to_crs(epsg=4326)
+    points = {n: [round(p.y, 7), round(p.x, 7)] for n, p in zip(names, ll)}
+
+    os.makedirs(os.path.dirname(out_path) or ".", exist_ok=True)
+    with open(out_path, "w", encoding="utf-8") as f:
+        json.dump({"source_mtime": os.path.getmtime(shp_path), "points": points}, f, ensure_ascii=False, indent=1)
+    print(f"[INFO] Dong points: {len(points)} names from {shp_path} → {out_path}")
+    return points
+
+
+class DongLocator:
+    """{이름: (lat, lng)} 조회 (시/구 접두어·번호 없는 이름 허용)"""
+
+    def __init__(self, points: dict = None):
+        self.points = {k: (float(v[0]), float(v[1])) for k, v in (points or {}).items()}
+        self.hits = 0
+
+    def __len__(self):
+        return len(self.points)
+
+    def locate(self, dong: str):
+        name = normalize_dong(dong)
+        p = self.points.get(name) or self.points.get(_base_name(name))
+        if p is None:
+            return None, None
+        self.hits += 1
+        return p
+
+
+def load_dong_locator(shp_path: str = DONG_SHP_PATH, csv_path: str = REGION_CODE_CSV,
+                      cache_path: str = DONG_POINTS_JSON) -> DongLocator:
+    """
+    미리 계산된 JSON 우선 (SHP가 바뀌었으면 재계산). SHP도 JSON도 없으면 빈 조회기.
+    """
+    shp_mtime = os.path.getmtime(shp_path) if os.path.exists(shp_path) else None
+    if os.path.exists(cache_path):
+        with open(cache_path, "r", encoding="utf-8") as f:
+            cached = json.load(f)
+        if shp_mtime is None or cached.get("source_mtime") == shp_mtime:
+            return DongLocator(cached.get("points"))
+    if shp_mtime is None:
+        print(f"[INFO] Dong locator: {shp_path} 없음 → 카카오 센트로이드 폴백 사용")
+        return DongLocator()
+    try:
+        return DongLocator(build_dong_points(shp_path, csv_path, cache_path))
+    except Exception as e:
+        print(f"[WARN] Dong locator build failed: {e}")
+        return DongLocator()
@@ -0,0 +1,462 @@
+# -*- coding: utf-8 -*-
+"""
+공용 지오코딩 결과 저장소 (SQLite 스냅샷 + append-only 저널)
+- 키: (kind, query) → kind='query'(주소/장소 쿼리) | 'dong'(행정동 센트로이드)
+- 값: lat, lng, source(address/keyword/centroid/legacy), status, updated_at
+  (offline_geocoder 퍼지 매칭 결과는 저장하지 않음 → 이전 실행이 남긴 fuzzy 행은 열 때 삭제)
+- 실패는 원인별 status + TTL (FAILURE_TTL)
+  not_found(문서 없음) 30일 / error(HTTP·네트워크) 10분 / out_of_bounds(국내 범위 밖)·invalid(번지만 있는 쿼리) 영구
+  → TTL 지난 실패는 조회 시 미스로 취급되어 다음 실행에서 재조회, 영구 실패는 키 집합으로 호출 전 차단
+- 주차장 지도(민영주차장 일괄 지오코딩)와 불법주정차 지오코딩(2_02)이 같은 파일을 공유
+  → 한쪽에서 해결한 쿼리는 다른 쪽에서 다시 API 호출하지 않음
+- 시작 시 SQLite 스냅샷을 메모리로 한 번 로드 → 조회는 dict
+- put()은 메모리 갱신 + 프로세스별 저널 파일에 한 줄 append (O(1), 스레드 안전)
+- compact(): 저널 내용을 SQLite에 한 트랜잭션으로 반영 후 저널 비움
+  (COMPACT_EVERY 건마다 백그라운드 스레드, close() 시 명시적으로)
+- 비정상 종료로 남은 다른 프로세스의 저널은 다음 시작 시 복구·반영
+- 기존 JSON 캐시(kakao_geocode_cache.json [lat,lng], geocode_cache.json [lon,lat],
+  kakao_geocode_dong_centroid.json)는 import_json()으로 1회 이관
+  예전 캐시는 센트로이드 대체 좌표도 쿼리 결과로 저장했으므로, 행정동 센트로이드와 좌표가 같은 legacy 행은
+  source=centroid로 다시 분류 (retag_legacy_centroids, 정밀 조회 PRECISE_SOURCES에서 제외)
+- kind='query' 조회는 원문 키가 없으면 정규 키(address_key.canonical_key)로 한 번 더 조회
+  → 공백/접두어/'번지' 표기만 다른 쿼리는 API 재호출 없이 같은 결과 사용
+"""
+
+import atexit
+import glob
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+
+from address_key import canonical_key, is_number_only
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+_REPO_ROOT = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_STORE_PATH = os.path.join(_REPO_ROOT, "data", "geocode_store.sqlite")
+
+KIND_QUERY = "query"
+KIND_DONG = "dong"
+
+STATUS_OK = "ok"
+STATUS_NOT_FOUND = "not_found"          # 문서 없음
+STATUS_ERROR = "error"                  # HTTP/네트워크 오류
+STATUS_OUT_OF_BOUNDS = "out_of_bounds"  # 좌표가 국내 범위 밖
+STATUS_INVALID = "invalid"              # 호출 전 판정: 동/도로명/건물 없이 번지만 있는 쿼리
+
+# 실패 원인별 재조회 간격(초). None = 영구 실패
+FAILURE_TTL = {
+    STATUS_NOT_FOUND: 30 * 86400,
+    STATUS_ERROR: 600,
+    STATUS_OUT_OF_BOUNDS: None,
+    STATUS_INVALID: None,
+}
+PERMANENT_STATUSES = tuple(k for k, v in FAILURE_TTL.items() if v is None)
+
+SOURCE_ADDRESS = "address"
+SOURCE_KEYWORD = "keyword"
+SOURCE_CENTROID = "centroid"
+SOURCE_LEGACY = "legacy"
+SOURCE_FUZZY = "fuzzy"          # offline_geocoder 퍼지 매칭 (정밀 결과 아님, 저장소에 기록하지 않음)
+
+COMPACT_EVERY = 2000   # 저널 누적 건수 기준 백그라운드 compaction
+
+# 기존 JSON 캐시 (경로, 좌표 순서, kind) → open_shared_store()에서 변경 시에만 이관
+LEGACY_CACHES = [
+    (os.path.join(_REPO_ROOT, "data", "kakao_geocode_cache.json"), "latlng", KIND_QUERY),
+    (os.path.join(_REPO_ROOT, "data", "kakao_geocode_dong_centroid.json"), "latlng", KIND_DONG),
+    (os.path.join(_REPO_ROOT, "project2_cheonan_data", "geocode_cache.json"), "lonlat", KIND_QUERY),
+    (os.path.join(_REPO_ROOT, "intro-dashboard", "dashboard", "cheonan_data", "geocode_cache.json"), "lonlat", KIND_QUERY),
+]
+
+
+def normalize_query(q) -> str:
+    """공백 정리만 (표기 정규화는 하지 않음)"""
+    return re.sub(r"\s+", " ", str(q or "")).strip()
+
+
+def _try_lock(fh) -> bool:
+    """저널 파일 배타 잠금 (비차단). 잠금 성공 = 소유 프로세스 없음"""
+    try:
+        if fcntl is not None:
+            fcntl.flock(fh.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        else:
+            fh.seek(0)
+            msvcrt.locking(fh.fileno(), msvcrt.LK_NBLCK, 1)
+        return True
+    except OSError:
+        return False
+
+
+def _unlock(fh):
+    try:
+        if fcntl is not None:
+            fcntl.flock(fh.fileno(), fcntl.LOCK_UN)
+        else:
+            fh.seek(0)
+            msvcrt.locking(fh.fileno(), msvcrt.LK_UNLCK, 1)
+    except OSError:
+        pass
+
+
+def _read_journal(path: str) -> list:
+    """저널 줄 → 행 튜플 목록 (잘린 마지막 줄은 무시)"""
+    rows = []
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                rows.append(tuple(json.loads(line)))
+            except (json.JSONDecodeError, TypeError):
+                continue
+    return rows
+
+
+class GeocodeStore:
+    """
+    스레드 안전(메모리 dict + 저널 쓰기 Lock). 지오코딩 스레드풀/비동기 루프에서 그대로 호출.
+    행 튜플: (kind, query, lat, lng, source, status, updated_at)
+    """
+
+    def __init__(self, path: str = DEFAULT_STORE_PATH, *, compact_every: int = COMPACT_EVERY):
+        self.path = path
+        self.compact_every = int(compact_every)
+        self.hits = 0
+        self.misses = 0
+        self.canon_hits = 0
+        self.n_appended = 0
+        self.n_compactions = 0
+        self._lock = threading.Lock()          # 메모리 + 저널
+        self._db_lock = threading.Lock()       # SQLite 커넥션
+        self._compacting = None
+        self._closed = False
+        self._rows = {}
+        self._canon = {}                       # (kind, 정규 키) → 행 (kind='query'만)
+        self._dead_keys = set()                # 영구 실패 키 (kind + 정규 키)
+        self.dead_skips = 0
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS geocodes (
+                kind       TEXT NOT NULL,
+                query      TEXT NOT NULL,
+                lat        REAL,
+                lng        REAL,
+                source     TEXT,
+                status     TEXT NOT NULL,
+                updated_at REAL NOT NULL,
+                PRIMARY KEY (kind, query)
+            )""")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS imports (
+                path  TEXT PRIMARY KEY,
+                mtime REAL NOT NULL,
+                size  INTEGER NOT NULL,
+                rows  INTEGER NOT NULL
+            )""")
+        # 퍼지 매칭 행은 만료 없이 정밀 결과처럼 재사용되므로 보관하지 않음 (이전 버전이 남긴 행 정리)
+        self._conn.execute("DELETE FROM geocodes WHERE source=?", (SOURCE_FUZZY,))
+        self._conn.commit()
+
+        # 1) 스냅샷 로드
+        for row in self._conn.execute("SELECT kind, query, lat, lng, source, status, updated_at FROM geocodes"):
+            self._set(row)
+
+        # 2) 남은 저널: 소유자 없는 것은 복구·반영 후 삭제, 실행 중인 것은 메모리에만 반영
+        for jpath in sorted(glob.glob(f"{path}.journal-*")):
+            with open(jpath, "a+", encoding="utf-8") as fh:
+                orphan = _try_lock(fh)
+                rows = _read_journal(jpath)
+                for row in rows:
+                    self._set(row)
+                if orphan:
+                    self._write_rows(rows)
+                    _unlock(fh)
+            if orphan:
+                os.remove(jpath)
+                if rows:
+                    print(f"[INFO] Geocode store: recovered {len(rows)} rows from {jpath}")
+
+        # 3) 이 프로세스 저널
+        self._journal_path = f"{path}.journal-{os.getpid()}"
+        self._journal = open(self._journal_path, "a+", encoding="utf-8")
+        _try_lock(self._journal)
+        self._pending = []
+
+    # -------------------------
+    # 조회
+    # -------------------------
+    def _dead_key(self, kind: str, nq: str) -> str:
+        return f"{kind}\t{(canonical_key(nq) if kind == KIND_QUERY else '') or nq}"
+
+    def _set(self, row):
+        """메모리 반영 (정규 키 인덱스는 ok 결과 우선, 같은 상태면 최신, 퍼지 매칭 행은 무시)"""
+        if row[4] == SOURCE_FUZZY:
+            return
+        self._rows[(row[0], row[1])] = row
+        if row[5] in PERMANENT_STATUSES:
+            self._dead_keys.add(self._dead_key(row[0], row[1]))
+        if row[0] != KIND_QUERY:
+            return
+        ckey = (row[0], canonical_key(row[1]))
+        if not ckey[1]:
+            return
+        prev = self._canon.get(ckey)
+        if prev is None or row[5] == STATUS_OK or prev[5] != STATUS_OK:
+            self._canon[ckey] = row
+
+    @staticmethod
+    def _expired(row, now: float) -> bool:
+        """TTL 지난 실패 행 (ok/영구 실패는 만료 없음, 알 수 없는 status는 not_found 취급)"""
+        if row[5] == STATUS_OK:
+            return False
+        ttl = FAILURE_TTL.get(row[5], FAILURE_TTL[STATUS_NOT_FOUND])
+        return ttl is not None and now - row[6] > ttl
+
+    def _find(self, query, kind: str):
+        nq = normalize_query(query)
+        row = self._rows.get((kind, nq))
+        if row is None and kind == KIND_QUERY:
+            row = self._canon.get((kind, canonical_key(nq)))
+            if row is not None:
+                self.canon_hits += 1
+        if row is not None and self._expired(row, time.time()):
+            return None
+        return row
+
+    def is_dead(self, query: str, *, kind: str = KIND_QUERY) -> bool:
+        """영구 실패 쿼리 여부 (키 집합 → 이후 성공으로 바뀐 키는 저장소 행으로 확인). 네트워크 호출 전에 사용"""
+        nq = normalize_query(query)
+        if self._dead_key(kind, nq) not in self._dead_keys:
+            return False
+        row = self._find(nq, kind)
+        dead = row is not None and row[5] in PERMANENT_STATUSES
+        self.dead_skips += dead
+        return dead
+
+    def iter_ok(self, *, kind: str = KIND_QUERY):
+        """성공 행 순회: (query, lat, lng, source)"""
+        for row in list(self._rows.values()):
+            if row[0] == kind and row[5] == STATUS_OK:
+                yield row[1], row[2], row[3], row[4]
+
+    def retryable(self, *, kind: str = KIND_QUERY) -> list:
+        """TTL이 지나 재조회 대상인 실패 쿼리 목록 (영구 실패 제외)"""
+        now = time.time()
+        return [row[1] for row in list(self._rows.values())
+                if row[0] == kind and row[5] != STATUS_OK and self._expired(row, now)]
+
+    def _record(self, row) -> dict:
+        return {"lat": row[2], "lng": row[3], "source": row[4], "status": row[5], "updated_at": row[6]}
+
+    def get(self, query: str, *, kind: str = KIND_QUERY, sources=None):
+        """
+        저장된 결과 dict(lat, lng, source, status, updated_at) 또는 None
+        - sources: 허용 source 목록 (예: 센트로이드 대체값 제외). None이면 전부 허용
+        """
+        row = self._find(query, kind)
+        if row is None or (sources is not None and row[5] == STATUS_OK and row[4] not in sources):
+            self.misses += 1
+            return None
+        self.hits += 1
+        return self._record(row)
+
+    def get_many(self, queries, *, kind: str = KIND_QUERY, sources=None) -> dict:
+        """{원본 query: 결과 dict} (저장 안 된 쿼리는 빠짐)"""
+        out = {}
+        n = 0
+        for q in queries:
+            n += 1
+            row = self._find(q, kind)
+            if row is None or (sources is not None and row[5] == STATUS_OK and row[4] not in sources):
+                continue
+            out[q] = self._record(row)
+        self.hits += len(out)
+        self.misses += n - len(out)
+        return out
+
+    # -------------------------
+    # 저장
+    # -------------------------
+    def put(self, query: str, lat, lng, source: str, *, kind: str = KIND_QUERY, status: str = None):
+        """
+        좌표가 None이면 실패로 저장 (status: 실패 원인, 기본 not_found). 메모리 갱신 + 저널 한 줄 append.
+        close() 이후에는 기록·컴팩션 없이 RuntimeError.
+        """
+        ok = lat is not None and lng is not None
+        row = (kind, normalize_query(query), float(lat) if ok else None, float(lng) if ok else None,
+               source, STATUS_OK if ok else (status or STATUS_NOT_FOUND), time.time())
+        line = json.dumps(row, ensure_ascii=False, separators=(",", ":"))
+        with self._lock:
+            if self._closed:
+                raise RuntimeError(f"닫힌 지오코딩 저장소에는 기록할 수 없습니다: {self.path}")
+            self._set(row)
+            self._journal.write(line + "\n")
+            self._journal.flush()
+            self._pending.append(row)
+            self.n_appended += 1
+            due = len(self._pending) >= self.compact_every and self._compacting is None
+            if due:
+                self._compacting = threading.Thread(target=self.compact, daemon=True)
+                self._compacting.start()
+
+    def _write_rows(self, rows):
+        if not rows:
+            return
+        with self._db_lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO geocodes(kind, query, lat, lng, source, status, updated_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)", rows)
+            self._conn.commit()
+
+    def compact(self) -> int:
+        """저널 → SQLite 반영 후 저널 비움. 반환: 반영 행 수"""
+        with self._lock:
+            rows, self._pending = self._pending, []
+            # 반영 중 실패해도 유실 없도록 저널은 DB 반영 후 비움 (그 사이 put은 새 저널 줄로 보존)
+            mark = self._journal.tell()
+        try:
+            self._write_rows(rows)
+        except Exception:
+            with self._lock:
+                self._pending = rows + self._pending
+                self._compacting = None
+            raise
+        with self._lock:
+            self._journal.flush()
+            self._journal.seek(mark)
+            rest = self._journal.read()
+            self._journal.seek(0)
+            self._journal.truncate()
+            self._journal.write(rest)
+            self._journal.flush()
+            self._compacting = None
+            self.n_compactions += 1
+        return len(rows)
+
+    def import_json(self, path: str, *, order: str = "latlng", kind: str = KIND_QUERY,
+                    source: str = SOURCE_LEGACY) -> int:
+        """
+        기존 JSON 캐시 이관 (이미 있는 키는 유지). 파일이 바뀌지 않았으면 건너뜀.
+        - order: 'latlng' ([lat, lng]) | 'lonlat' ([lon, lat])
+        """
+        if not path or not os.path.exists(path):
+            return 0
+        st = os.stat(path)
+        apath = os.path.abspath(path)
+        with self._db_lock:
+            prev = self._conn.execute("SELECT mtime, size FROM imports WHERE path=?", (apath,)).fetchone()
+        if prev is not None and prev[0] == st.st_mtime and prev[1] == st.st_size:
+            return 0
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except Exception as e:
+            print(f"[WARN] geocode cache import failed: {path} | {e}")
+            return 0
+
+        now = time.time()
+        rows = []
+        with self._lock:
+            for q, v in data.items():
+                if not isinstance(v, (list, tuple)) or len(v) != 2:
+                    continue
+                a, b = v
+                lat, lng = (a, b) if order == "latlng" else (b, a)
+                ok = lat is not None and lng is not None
+                if ok:
+                    status = STATUS_OK
+                elif kind == KIND_QUERY and is_number_only(q):
+                    status = STATUS_INVALID
+                else:
+                    status = STATUS_NOT_FOUND
+                row = (kind, normalize_query(q), float(lat) if ok else None, float(lng) if ok else None,
+                       source, status, now)
+                if (row[0], row[1]) in self._rows:
+                    continue
+                self._set(row)
+                rows.append(row)
+        with self._db_lock:
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO geocodes(kind, query, lat, lng, source, status, updated_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)", rows)
+            self._conn.execute("INSERT OR REPLACE INTO imports(path, mtime, size, rows) VALUES (?, ?, ?, ?)",
+                               (apath, st.st_mtime, st.st_size, len(data)))
+            self._conn.commit()
+        print(f"[INFO] Geocode store: imported {len(rows)}/{len(data)} rows from {path}")
+        return len(rows)
+
+    def retag_legacy_centroids(self) -> int:
+        """
+        좌표가 저장된 행정동 센트로이드(kind='dong', ok)와 같은 legacy 쿼리 행 → source=centroid
+        (updated_at 유지, 바뀐 행만 SQLite 반영). 반환: 다시 분류한 행 수
+        """
+        with self._lock:
+            centroids = {(round(r[2], 7), round(r[3], 7)) for r in self._rows.values()
+                         if r[0] == KIND_DONG and r[5] == STATUS_OK}
+            rows = [r[:4] + (SOURCE_CENTROID,) + r[5:] for r in self._rows.values()
+                    if r[0] == KIND_QUERY and r[4] == SOURCE_LEGACY and r[5] == STATUS_OK
+                    and (round(r[2], 7), round(r[3], 7)) in centroids]
+            for row in rows:
+                self._set(row)
+        self._write_rows(rows)
+        if rows:
+            print(f"[INFO] Geocode store: {len(rows)} legacy rows re-tagged as {SOURCE_CENTROID}")
+        return len(rows)
+
+    def count(self, kind: str = None) -> int:
+        if kind is None:
+            return len(self._rows)
+        return sum(1 for k in list(self._rows) if k[0] == kind)
+
+    def status_counts(self) -> dict:
+        out = {}
+        for row in list(self._rows.values()):
+            out[row[5]] = out.get(row[5], 0) + 1
+        return out
+
+    def summary(self) -> str:
+        total = self.hits + self.misses
+        rate = (self.hits / total * 100) if total else 0.0
+        return (f"hits={self.hits} (canonical {self.canon_hits}) misses={self.misses} ({rate:.1f}%), rows={self.count()}, "
+                f"status={self.status_counts()}, dead_skips={self.dead_skips}, "
+                f"appended={self.n_appended}, compactions={self.n_compactions}")
+
+    def close(self):
+        """남은 저널 반영 후 저널 파일 삭제 (여러 번 호출해도 안전)"""
+        with self._lock:   # 이후 put은 거부 → 새 컴팩션/닫힌 저널 기록 없음
+            if self._closed:
+                return
+            self._closed = True
+            t = self._compacting
+        if t is not None:
+            t.join()
+        self.compact()
+        with self._lock:
+            _unlock(self._journal)
+            self._journal.close()
+        if os.path.exists(self._journal_path):
+            os.remove(self._journal_path)
+        with self._db_lock:
+            self._conn.close()
+
+
+def open_shared_store(path: str = DEFAULT_STORE_PATH, extra_legacy=()) -> GeocodeStore:
+    """공용 저장소 열기 + 기존 JSON 캐시 이관. extra_legacy: [(path, order, kind), ...]"""
+    store = GeocodeStore(path)
+    atexit.register(store.close)  # 종료 시 저널 반영 (비정상 종료 시에는 다음 시작에서 복구)
+    for legacy_path, order, kind in list(LEGACY_CACHES) + list(extra_legacy):
+        store.import_json(legacy_path, order=order, kind=kind)
+    store.retag_legacy_centroids()
+    return store
@@ -43,6 +43,20 @@ from urllib3.util.retry import Retry
 
 from folium.plugins import MiniMap, MarkerCluster, HeatMap
 
+import sys
+# 저장소 루트의 공용 모듈(map_loaders 등) 사용 → 추가 의존성(httpx, pyogrio, pyarrow)은 requirements.txt
+_REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".."))
+if _REPO_ROOT not in sys.path:
+    sys.path.append(_REPO_ROOT)
+from kakao_api import KAKAO_CAT_URL, KAKAO_KEYWORD_URL
+from loader_cache import LoaderCache
+from boundary_cache import read_cheonan_features
+from csv_sniff import read_csv_auto
+from map_loaders import (
+    kakao_get_json, shared_http_cache, shared_geocode_store,
+    read_private_parking, geocode_private_parking, load_traffic_stats,
+)
+
 
 # =========================
 # 설정
@@ -61,15 +75,14 @@ if REBUILD_MAP and not VWORLD_KEY:
     raise RuntimeError("REBUILD_MAP=True인데 환경변수 VWORLD_KEY가 비어있습니다.")
 
 HEADERS = {"Authorization": f"KakaoAK {KAKAO_REST_KEY}"} if KAKAO_REST_KEY else {}
-KAKAO_CAT_URL  = "https://dapi.kakao.com/v2/local/search/category.json"
-KAKAO_ADDR_URL = "https://dapi.kakao.com/v2/local/search/address.json"
-KAKAO_KEYWORD_URL = "https://dapi.kakao.com/v2/local/search/keyword.json"
 
 PAGE_SIZE = 15
 MAX_PAGES = 45
 MAX_FETCHABLE = PAGE_SIZE * MAX_PAGES  # 675
 SLEEP_SEC = 0.25
 GEOCODE_SLEEP_SEC = 0.2
+GEOCODE_RPS = 1.0 / GEOCODE_SLEEP_SEC   # 일괄 지오코딩: 초당 요청 상한(토큰버킷)
+GEOCODE_MAX_IN_FLIGHT = 4              # 일괄 지오코딩: 동시 요청 상한
 
 # 안정적 세션
 SESSION = requests.Session()
@@ -102,15 +115,23 @@ BOUNDARY_LINE_WEIGHT = 3.5
 DN_COLOR = "#BA2FE5"   # 동남구: 밝은 보라 (가시성 ↑)
 SB_COLOR = "#FF5722"   # 서북구: 강한 주황 (전체 경계와 확실한 대비)
 
-# 지오코딩 캐시
-GEOCODE_CACHE_PATH = os.path.join(SAVE_DIR, "geocode_cache.json")
-_geocode_cache = {}
-if os.path.exists(GEOCODE_CACHE_PATH):
-    try:
-        with open(GEOCODE_CACHE_PATH, "r", encoding="utf-8") as f:
-            _geocode_cache = json.load(f)
-    except Exception:
-        _geocode_cache = {}
+# 카카오 API 응답 캐시 (SQLite, TTL + 용량 상한) → 첫 카카오 호출 때 생성 (import 시 파일 생성 없음)
+HTTP_CACHE_PATH = os.path.join(SAVE_DIR, "kakao_http_cache.sqlite")
+HTTP_CACHE_TTL_SEC = 7 * 24 * 3600
+HTTP_CACHE_MAX_BYTES = 512 * 1024 * 1024
+def _http_cache():
+    return shared_http_cache(HTTP_CACHE_PATH, ttl_sec=HTTP_CACHE_TTL_SEC, max_bytes=HTTP_CACHE_MAX_BYTES)
+
+# 입력 로더 결과 캐시 (원본 CSV/XLSX 크기·수정시각·해시가 같으면 정규화 결과를 그대로 읽음)
+LOADER_CACHE_DIR = os.path.join(SAVE_DIR, "loader_cache")
+LOADER_CACHE = LoaderCache(LOADER_CACHE_DIR)
+
+# 천안 경계 피처만 GeoParquet으로 1회 변환 (원본 SHP가 같으면 SHP를 열지 않음)
+BOUNDARY_CACHE_PATH = os.path.join(SAVE_DIR, "cheonan_boundary.parquet")
+
+# 지오코딩: 공용 저장소(SQLite, 불법주정차 2_02와 공유, 첫 지오코딩 때 열기) + 비동기 일괄 지오코딩
+GEOCODE_CACHE_PATH = os.path.join(SAVE_DIR, "geocode_cache.json")  # 기존 JSON 캐시 ([lon, lat]) → 저장소로 이관
+GEOCODE_LEGACY_CACHES = [(GEOCODE_CACHE_PATH, "lonlat", "query")]
 
 # =========================
 # 빠른 종료
@@ -134,9 +155,13 @@ def load_cheonan_boundary_shp(shp_path: str):
       - cheonan_geom: 천안 전체 단일 geometry
       - gu_gdf_map: {"동남구": GDF, "서북구": GDF}
     """
-    gdf = gpd.read_file(shp_path)
-    if gdf.crs is not None and gdf.crs.to_epsg() != 4326:
-        gdf = gdf.to_crs(epsg=4326)
+    # 천안 bbox + BJCD 필터를 읽기 단계에서 적용 (캐시 있으면 캐시)
+    gdf = read_cheonan_features(shp_path, BOUNDARY_CACHE_PATH)
+    if gdf is None:
+        # BJCD 없음/불일치 → 전체 읽기 후 아래 이름 매칭으로 선택
+        gdf = gpd.read_file(shp_path)
+        if gdf.crs is not None and gdf.crs.to_epsg() != 4326:
+            gdf = gdf.to_crs(epsg=4326)
 
     target_sig5 = {"44130", "44131", "44133"}
     sel = gdf.iloc[0:0].copy()
@@ -207,6 +232,10 @@ def _kakao_get(url, params, headers, max_retries=3):
     else:
         raise requests.HTTPError("Request failed with unknown error")
 
+def _kakao_get_json(url, params, headers):
+    """응답 캐시 우선, 없으면 _kakao_get 호출 후 JSON 저장"""
+    return kakao_get_json(_kakao_get, url, params, headers, cache=_http_cache())
+
 def search_category_rect(group_code, minX, minY, maxX, maxY, *, headers=HEADERS, page_size=PAGE_SIZE):
     # 정렬
     minX, maxX = (minX, maxX) if minX <= maxX else (maxX, minX)
@@ -219,8 +248,7 @@ def search_category_rect(group_code, minX, minY, maxX, maxY, *, headers=HEADERS,
         "size": page_size,
         "rect": f"{minX},{minY},{maxX},{maxY}"
     }
-    resp = _kakao_get(KAKAO_CAT_URL, base_params, headers)
-    payload = resp.json()
+    payload = _kakao_get_json(KAKAO_CAT_URL, base_params, headers)
     total_count = payload.get("meta", {}).get("total_count", 0)
 
     if total_count > MAX_FETCHABLE:
@@ -235,7 +263,7 @@ def search_category_rect(group_code, minX, minY, maxX, maxY, *, headers=HEADERS,
 
     documents = []
     while True:
-        cur = payload if page_num == 1 else _kakao_get(KAKAO_CAT_URL, {**base_params, "page": page_num}, headers).json()
+        cur = payload if page_num == 1 else _kakao_get_json(KAKAO_CAT_URL, {**base_params, "page": page_num}, headers)
         docs = cur.get("documents", [])
         documents.extend(docs)
         if cur.get("meta", {}).get("is_end", True) or page_num >= MAX_PAGES:
@@ -277,11 +305,10 @@ def search_keyword_rect(keyword, minX, minY, maxX, maxY, *, headers=HEADERS, pag
         "size": page_size,
         "rect": f"{minX},{minY},{maxX},{maxY}"
     }
-    resp = _kakao_get(KAKAO_KEYWORD_URL, base_params, headers)
-    payload = resp.json()
+    payload = _kakao_get_json(KAKAO_KEYWORD_URL, base_params, headers)
     documents = []
     while True:
-        cur = payload if page_num == 1 else _kakao_get(KAKAO_KEYWORD_URL, {**base_params, "page": page_num}, headers).json()
+        cur = payload if page_num == 1 else _kakao_get_json(KAKAO_KEYWORD_URL, {**base_params, "page": page_num}, headers)
         docs = cur.get("documents", [])
         documents.extend(docs)
         if cur.get("meta", {}).get("is_end", True) or page_num >= MAX_PAGES:
@@ -535,46 +562,9 @@ def dedup_campus_pois(df_cat: pd.DataFrame,
 # =========================
 # Geocoding & Data loaders (주차장/수집기)
 # =========================
-def _kakao_get_addr(query: str):
-    if not query or not str(query).strip():
-        return (np.nan, np.nan)
-    key = str(query).strip()
-    if key in _geocode_cache:
-        lon, lat = _geocode_cache[key]
-        return (float(lon), float(lat)) if (lon is not None and lat is not None) else (np.nan, np.nan)
-
-    params = {"query": key}
-    last_exc = None
-    for attempt in range(1, 3+1):
-        try:
-            resp = _kakao_get(KAKAO_ADDR_URL, params, HEADERS)
-            docs = resp.json().get("documents", [])
-            if not docs:
-                _geocode_cache[key] = (None, None)
-                break
-            x = docs[0].get("x"); y = docs[0].get("y")
-            lon = float(x); lat = float(y)
-            _geocode_cache[key] = (lon, lat)
-            try:
-                with open(GEOCODE_CACHE_PATH, "w", encoding="utf-8") as f:
-                    json.dump(_geocode_cache, f, ensure_ascii=False)
-            except Exception:
-                pass
-            time.sleep(GEOCODE_SLEEP_SEC)
-            return (lon, lat)
-        except (requests.exceptions.RequestException, requests.HTTPError) as e:
-            last_exc = e
-            time.sleep(SLEEP_SEC * attempt)
-            continue
-    if last_exc:
-        print(f"[WARN] Geocode failed after retries: {key} | {last_exc}")
-    return (np.nan, np.nan)
-
+@LOADER_CACHE.cached("public_parking")
 def load_public_parking(csv_path: str):
-    try:
-        dfp = pd.read_csv(csv_path)
-    except UnicodeDecodeError:
-        dfp = pd.read_csv(csv_path, encoding="cp949")
+    dfp = read_csv_auto(csv_path)
     rename = {}
     if "주차장명" in dfp.columns: rename["주차장명"]="name"
     if "주소" in dfp.columns: rename["주소"]="address"
@@ -590,37 +580,19 @@ def load_public_parking(csv_path: str):
     dfp["id"] = "public_" + dfp.index.astype(str)
     return dfp[["id","name","lat","lon","road_address","jibun_address","category","source"]]
 
+_read_private_parking = LOADER_CACHE.cached("private_parking")(read_private_parking)
+
 def load_private_parking(xlsx_path: str):
-    dfm = pd.read_excel(xlsx_path)
-    rename = {}
-    if "주차장명" in dfm.columns: rename["주차장명"]="name"
-    if "소재지도로명주소" in dfm.columns: rename["소재지도로명주소"]="road_address"
-    if "소재지지번주소" in dfm.columns: rename["소재지지번주소"]="jibun_address"
-    dfm = dfm.rename(columns=rename)
-    lons, lats = [], []
-    for _, row in dfm.iterrows():
-        cand1 = str(row.get("road_address") or "").strip()
-        cand2 = str(row.get("jibun_address") or "").strip()
-        query = cand1 if cand1 else cand2
-        lon, lat = _kakao_get_addr(query)
-        lons.append(lon); lats.append(lat)
-    dfm["lon"] = lons; dfm["lat"] = lats
-    dfm["category"] = "민영주차장"
-    dfm["source"] = "천안시/민영"
-    dfm["id"] = "private_" + dfm.index.astype(str)
-    return dfm[["id","name","lat","lon","road_address","jibun_address","category","source"]]
+    """민영주차장 → 좌표 포함 공통 스키마 (XLSX 정규화는 로더 캐시, 지오코딩은 공용 저장소 + 비동기 일괄 조회)"""
+    return geocode_private_parking(
+        _read_private_parking(xlsx_path), headers=HEADERS, store=shared_geocode_store(GEOCODE_LEGACY_CACHES),
+        rate=GEOCODE_RPS, max_in_flight=GEOCODE_MAX_IN_FLIGHT, cache=_http_cache())
 
+@LOADER_CACHE.cached("enforcement_points")
 def load_enforcement_points(csv_path: str):
     """불법주정차 단속 포인트 로드: 위도/경도/단속건수 → lat/lon/count 로 표준화"""
-    # 인코딩 유연 처리
-    for enc in ["utf-8-sig", "cp949", "utf-8"]:
-        try:
-            df = pd.read_csv(csv_path, encoding=enc)
-            break
-        except Exception:
-            df = None
-    if df is None:
-        df = pd.read_csv(csv_path)
+    # 인코딩/구분자는 BOM·바이트 표본으로 1회 판별 후 한 번만 파싱
+    df = read_csv_auto(csv_path)
 
     # 열 이름 표준화
     rename = {}
@@ -652,11 +624,9 @@ def load_enforcement_points(csv_path: str):
     df["source"] = "천안시(사용자 CSV)"
     return df[["id","name","lat","lon","count","road_address","jibun_address","category","source"]]
 
+@LOADER_CACHE.cached("traffic_sensors")
 def load_traffic_sensors_exact(csv_path: str):
-    try:
-        df = pd.read_csv(csv_path)
-    except UnicodeDecodeError:
-        df = pd.read_csv(csv_path, encoding="cp949")
+    df = read_csv_auto(csv_path)
     if "lon" not in df.columns or "lat" not in df.columns:
         raise ValueError("수집기 CSV에 lon/lat 열이 없습니다.")
 
@@ -703,33 +673,6 @@ def make_cluster(thresholds=(5, 10)):
     }}"""
     return MarkerCluster(icon_create_function=js)
 
-def load_traffic_stats(csv_path: str):
-    """스마트교차로_통계.csv → 7월(2025-07-01~31)만 필터, 교차로명별 일평균 계산"""
-    try:
-        df = pd.read_csv(csv_path)
-    except UnicodeDecodeError:
-        df = pd.read_csv(csv_path, encoding="cp949")
-
-    # 필수 컬럼 체크
-    for col in ["일자", "교차로명", "합계"]:
-        if col not in df.columns:
-            raise ValueError(f"교통량 통계 CSV에 '{col}' 열이 없습니다.")
-
-    df["일자"] = pd.to_datetime(df["일자"], errors="coerce")
-    df["합계"] = pd.to_numeric(df["합계"], errors="coerce")
-
-    # 2025-07-01 ~ 2025-07-31
-    mask = (df["일자"] >= pd.Timestamp("2025-07-01")) & (df["일자"] <= pd.Timestamp("2025-07-31"))
-    df_july = df.loc[mask].copy()
-
-    # 교차로명별 7월 일평균
-    grp = df_july.groupby("교차로명", as_index=False).agg(
-        july_mean=("합계", "mean"),
-        july_sum =("합계", "sum"),
-        days     =("합계", "count"),
-    )
-    return grp  # columns: 교차로명, july_mean, july_sum, days
-
 
 # =========================
 # 팝업 HTML 빌더 (줄겹침 방지)
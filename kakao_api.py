@@ -0,0 +1,12 @@
+# -*- coding: utf-8 -*-
+"""
+카카오 로컬 API 엔드포인트 (수집기·지오코더·주차장 지도 공용)
+- KAKAO_API_BASE 환경변수로 로컬 목서버(kakao_mock_server) 전환 → 이 모듈을 처음 import 하기 전에 설정
+"""
+
+import os
+
+KAKAO_API_BASE    = (os.getenv("KAKAO_API_BASE") or "https://dapi.kakao.com").rstrip("/")
+KAKAO_CAT_URL     = f"{KAKAO_API_BASE}/v2/local/search/category.json"
+KAKAO_ADDR_URL    = f"{KAKAO_API_BASE}/v2/local/search/address.json"
+KAKAO_KEYWORD_URL = f"{KAKAO_API_BASE}/v2/local/search/keyword.json"
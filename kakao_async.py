@@ -0,0 +1,569 @@
+# -*- coding: utf-8 -*-
+"""
+카카오 로컬 API 비동기 수집 엔진
+- httpx.AsyncClient 기반: 셀 × 페이지 × 그룹/키워드를 동시에 팬아웃
+- 전역 토큰버킷(TokenBucket) 하나로 초당 요청 수(RPS) 제한 → 고정 time.sleep 제거
+- 반환 문서 리스트는 기존 search_category_rect / overlapped_category_in_polygon 과 동일
+  (__main__ 병합 로직 그대로 사용 가능)
+- 작업 목록(make_job) 하나로 카테고리/키워드 수집을 우선순위 기반 인터리빙 (run_crawl_jobs)
+"""
+
+import asyncio
+import contextvars
+import heapq
+import itertools
+import math
+import time
+
+import httpx
+import numpy as np
+import shapely
+from shapely.geometry import box
+
+from crawl_delta import TileSnapshot
+from crawl_journal import CrawlJournal
+from crawl_quadtree import DensityQuadtree
+from kakao_api import KAKAO_CAT_URL, KAKAO_KEYWORD_URL
+from kakao_http_cache import KakaoResponseCache
+
+# =========================
+# 설정
+# =========================
+PAGE_SIZE = 15
+MAX_PAGES = 45
+MAX_FETCHABLE = PAGE_SIZE * MAX_PAGES  # 675
+
+KAKAO_RPS       = 8.0    # 초당 요청 상한 (토큰 보충 속도)
+KAKAO_BURST     = 8      # 순간 허용 요청 수 (버킷 크기)
+MAX_IN_FLIGHT   = 16     # 동시 진행 요청 상한
+MAX_RETRIES     = 3
+RETRY_BACKOFF_SEC = 0.5
+RETRY_STATUS    = (429, 500, 502, 503, 504)
+TIMEOUT_CONNECT, TIMEOUT_READ = 8, 25
+
+# 타일(셀/리프) 위치 분류: 폴리곤 완전 내부 / 경계 걸침 / 외부
+TILE_INSIDE, TILE_BOUNDARY, TILE_OUTSIDE = "inside", "boundary", "outside"
+TILE_FLAG = "_tile"   # 문서에 붙는 타일 분류 키 (내부 타일 문서는 포함 검사 생략)
+
+# 현재 실행 중인 작업의 진행 상태 (asyncio 태스크별로 상속 → 하위 셀/페이지 요청까지 전달)
+_CURRENT_JOB = contextvars.ContextVar("kakao_crawl_job", default=None)
+
+
+# =========================
+# 토큰버킷 레이트리미터
+# =========================
+class TokenBucket:
+    """
+    초당 rate 개 토큰을 보충하는 버킷. acquire() 1회 = 요청 1건.
+    - 대기자는 (priority, 도착 순서) 순으로 토큰을 받음 (priority 작을수록 먼저)
+    """
+
+    def __init__(self, rate: float = KAKAO_RPS, burst: int = KAKAO_BURST):
+        self.rate = float(rate)
+        self.capacity = max(1.0, float(burst))
+        self._tokens = self.capacity
+        self._last = time.monotonic()
+        self._cond = asyncio.Condition()
+        self._waiters = []
+        self._seq = itertools.count()
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._last) * self.rate)
+        self._last = now
+
+    async def acquire(self, priority: int = 0):
+        me = (priority, next(self._seq))
+        async with self._cond:
+            heapq.heappush(self._waiters, me)
+            try:
+                while True:
+                    if self._waiters[0] != me:
+                        await self._cond.wait()
+                        continue
+                    self._refill()
+                    if self._tokens >= 1.0:
+                        self._tokens -= 1.0
+                        return
+                    try:
+                        await asyncio.wait_for(self._cond.wait(), (1.0 - self._tokens) / self.rate)
+                    except asyncio.TimeoutError:
+                        pass
+            finally:
+                # 토큰 획득/취소 모두 대기열에서 제거 후 다음 대기자 깨움
+                self._waiters.remove(me)
+                heapq.heapify(self._waiters)
+                self._cond.notify_all()
+
+    def drain(self, seconds: float):
+        """429 수신 시 버킷을 비워 seconds 동안 전체 요청을 늦춤"""
+        self._refill()
+        self._tokens = min(self._tokens, 0.0) - seconds * self.rate
+
+
+# =========================
+# 비동기 HTTP 클라이언트
+# =========================
+class KakaoAsyncClient:
+    """
+    카카오 로컬 API 공용 비동기 클라이언트
+    - 모든 요청이 하나의 TokenBucket을 공유 (그룹/키워드/셀 무관)
+    - 429/5xx 는 지수 백오프로 재시도, 그 외 오류는 즉시 HTTPStatusError
+    """
+
+    def __init__(self, headers: dict, *, rate: float = KAKAO_RPS, burst: int = KAKAO_BURST,
+                 max_in_flight: int = MAX_IN_FLIGHT, max_retries: int = MAX_RETRIES,
+                 cache: KakaoResponseCache = None):
+        self.headers = dict(headers or {})
+        self.cache = cache
+        self.bucket = TokenBucket(rate, burst)
+        self.max_in_flight = int(max_in_flight)
+        self.max_retries = int(max_retries)
+        self.n_requests = 0
+        self.n_retries = 0
+        self._client = None
+        self._sem = None
+
+    async def __aenter__(self):
+        self._client = httpx.AsyncClient(
+            headers=self.headers,
+            timeout=httpx.Timeout(TIMEOUT_READ, connect=TIMEOUT_CONNECT),
+            limits=httpx.Limits(max_connections=self.max_in_flight,
+                                max_keepalive_connections=self.max_in_flight),
+        )
+        self._sem = asyncio.Semaphore(self.max_in_flight)
+        return self
+
+    async def __aexit__(self, *exc):
+        await self._client.aclose()
+        self._client = None
+
+    async def get_json(self, url: str, params: dict, *, fresh: bool = False) -> dict:
+        """fresh=True 이면 캐시 조회를 건너뜀 (응답은 캐시에 갱신 저장)"""
+        if self.cache is not None and not fresh:
+            cached = self.cache.get(url, params)
+            if cached is not None:
+                return cached
+
+        job = _CURRENT_JOB.get()
+        priority = job["priority"] if job is not None else 0
+        last = None
+        for attempt in range(1, self.max_retries + 1):
+            await self.bucket.acquire(priority)
+            resp = None
+            async with self._sem:
+                try:
+                    resp = await self._client.get(url, params=params)
+                except httpx.HTTPError as e:
+                    last = e
+            self.n_requests += 1
+            if job is not None:
+                job["requests"] += 1
+
+            if resp is not None:
+                if resp.status_code == 200:
+                    payload = resp.json()
+                    if self.cache is not None:
+                        self.cache.put(url, params, payload)
+                    return payload
+                if resp.status_code not in RETRY_STATUS:
+                    raise httpx.HTTPStatusError(
+                        f"{resp.status_code} {resp.reason_phrase} | url={resp.url}\nbody={resp.text}",
+                        request=resp.request, response=resp)
+                last = resp
+                if resp.status_code == 429:
+                    self.bucket.drain(RETRY_BACKOFF_SEC * attempt)
+
+            self.n_retries += 1
+            await asyncio.sleep(RETRY_BACKOFF_SEC * attempt)
+
+        if isinstance(last, httpx.Response):
+            raise httpx.HTTPStatusError(
+                f"Request failed after retries. last_status={last.status_code}, body={last.text}",
+                request=last.request, response=last)
+        raise httpx.HTTPError(f"Request failed after retries due to network error: {last}")
+
+
+# =========================
+# 수집 엔진
+# =========================
+def _sorted_rect(minX, minY, maxX, maxY):
+    minX, maxX = (minX, maxX) if minX <= maxX else (maxX, minX)
+    minY, maxY = (minY, maxY) if minY <= maxY else (maxY, minY)
+    return minX, minY, maxX, maxY
+
+
+def _quadrants(minX, minY, maxX, maxY):
+    midX = (minX + maxX) / 2.0
+    midY = (minY + maxY) / 2.0
+    return [
+        (minX, minY, midX, midY),
+        (midX, minY, maxX, midY),
+        (minX, midY, midX, maxY),
+        (midX, midY, maxX, maxY),
+    ]
+
+
+def classify_tile(poly, rect) -> str:
+    """prepared 폴리곤 기준 사각형 분류: inside | boundary | outside"""
+    tile = box(*rect)
+    if poly.contains(tile):
+        return TILE_INSIDE
+    if poly.intersects(tile):
+        return TILE_BOUNDARY
+    return TILE_OUTSIDE
+
+
+def iter_grid_cells(bbox, num_x, num_y, poly):
+    """
+    bbox를 num_x × num_y 로 나눈 뒤 poly와 교차하는 셀만 (i, j 순서 유지)
+    반환: [(cell_rect, TILE_INSIDE | TILE_BOUNDARY), ...]
+    """
+    shapely.prepare(poly)
+    minX, minY, maxX, maxY = bbox
+    step_x = (maxX - minX) / float(num_x)
+    step_y = (maxY - minY) / float(num_y)
+    cells = []
+    for i in range(num_x):
+        for j in range(num_y):
+            cell_minX = minX + i * step_x
+            cell_maxX = cell_minX + step_x
+            cell_minY = minY + j * step_y
+            cell_maxY = cell_minY + step_y
+            rect = (cell_minX, cell_minY, cell_maxX, cell_maxY)
+            status = classify_tile(poly, rect)
+            if status == TILE_OUTSIDE:
+                continue
+            cells.append((rect, status))
+    return cells
+
+
+def docs_inside_polygon(docs: list, poly) -> np.ndarray:
+    """
+    문서별 폴리곤 포함 여부(bool 배열)
+    - 완전 내부 타일에서 온 문서(TILE_FLAG == inside)는 검사 생략
+    - 나머지(경계 타일)는 shapely.contains_xy 한 번으로 일괄 판정 (좌표 결측 → False)
+    """
+    n = len(docs)
+    inside = np.fromiter((d.get(TILE_FLAG) == TILE_INSIDE for d in docs), dtype=bool, count=n)
+    todo = np.flatnonzero(~inside)
+    if len(todo):
+        xs = _to_float_array([docs[i].get("x") for i in todo])
+        ys = _to_float_array([docs[i].get("y") for i in todo])
+        shapely.prepare(poly)
+        inside[todo] = shapely.contains_xy(poly, xs, ys)
+    return inside
+
+
+def dedup_docs(docs, seen: set = None) -> list:
+    """id 기준 첫 등장만 유지 (seen을 넘기면 호출 간 공유). id 없는 문서는 그대로 유지."""
+    seen = set() if seen is None else seen
+    out = []
+    for d in docs:
+        pid = d.get("id")
+        if pid:
+            if pid in seen:
+                continue
+            seen.add(pid)
+        out.append(d)
+    return out
+
+
+def _to_float_array(values) -> np.ndarray:
+    out = np.empty(len(values), dtype=np.float64)
+    for k, v in enumerate(values):
+        try:
+            out[k] = float(v)
+        except (TypeError, ValueError):
+            out[k] = np.nan
+    return out
+
+
+class AsyncKakaoCrawler:
+    """카테고리/키워드 사각형 검색을 동시 실행. 결과 순서는 동기 버전과 동일."""
+
+    def __init__(self, client: KakaoAsyncClient, *, page_size: int = PAGE_SIZE,
+                 quadtree: DensityQuadtree = None, journal: CrawlJournal = None,
+                 tiles: TileSnapshot = None, delta: bool = False):
+        self.client = client
+        self.page_size = page_size
+        self.quadtree = quadtree
+        self.journal = journal
+        self.tiles = tiles
+        self.delta = bool(delta and tiles is not None)
+
+    async def _get_page(self, url: str, params: dict) -> dict:
+        """
+        (kind, code, rect, page) 단위 요청. 저널에 완료 기록이 있으면 재생, 없으면 요청 후 기록.
+        - delta 모드의 1페이지는 응답 캐시를 읽지 않음 (total_count 변경 감지용 최신 응답)
+          2..N 페이지는 count가 바뀐 타일에서만 요청되므로 캐시 그대로 사용
+        """
+        fresh = self.delta and params.get("page", 1) == 1
+        if self.journal is None:
+            return await self.client.get_json(url, params, fresh=fresh)
+        kind = "category" if "category_group_code" in params else "keyword"
+        code = params.get("category_group_code") or params.get("query")
+        rect, page = params.get("rect", ""), params.get("page", 1)
+        payload = self.journal.get(kind, code, rect, page)
+        if payload is None:
+            payload = await self.client.get_json(url, params, fresh=fresh)
+            self.journal.record(kind, code, rect, page, payload)
+        return payload
+
+    async def _leaf_docs(self, kind, code, rect, url, base_params, first) -> list:
+        """
+        리프 타일 문서 목록
+        - delta 모드: total_count가 직전 스냅샷과 같으면 저장 문서 재사용 (2..N 페이지 생략)
+        - 그 외: 전체 페이지 수집 후 스냅샷에 기록
+        """
+        total_count = first.get("meta", {}).get("total_count", 0)
+        if self.delta:
+            docs = self.tiles.reuse(kind, code, rect, total_count)
+            if docs is not None:
+                return docs
+        docs = await self._fetch_rest_pages(url, base_params, first)
+        if self.tiles is not None:
+            self.tiles.put(kind, code, rect, total_count, docs)
+        return docs
+
+    async def _fetch_rest_pages(self, url: str, base_params: dict, first: dict) -> list:
+        """1페이지 응답의 meta로 남은 페이지 수를 계산해 2..N 페이지를 동시에 요청"""
+        documents = list(first.get("documents", []))
+        meta = first.get("meta", {})
+        if meta.get("is_end", True):
+            return documents
+
+        pageable = meta.get("pageable_count")
+        if pageable is None:
+            # meta에 pageable_count가 없으면 기존처럼 순차 진행
+            page_num = 1
+            cur = first
+            while not cur.get("meta", {}).get("is_end", True) and page_num < MAX_PAGES:
+                page_num += 1
+                cur = await self._get_page(url, {**base_params, "page": page_num})
+                documents.extend(cur.get("documents", []))
+            return documents
+
+        last_page = min(MAX_PAGES, max(1, math.ceil(int(pageable) / float(self.page_size))))
+        pages = await asyncio.gather(*[
+            self._get_page(url, {**base_params, "page": p})
+            for p in range(2, last_page + 1)
+        ])
+        for cur in pages:
+            documents.extend(cur.get("documents", []))
+        return documents
+
+    async def search_category_rect(self, group_code, minX, minY, maxX, maxY, *, leaves=None) -> list:
+        """leaves 리스트가 주어지면 675건 이하 리프 (rect, total_count)를 기록"""
+        minX, minY, maxX, maxY = _sorted_rect(minX, minY, maxX, maxY)
+        base_params = {
+            "category_group_code": group_code,
+            "page": 1,
+            "size": self.page_size,
+            "rect": f"{minX},{minY},{maxX},{maxY}",
+        }
+        first = await self._get_page(KAKAO_CAT_URL, base_params)
+        total_count = first.get("meta", {}).get("total_count", 0)
+
+        if total_count > MAX_FETCHABLE:
+            parts = await asyncio.gather(*[
+                self.search_category_rect(group_code, *q, leaves=leaves)
+                for q in _quadrants(minX, minY, maxX, maxY)
+            ])
+            return [d for part in parts for d in part]
+
+        if leaves is not None:
+            leaves.append(((minX, minY, maxX, maxY), total_count))
+        return await self._leaf_docs("category", group_code, (minX, minY, maxX, maxY),
+                                     KAKAO_CAT_URL, base_params, first)
+
+    async def search_keyword_rect(self, keyword, minX, minY, maxX, maxY, *, leaves=None) -> list:
+        minX, minY, maxX, maxY = _sorted_rect(minX, minY, maxX, maxY)
+        base_params = {
+            "query": str(keyword),
+            "page": 1,
+            "size": self.page_size,
+            "rect": f"{minX},{minY},{maxX},{maxY}",
+        }
+        first = await self._get_page(KAKAO_KEYWORD_URL, base_params)
+        total_count = first.get("meta", {}).get("total_count", 0)
+
+        # 카테고리와 동일: 45페이지(675건) 초과분은 잘리므로 4분할
+        if total_count > MAX_FETCHABLE:
+            parts = await asyncio.gather(*[
+                self.search_keyword_rect(keyword, *q, leaves=leaves)
+                for q in _quadrants(minX, minY, maxX, maxY)
+            ])
+            return [d for part in parts for d in part]
+
+        if leaves is not None:
+            leaves.append(((minX, minY, maxX, maxY), total_count))
+        return await self._leaf_docs("keyword", keyword, (minX, minY, maxX, maxY),
+                                     KAKAO_KEYWORD_URL, base_params, first)
+
+    async def _search_cell(self, kind, code, cell, status, poly) -> list:
+        """
+        셀 1개 수집. 쿼드트리에 리프가 있으면 probe 없이 리프 타일로 바로 이동.
+        (리프가 그 사이 675건을 넘었으면 그 리프만 다시 4분할)
+        - 문서마다 TILE_FLAG 부착: 내부 셀 전체 / 경계 셀이라도 내부 리프면 inside
+        """
+        search = self.search_category_rect if kind == "category" else self.search_keyword_rect
+        known = self.quadtree.leaves(kind, code, cell) if self.quadtree is not None else []
+        rects = [r for r, _ in known] or [cell]
+
+        leaves = []
+        parts = await asyncio.gather(*[search(code, *r, leaves=leaves) for r in rects])
+        if self.quadtree is not None:
+            self.quadtree.update(kind, code, cell, leaves)
+
+        out = []
+        for r, part in zip(rects, parts):
+            tile = status if (status == TILE_INSIDE or r == cell) else classify_tile(poly, r)
+            for d in part:
+                d[TILE_FLAG] = tile
+            out.extend(part)
+        return out
+
+    async def overlapped_category_in_polygon(self, group_code, bbox, num_x, num_y, poly) -> list:
+        cells = iter_grid_cells(bbox, num_x, num_y, poly)
+        parts = await asyncio.gather(*[self._search_cell("category", group_code, c, st, poly)
+                                       for c, st in cells])
+        return [d for part in parts for d in part]
+
+    async def overlapped_keyword_in_polygon(self, keyword, bbox, num_x, num_y, poly) -> list:
+        cells = iter_grid_cells(bbox, num_x, num_y, poly)
+        parts = await asyncio.gather(*[self._search_cell("keyword", keyword, c, st, poly)
+                                       for c, st in cells])
+        return dedup_docs(d for part in parts for d in part)
+
+    async def run_job(self, job: dict, cells, poly, progress: dict, sink=None) -> list:
+        """
+        작업 1개(카테고리 그룹 또는 키워드) 수집. 셀 순서는 overlapped_*_in_polygon 과 동일.
+        - 작업 상태를 컨텍스트에 실어 하위 요청 전부가 작업 우선순위로 토큰을 받음
+        - sink(job, docs)가 있으면 셀이 끝날 때마다 넘기고 문서를 보관하지 않음
+        """
+        state = {"priority": job["priority"], "requests": 0, "cells_done": 0, "docs": 0, "dups": 0}
+        seen = set()  # 셀/4분할 경계에 걸친 장소 중복 제거 (작업 단위)
+        _CURRENT_JOB.set(state)
+        t0 = time.monotonic()
+
+        async def one(cell, status):
+            part = await self._search_cell(job["kind"], job["code"], cell, status, poly)
+            n_raw = len(part)
+            part = dedup_docs(part, seen)
+            state["dups"] += n_raw - len(part)
+            state["cells_done"] += 1
+            state["docs"] += len(part)
+            if sink is not None:
+                sink(job, part)
+                return []
+            return part
+
+        parts = await asyncio.gather(*[one(c, st) for c, st in cells])
+        progress["done"] += 1
+        print(f"[JOB] {progress['done']}/{progress['total']} {job['name']} "
+              f"(tag={job['tag']}, prio={job['priority']}): {state['cells_done']} cells, "
+              f"{state['docs']} docs (-{state['dups']} dup), {state['requests']} req, "
+              f"{time.monotonic() - t0:.1f}s")
+        return [d for part in parts for d in part]
+
+
+# =========================
+# 작업 목록 (카테고리 그룹 / 키워드 보강)
+# =========================
+def make_job(kind: str, code: str, *, tag: str = None, rule=None, priority: int = 0, name: str = None) -> dict:
+    """
+    수집 작업 1건 (선언형)
+      - kind: 'category' | 'keyword'
+      - code: 카테고리 그룹 코드 또는 검색어
+      - tag: 병합 시 부여할 그룹 태그 (기본: code)
+      - rule: 문서 필터 rule(doc) -> bool (기본: 전부 통과)
+      - priority: 작을수록 먼저 토큰을 받음
+    """
+    if kind not in ("category", "keyword"):
+        raise ValueError(f"unknown job kind: {kind}")
+    return {
+        "name": name or f"{kind}:{code}",
+        "kind": kind,
+        "code": code,
+        "tag": tag or code,
+        "rule": rule or (lambda doc: True),
+        "priority": int(priority),
+    }
+
+
+# =========================
+# 동기 진입점
+# =========================
+async def _run_crawl_jobs_async(jobs, bbox, num_x, num_y, poly, *,
+                                headers, rate, burst, max_in_flight, page_size, quadtree, cache, journal,
+                                tiles, delta, sink):
+    cells = iter_grid_cells(bbox, num_x, num_y, poly)
+    async with KakaoAsyncClient(headers, rate=rate, burst=burst, max_in_flight=max_in_flight,
+                                cache=cache) as client:
+        crawler = AsyncKakaoCrawler(client, page_size=page_size, quadtree=quadtree, journal=journal,
+                                    tiles=tiles, delta=delta)
+        progress = {"done": 0, "total": len(jobs)}
+        t0 = time.monotonic()
+        parts = await asyncio.gather(*[crawler.run_job(job, cells, poly, progress, sink) for job in jobs])
+        elapsed = time.monotonic() - t0
+        print(f"[INFO] Async crawl: {len(jobs)} jobs, {client.n_requests} requests "
+              f"(retries {client.n_retries}) in {elapsed:.1f}s "
+              f"→ {client.n_requests / max(elapsed, 1e-9):.1f} req/s")
+    return {job["name"]: part for job, part in zip(jobs, parts)}
+
+
+def run_crawl_jobs(jobs, bbox, num_x, num_y, poly, *, headers=None,
+                   rate=KAKAO_RPS, burst=KAKAO_BURST, max_in_flight=MAX_IN_FLIGHT, page_size=PAGE_SIZE,
+                   quadtree_path=None, cache=None, journal=None, tile_snapshot_path=None, delta=False,
+                   sink=None):
+    """
+    작업 목록 전체를 하나의 토큰버킷(RPS 예산) 아래 인터리빙 실행
+    반환: {job name: [doc, ...]} (필터 rule은 적용하지 않음 → 병합 단계에서 적용)
+      - 전체 소요 시간 ≈ 총 요청 수 / RPS (단계별 직렬 합이 아님)
+      - quadtree_path: 밀도 쿼드트리 JSON (있으면 리프 타일 재사용, 수집 후 갱신 저장)
+      - cache: KakaoResponseCache (있으면 캐시 히트는 토큰/네트워크 없이 즉시 반환)
+      - journal: CrawlJournal (완료 단위 재생 + 새 단위 기록 → 중단 지점부터 재개)
+      - tile_snapshot_path: 리프 타일별 total_count + 문서 스냅샷 JSON (수집 후 갱신 저장)
+      - delta: True면 1페이지만 캐시 없이 새로 받아 count가 같은 타일은 스냅샷 문서 재사용
+      - sink: sink(job, docs) 셀 단위 스트리밍 콜백 (지정 시 반환 리스트는 비어 있음)
+    """
+    jobs = list(jobs)
+    names = [job["name"] for job in jobs]
+    if len(set(names)) != len(names):
+        raise ValueError("duplicate job names")
+    quadtree = DensityQuadtree(quadtree_path) if quadtree_path else None
+    tiles = TileSnapshot(tile_snapshot_path) if tile_snapshot_path else None
+    result = asyncio.run(_run_crawl_jobs_async(
+        jobs, bbox, num_x, num_y, poly,
+        headers=headers, rate=rate, burst=burst, max_in_flight=max_in_flight, page_size=page_size,
+        quadtree=quadtree, cache=cache, journal=journal, tiles=tiles, delta=delta, sink=sink,
+    ))
+    if journal is not None:
+        print(f"[INFO] Crawl journal: replayed {journal.n_replayed}, recorded {journal.n_recorded} units")
+    if cache is not None:
+        print(f"[INFO] HTTP cache: {cache.summary()}")
+    if quadtree is not None:
+        quadtree.save()
+        print(f"[INFO] Quadtree: reused leaves for {quadtree.n_hits} cells, "
+              f"explored {quadtree.n_misses} cells → {quadtree_path}")
+    if tiles is not None:
+        tiles.save()
+        if delta:
+            print(f"[INFO] Delta crawl: {tiles.summary()} → {tile_snapshot_path}")
+    return result
+
+
+def crawl_polygon(bbox, num_x, num_y, poly, *, group_codes=(), keywords=(), **kwargs):
+    """
+    카테고리 그룹 + 키워드를 한 번에 동시 수집 (run_crawl_jobs 단순 래퍼)
+    반환: ({group_code: [doc, ...]}, {keyword: [doc, ...]})
+      - 각 리스트는 overlapped_category_in_polygon / overlapped_keyword_in_polygon 결과와 동일
+    """
+    group_codes = list(group_codes)
+    keywords = list(keywords)
+    jobs = ([make_job("category", gc) for gc in group_codes]
+            + [make_job("keyword", kw) for kw in keywords])
+    result = run_crawl_jobs(jobs, bbox, num_x, num_y, poly, **kwargs)
+    return ({gc: result[f"category:{gc}"] for gc in group_codes},
+            {kw: result[f"keyword:{kw}"] for kw in keywords})
@@ -0,0 +1,229 @@
+# -*- coding: utf-8 -*-
+"""
+공용 카카오 지오코딩 서비스
+- 주소 API → 키워드 API 폴백 → (선택) 행정동 센트로이드 대체 (로컬 경계 내부점 우선, 없으면 API)
+- 모든 결과는 GeocodeStore 하나에 기록 (source: address/keyword/centroid)
+- HTTP 전송은 호출 측이 넘기는 fetch_json(url, params) -> dict 로 주입
+  (주차장 지도: 응답 캐시 + 재시도 세션 / 2_02: 재시도 세션 + 전역 레이트리밋)
+- 좌표 반환 순서는 (lat, lng)
+- 실패는 원인별로 저장 (not_found / out_of_bounds / error, geocode_store.FAILURE_TTL)
+  번지만 있는 쿼리('천안시 874')와 영구 실패 쿼리는 API를 호출하지 않음
+"""
+
+from address_key import is_number_only
+from geocode_store import (
+    GeocodeStore, KIND_DONG, KIND_QUERY,
+    STATUS_OK, STATUS_NOT_FOUND, STATUS_ERROR, STATUS_OUT_OF_BOUNDS, STATUS_INVALID,
+    SOURCE_ADDRESS, SOURCE_KEYWORD, SOURCE_CENTROID, SOURCE_LEGACY,
+)
+from kakao_api import KAKAO_ADDR_URL, KAKAO_KEYWORD_URL
+
+CITY_PREFIX = "충청남도 천안시"
+
+# 센트로이드 대체값을 받지 않는 호출 측(주차장 좌표 등)용
+# (legacy 중 행정동 센트로이드와 같은 좌표는 open_shared_store()에서 centroid로 재분류됨)
+PRECISE_SOURCES = (SOURCE_ADDRESS, SOURCE_KEYWORD, SOURCE_LEGACY)
+
+
+def is_number_like(v) -> bool:
+    try:
+        v = str(v).strip()
+        if v == "":
+            return False
+        float(v)
+        return True
+    except Exception:
+        return False
+
+
+# 국내 위도/경도 대략 가드(대한민국 본토 범위 근사)
+def in_korea_bounds(lat: float, lng: float) -> bool:
+    return (33.0 <= lat <= 43.5) and (124.0 <= lng <= 132.5)
+
+
+def _checked(lat: float, lng: float):
+    if in_korea_bounds(lat, lng):
+        return lat, lng, STATUS_OK
+    return None, None, STATUS_OUT_OF_BOUNDS
+
+
+def parse_address_docs(payload: dict):
+    """주소 API 응답 → (lat, lng, status). 도로명 좌표 우선, 없으면 지번."""
+    for d in payload.get("documents", []):
+        for sub in (d.get("road_address"), d.get("address"), d):
+            if sub and is_number_like(sub.get("y")) and is_number_like(sub.get("x")):
+                return _checked(float(sub["y"]), float(sub["x"]))
+    return None, None, STATUS_NOT_FOUND
+
+
+def parse_keyword_docs(payload: dict):
+    """키워드 API 응답 → 첫 유효 좌표 (lat, lng, status)"""
+    for d in payload.get("documents", []):
+        y, x = d.get("y"), d.get("x")
+        if is_number_like(y) and is_number_like(x):
+            return _checked(float(y), float(x))
+    return None, None, STATUS_NOT_FOUND
+
+
+def failure_status(*statuses) -> str:
+    """폴백 단계별 실패 원인 → 저장할 원인 (오류가 하나라도 있으면 재시도 대상인 error 우선)"""
+    for s in (STATUS_ERROR, STATUS_OUT_OF_BOUNDS):
+        if s in statuses:
+            return s
+    return STATUS_NOT_FOUND
+
+
+def dong_from_query(q: str, city_prefix: str = CITY_PREFIX) -> str:
+    """'{city_prefix} {동} ...' 쿼리에서 동명 추출"""
+    tail = str(q).replace(city_prefix, "", 1).strip()
+    return tail.split()[0] if tail else ""
+
+
+# =========================
+# 폴백 체인 (동기/비동기 공용: 저장소 판정·체인 구성·저장, 전송만 각 클래스의 _query)
+# =========================
+def lookup_store(store: GeocodeStore, q: str, kind: str, sources=None):
+    """저장소 결과: None(미조회) | (lat, lng) | (None, None)(실패 또는 허용 안 된 source)"""
+    rec = store.get(q, kind=kind)
+    if rec is None:
+        return None
+    if rec["status"] != STATUS_OK or (sources is not None and rec["source"] not in sources):
+        # 센트로이드 대체값 = 주소/키워드 조회가 이미 실패한 쿼리 → 재호출 없이 실패 처리
+        return None, None
+    return rec["lat"], rec["lng"]
+
+
+def query_precheck(store: GeocodeStore, q: str, sources=None):
+    """
+    쿼리 API 호출 전 판정: None이면 폴백 체인 진행, 아니면 그대로 결과 (lat, lng) | (None, None)
+    - 빈 쿼리·영구 실패 → 실패, 저장소 히트 → 저장값, 번지만 있는 쿼리 → invalid 저장 후 실패
+    """
+    if not q or not str(q).strip() or store.is_dead(q):
+        return None, None
+    hit = lookup_store(store, q, KIND_QUERY, sources)
+    if hit is not None:
+        return hit
+    if is_number_only(q):
+        store.put(q, None, None, SOURCE_ADDRESS, status=STATUS_INVALID)
+        return None, None
+    return None
+
+
+def dong_precheck(store: GeocodeStore, dong: str, locator=None):
+    """행정동 API 호출 전 판정: 로컬 경계 내부점 → 영구 실패 → 저장소 (None이면 폴백 체인 진행)"""
+    if not dong:
+        return None, None
+    if locator is not None:
+        lat, lng = locator.locate(dong)
+        if lat is not None:
+            return lat, lng
+    if store.is_dead(dong, kind=KIND_DONG):
+        return None, None
+    return lookup_store(store, dong, KIND_DONG)
+
+
+def query_steps(q: str):
+    """쿼리 폴백 체인 [(url, 검색어, 파서, 저장 source)]: 주소 API → 키워드 API"""
+    return [(KAKAO_ADDR_URL, q, parse_address_docs, SOURCE_ADDRESS),
+            (KAKAO_KEYWORD_URL, q, parse_keyword_docs, SOURCE_KEYWORD)]
+
+
+def dong_steps(dong: str, city_prefix: str = CITY_PREFIX):
+    """행정동 폴백 체인: 행정복지센터 키워드 → 동명 주소 → 동명 키워드"""
+    q2 = f"{city_prefix} {dong}"
+    return [(KAKAO_KEYWORD_URL, f"{q2} 행정복지센터", parse_keyword_docs, SOURCE_CENTROID),
+            (KAKAO_ADDR_URL, q2, parse_address_docs, SOURCE_CENTROID),
+            (KAKAO_KEYWORD_URL, q2, parse_keyword_docs, SOURCE_CENTROID)]
+
+
+def record_chain(store: GeocodeStore, key: str, tried, *, kind: str = KIND_QUERY):
+    """
+    체인 실행 결과 tried=[(lat, lng, status, source), ...] (성공한 단계 또는 마지막 단계에서 끝남)
+    → 마지막 단계 source로 저장 (실패면 단계별 원인 중 failure_status) 후 (lat, lng)
+    """
+    lat, lng, _, source = tried[-1]
+    store.put(key, lat, lng, source, kind=kind, status=failure_status(*(t[2] for t in tried)))
+    return lat, lng
+
+
+def record_centroid(store: GeocodeStore, q: str, lat, lng):
+    """센트로이드 대체 좌표를 쿼리 결과로 저장 (source=centroid)"""
+    if lat is not None and lng is not None:
+        store.put(q, lat, lng, SOURCE_CENTROID)
+    return lat, lng
+
+
+class KakaoGeocoder:
+    """
+    - fetch_json 예외(네트워크/HTTP 오류)는 error로 저장 → TTL(10분) 후 재시도
+    - 결과 없음(not_found)은 TTL 동안, 국내 범위 밖/번지만 있는 쿼리는 영구히 재호출 방지
+    """
+
+    def __init__(self, fetch_json, store: GeocodeStore = None, *, city_prefix: str = CITY_PREFIX, locator=None):
+        self.fetch_json = fetch_json
+        self.store = store if store is not None else GeocodeStore()
+        self.city_prefix = city_prefix
+        self.locator = locator   # dong_locator.DongLocator (행정동 경계 내부점, 있으면 API 대신 사용)
+        self.n_calls = 0
+        self.n_errors = 0
+
+    def _fetch(self, url: str, q: str):
+        self.n_calls += 1
+        try:
+            return self.fetch_json(url, {"query": q})
+        except Exception:
+            self.n_errors += 1
+            return None
+
+    def _query(self, url: str, q: str, parse):
+        """반환: (lat, lng, status) — 전송 실패는 status=error"""
+        payload = self._fetch(url, q)
+        if payload is None:
+            return None, None, STATUS_ERROR
+        return parse(payload)
+
+    def _run_chain(self, steps):
+        """폴백 체인을 첫 성공까지 순서대로 조회 → record_chain 입력"""
+        tried = []
+        for url, q, parse, source in steps:
+            lat, lng, st = self._query(url, q, parse)
+            tried.append((lat, lng, st, source))
+            if lat is not None and lng is not None:
+                break
+        return tried
+
+    def address(self, q: str):
+        lat, lng, _ = self._query(KAKAO_ADDR_URL, q, parse_address_docs)
+        return lat, lng
+
+    def keyword(self, q: str):
+        lat, lng, _ = self._query(KAKAO_KEYWORD_URL, q, parse_keyword_docs)
+        return lat, lng
+
+    def geocode(self, q: str, *, sources=None):
+        """
+        쿼리 1건: 저장소 → 주소 API → 키워드 API
+        - sources: 저장소에서 받아들일 source (예: PRECISE_SOURCES → 센트로이드 대체값 제외)
+        반환: (lat, lng) | (None, None)
+        """
+        hit = query_precheck(self.store, q, sources)
+        if hit is not None:
+            return hit
+        return record_chain(self.store, q, self._run_chain(query_steps(q)))
+
+    def dong_centroid(self, dong: str):
+        """행정동 중심좌표: 로컬 경계 내부점 → 행정복지센터 키워드 → 실패 시 동명 주소/키워드"""
+        hit = dong_precheck(self.store, dong, self.locator)
+        if hit is not None:
+            return hit
+        return record_chain(self.store, dong, self._run_chain(dong_steps(dong, self.city_prefix)), kind=KIND_DONG)
+
+    def geocode_with_centroid(self, q: str):
+        """geocode 실패 시 쿼리의 동명으로 센트로이드 대체 (결과는 source=centroid로 저장)"""
+        lat, lng = self.geocode(q)
+        if lat is not None and lng is not None:
+            return lat, lng
+        dong = dong_from_query(q, self.city_prefix)
+        if not dong:
+            return None, None
+        return record_centroid(self.store, q, *self.dong_centroid(dong))
@@ -0,0 +1,169 @@
+# -*- coding: utf-8 -*-
+"""
+비동기 카카오 지오코딩 엔진 (kakao_async.KakaoAsyncClient 재사용)
+- 전역 토큰버킷으로 QPS 상한까지 채움 (스레드 + 전역 Lock 간격 제한 대체)
+- 쿼리별 폴백 체인(주소 → 키워드 → 동 센트로이드)을 각자 태스크로 진행 → 실패 쿼리가 다른 쿼리를 막지 않음
+- 같은 동의 센트로이드 조회는 한 번만 (진행 중 태스크 공유)
+- 정규 키(address_key)가 같은 쿼리는 대표 1건만 조회하고 결과를 나눠 씀
+- geocode_many(): 중복 제거 → 저장소 일괄 조회 → 미스만 비동기 동시 조회
+  (주차장 지도 load_private_parking, 대시보드 base_data, 2_02 공용)
+- 폴백 순서·저장 규칙(원인별 실패 저장, 영구 실패 호출 차단)은 kakao_geocoder 의 공용 헬퍼 그대로 (전송만 비동기)
+"""
+
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+
+from address_key import canonical_key
+from geocode_store import GeocodeStore, KIND_DONG, STATUS_OK, STATUS_ERROR
+from kakao_async import KakaoAsyncClient, KAKAO_BURST
+from kakao_http_cache import KakaoResponseCache
+from kakao_geocoder import (
+    CITY_PREFIX, dong_from_query, query_precheck, dong_precheck, query_steps, dong_steps,
+    record_chain, record_centroid,
+)
+
+GEOCODE_QPS = 8.0
+GEOCODE_MAX_IN_FLIGHT = 8
+
+
+class AsyncKakaoGeocoder:
+    """kakao_geocoder.KakaoGeocoder 와 같은 판정·체인·저장 헬퍼 사용, 전송만 KakaoAsyncClient"""
+
+    def __init__(self, client: KakaoAsyncClient, store: GeocodeStore, *, city_prefix: str = CITY_PREFIX,
+                 locator=None):
+        self.client = client
+        self.store = store
+        self.city_prefix = city_prefix
+        self.locator = locator
+        self.n_calls = 0
+        self.n_errors = 0
+        self._dong_tasks = {}
+
+    async def _query(self, url: str, q: str, parse):
+        """반환: (lat, lng, status) — 전송 실패는 status=error"""
+        self.n_calls += 1
+        try:
+            payload = await self.client.get_json(url, {"query": q})
+        except (httpx.HTTPError, ValueError):
+            self.n_errors += 1
+            return None, None, STATUS_ERROR
+        return parse(payload)
+
+    async def _run_chain(self, steps):
+        tried = []
+        for url, q, parse, source in steps:
+            lat, lng, st = await self._query(url, q, parse)
+            tried.append((lat, lng, st, source))
+            if lat is not None and lng is not None:
+                break
+        return tried
+
+    async def geocode(self, q: str, *, sources=None):
+        """저장소 → 주소 API → 키워드 API (sources: 저장소에서 받아들일 source)"""
+        hit = query_precheck(self.store, q, sources)
+        if hit is not None:
+            return hit
+        return record_chain(self.store, q, await self._run_chain(query_steps(q)))
+
+    async def _dong_centroid(self, dong: str):
+        return record_chain(self.store, dong, await self._run_chain(dong_steps(dong, self.city_prefix)),
+                            kind=KIND_DONG)
+
+    async def dong_centroid(self, dong: str):
+        """로컬 경계 내부점 → 행정복지센터 키워드 → 동명 주소 → 동명 키워드 (동마다 1회, 진행 중이면 결과 공유)"""
+        hit = dong_precheck(self.store, dong, self.locator)
+        if hit is not None:
+            return hit
+        task = self._dong_tasks.get(dong)
+        if task is None:
+            task = asyncio.ensure_future(self._dong_centroid(dong))
+            self._dong_tasks[dong] = task
+            task.add_done_callback(lambda _t, d=dong: self._dong_tasks.pop(d, None))
+        return await asyncio.shield(task)
+
+    async def geocode_with_centroid(self, q: str):
+        lat, lng = await self.geocode(q)
+        if lat is not None and lng is not None:
+            return lat, lng
+        dong = dong_from_query(q, self.city_prefix)
+        if not dong:
+            return None, None
+        return record_centroid(self.store, q, *await self.dong_centroid(dong))
+
+
+# =========================
+# 동기 진입점
+# =========================
+async def _geocode_many_async(queries, *, headers, rate, burst, max_in_flight, store, city_prefix,
+                              on_result, centroid_fallback, sources, cache, locator):
+    results = {}
+    async with KakaoAsyncClient(headers, rate=rate, burst=burst, max_in_flight=max_in_flight,
+                                cache=cache) as client:
+        geocoder = AsyncKakaoGeocoder(client, store, city_prefix=city_prefix, locator=locator)
+        if centroid_fallback:
+            resolve = geocoder.geocode_with_centroid
+        else:
+            async def resolve(q):
+                return await geocoder.geocode(q, sources=sources)
+        sem = asyncio.Semaphore(max_in_flight * 4)  # 동시에 진행하는 쿼리 체인 수 (요청 수 상한은 client)
+        t0 = time.monotonic()
+
+        groups = {}
+        for q in queries:
+            groups.setdefault(canonical_key(q) or q, []).append(q)
+
+        async def one(variants):
+            async with sem:
+                lat, lng = await resolve(variants[0])
+            for q in variants:
+                results[q] = (lat, lng)
+                if on_result is not None:
+                    on_result(q, lat, lng)
+
+        await asyncio.gather(*[one(v) for v in groups.values()])
+        elapsed = time.monotonic() - t0
+        print(f"[INFO] Async geocode: {len(queries)} queries ({len(groups)} canonical), {client.n_requests} requests "
+              f"(retries {client.n_retries}, errors {geocoder.n_errors}) in {elapsed:.1f}s "
+              f"→ {client.n_requests / max(elapsed, 1e-9):.1f} req/s")
+    return results
+
+
+def _run(coro):
+    """이벤트 루프가 이미 도는 곳(Shiny 서버 등)에서는 별도 스레드에서 실행"""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+    with ThreadPoolExecutor(max_workers=1) as ex:
+        return ex.submit(asyncio.run, coro).result()
+
+
+def geocode_many(queries, *, headers: dict, store: GeocodeStore = None, rate: float = GEOCODE_QPS,
+                 burst: int = KAKAO_BURST, max_in_flight: int = GEOCODE_MAX_IN_FLIGHT,
+                 city_prefix: str = CITY_PREFIX, on_result=None, centroid_fallback: bool = True,
+                 sources=None, cache: KakaoResponseCache = None, locator=None) -> dict:
+    """
+    쿼리 목록 일괄 지오코딩 → {query: (lat, lng) | (None, None)}
+      - 빈 쿼리 제외·중복 제거 후 저장소 일괄 조회, 미스만 API 호출
+      - on_result(q, lat, lng): API 조회 대상 쿼리 1건 완료 시 호출 (체크포인트/진행률)
+      - centroid_fallback: 실패 시 동 센트로이드 대체 (2_02 기본 동작)
+      - sources: 저장소에서 받아들일 source (centroid_fallback=False 일 때, 예: PRECISE_SOURCES)
+      - cache: 카카오 응답 캐시 (주차장 지도 map_loaders.shared_http_cache)
+      - locator: dong_locator.DongLocator (센트로이드 대체를 로컬 경계 내부점으로)
+    """
+    queries = [q for q in dict.fromkeys(str(q).strip() for q in queries if q is not None) if q]
+    store = store if store is not None else GeocodeStore()
+    results = {}
+    for q, rec in store.get_many(queries, sources=None if centroid_fallback else sources).items():
+        results[q] = (rec["lat"], rec["lng"]) if rec["status"] == STATUS_OK else (None, None)
+    misses = [q for q in queries if q not in results]
+    if misses:
+        results.update(_run(_geocode_many_async(
+            misses, headers=headers, rate=rate, burst=burst, max_in_flight=max_in_flight, store=store,
+            city_prefix=city_prefix, on_result=on_result, centroid_fallback=centroid_fallback,
+            sources=sources, cache=cache, locator=locator,
+        )))
+    return results
@@ -0,0 +1,186 @@
+# -*- coding: utf-8 -*-
+"""
+카카오 로컬 API 응답 디스크 캐시 (SQLite)
+- 키: 엔드포인트 + 정규화 파라미터(category_group_code, query, rect, page, size ...)의 SHA1
+- 값: 응답 JSON(200만 저장), 저장 시각, 마지막 접근 시각, 크기
+- TTL 만료 / 총 용량 상한 초과 시 오래 안 쓴 항목부터 제거(LRU)
+- 히트 시 마지막 접근 시각은 메모리에 모았다가 put()/TOUCH_FLUSH_EVERY건/close()/종료 시 한 트랜잭션으로 반영
+  (비동기 수집 루프에서 히트마다 UPDATE + commit 하지 않음)
+- hit/miss 카운터 → 재실행·필터 규칙 반복 수정 시 네트워크 비용 거의 0
+"""
+
+import atexit
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+from urllib.parse import urlparse
+
+DEFAULT_TTL_SEC = 7 * 24 * 3600          # 1주
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024    # 512MB
+TOUCH_FLUSH_EVERY = 1000                 # 접근 시각 갱신 누적 건수 기준 반영
+
+# 키에 반영하는 파라미터 (그 외 파라미터는 무시)
+_KEY_PARAMS = ("category_group_code", "query", "rect", "x", "y", "radius", "page", "size", "sort",
+               "analyze_type")
+
+
+def _norm_value(k: str, v) -> str:
+    if k == "rect":
+        try:
+            return ",".join(f"{float(t):.7f}" for t in str(v).split(","))
+        except ValueError:
+            return str(v).strip()
+    if k in ("x", "y"):
+        try:
+            return f"{float(v):.7f}"
+        except ValueError:
+            return str(v).strip()
+    if k in ("page", "size", "radius"):
+        try:
+            return str(int(v))
+        except ValueError:
+            return str(v).strip()
+    return re.sub(r"\s+", " ", str(v)).strip()
+
+
+def cache_key(url: str, params: dict) -> str:
+    """엔드포인트(path) + 정규화 파라미터 → SHA1 hex"""
+    endpoint = urlparse(url).path.rstrip("/")
+    items = [(k, _norm_value(k, params[k])) for k in _KEY_PARAMS if params.get(k) not in (None, "")]
+    raw = endpoint + "?" + "&".join(f"{k}={v}" for k, v in items)
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+
+class KakaoResponseCache:
+    """스레드 안전(단일 커넥션 + Lock). 비동기 수집기에서도 그대로 호출."""
+
+    def __init__(self, path: str, *, ttl_sec: float = DEFAULT_TTL_SEC, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.path = path
+        self.ttl_sec = ttl_sec
+        self.max_bytes = int(max_bytes)
+        self.hits = 0
+        self.misses = 0
+        self.expired = 0
+        self.evicted = 0
+        self._lock = threading.Lock()
+        self._touched = {}                   # key → 마지막 접근 시각 (미반영분)
+        self._closed = False
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS responses (
+                key         TEXT PRIMARY KEY,
+                endpoint    TEXT NOT NULL,
+                body        TEXT NOT NULL,
+                size        INTEGER NOT NULL,
+                created_at  REAL NOT NULL,
+                accessed_at REAL NOT NULL
+            )""")
+        self._conn.execute("CREATE INDEX IF NOT EXISTS ix_responses_accessed ON responses(accessed_at)")
+        self._conn.commit()
+        self._total_bytes = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        atexit.register(self.close)
+
+    def get(self, url: str, params: dict):
+        """캐시된 응답 JSON(dict) 또는 None"""
+        key = cache_key(url, params)
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute("SELECT body, size, created_at FROM responses WHERE key=?", (key,)).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            body, size, created_at = row
+            if self.ttl_sec is not None and now - created_at > self.ttl_sec:
+                self._conn.execute("DELETE FROM responses WHERE key=?", (key,))
+                self._conn.commit()
+                self._touched.pop(key, None)
+                self._total_bytes -= size
+                self.expired += 1
+                self.misses += 1
+                return None
+            self._touched[key] = now
+            if len(self._touched) >= TOUCH_FLUSH_EVERY:
+                self._flush_touched_locked()
+                self._conn.commit()
+            self.hits += 1
+        return json.loads(body)
+
+    def put(self, url: str, params: dict, payload: dict):
+        key = cache_key(url, params)
+        body = json.dumps(payload, ensure_ascii=False, separators=(",", ":"))
+        size = len(body.encode("utf-8"))
+        now = time.time()
+        with self._lock:
+            self._touched.pop(key, None)
+            self._flush_touched_locked()   # LRU 제거 전에 접근 시각 반영
+            old = self._conn.execute("SELECT size FROM responses WHERE key=?", (key,)).fetchone()
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses(key, endpoint, body, size, created_at, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (key, urlparse(url).path, body, size, now, now))
+            self._total_bytes += size - (old[0] if old else 0)
+            if self._total_bytes > self.max_bytes:
+                self._evict_locked()
+            self._conn.commit()
+
+    def _flush_touched_locked(self):
+        """모아 둔 접근 시각 반영 (commit은 호출 측)"""
+        if self._touched:
+            self._conn.executemany("UPDATE responses SET accessed_at=? WHERE key=?",
+                                   [(t, k) for k, t in self._touched.items()])
+            self._touched = {}
+
+    def _evict_locked(self):
+        """용량 상한의 90%까지 오래 안 쓴 항목부터 제거"""
+        target = int(self.max_bytes * 0.9)
+        rows = self._conn.execute("SELECT key, size FROM responses ORDER BY accessed_at ASC").fetchall()
+        drop = []
+        for key, size in rows:
+            if self._total_bytes <= target:
+                break
+            drop.append((key,))
+            self._total_bytes -= size
+        self._conn.executemany("DELETE FROM responses WHERE key=?", drop)
+        self.evicted += len(drop)
+
+    def purge_expired(self) -> int:
+        if self.ttl_sec is None:
+            return 0
+        with self._lock:
+            cur = self._conn.execute("DELETE FROM responses WHERE created_at < ?", (time.time() - self.ttl_sec,))
+            self._conn.commit()
+            self._total_bytes = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+            return cur.rowcount
+
+    def stats(self) -> dict:
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": (self.hits / total) if total else 0.0,
+            "expired": self.expired,
+            "evicted": self.evicted,
+            "bytes": self._total_bytes,
+        }
+
+    def summary(self) -> str:
+        st = self.stats()
+        return (f"hits={st['hits']} misses={st['misses']} ({st['hit_rate'] * 100:.1f}%), "
+                f"expired={st['expired']} evicted={st['evicted']} size={st['bytes'] / 1e6:.1f}MB")
+
+    def close(self):
+        """접근 시각 반영 후 닫기 (여러 번 호출해도 안전)"""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._flush_touched_locked()
+            self._conn.commit()
+            self._conn.close()
@@ -0,0 +1,293 @@
+# -*- coding: utf-8 -*-
+"""
+카카오 로컬 API 로컬 목서버 (API 키 없이 수집/지오코딩 성능 측정·회귀 확인용)
+- /v2/local/search/category.json, keyword.json, address.json
+- 천안 bbox(load_cheonan_boundary_shp, 실패 시 근사 bbox) 위 합성 POI
+- 실제와 같은 meta: total_count / pageable_count(최대 45페이지 × size) / is_end
+- 지연(latency) + 초당 처리 상한 초과 / 확률적 429 주입
+- 사용: KAKAO_API_BASE=http://127.0.0.1:8765 로 수집기/지오코더를 목서버로 전환
+"""
+
+import hashlib
+import json
+import os
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import numpy as np
+
+# =========================
+# 설정
+# =========================
+MOCK_HOST = "127.0.0.1"
+MOCK_PORT = 8765
+MOCK_SEED = 42
+
+CHEONAN_BBOX = (126.99, 36.67, 127.38, 36.99)   # SHP 로드 실패 시 근사 bbox (lon/lat)
+SHP_PATH = "./project2_cheonan_data/N3A_G0100000/N3A_G0100000.shp"
+
+# 그룹별 합성 POI 수 (도심 군집 → 일부 셀은 675건 초과로 4분할 유도)
+GROUP_SIZES = {"MT1": 900, "SC4": 300, "CT1": 2500, "PO3": 1600, "HP8": 1200}
+# 도심 군집 중심 (lon, lat, 표준편차)
+HOTSPOTS = [(127.152, 36.815, 0.020), (127.113, 36.800, 0.015), (127.146, 36.835, 0.018)]
+HOTSPOT_SHARE = 0.6
+
+# 그룹별 이름/카테고리 템플릿 (키워드 보강·필터 규칙이 실제처럼 걸리도록)
+NAME_TEMPLATES = {
+    "MT1": [("이마트", "가정,생활 > 대형마트"), ("백화점", "가정,생활 > 백화점"), ("마트", "가정,생활 > 슈퍼마켓")],
+    "SC4": [("대학교", "교육,학문 > 학교 > 대학교"), ("와플대학", "음식점 > 카페"), ("고등학교", "교육,학문 > 학교 > 고등학교")],
+    "CT1": [("도서관", "문화,예술 > 도서관"), ("미술관", "문화,예술 > 미술관"), ("공연장", "문화,예술 > 공연장")],
+    "PO3": [("행정복지센터", "사회,공공기관 > 행정복지센터"), ("우체국", "사회,공공기관 > 우체국"),
+            ("보건지소", "사회,공공기관 > 보건소"), ("우체국 택배 편의점", "가정,생활 > 편의점")],
+    "HP8": [("요양병원", "의료,건강 > 병원 > 요양병원"), ("재활병원", "의료,건강 > 병원 > 재활병원"),
+            ("종합병원", "의료,건강 > 병원 > 종합병원"), ("치과의원", "의료,건강 > 치과")],
+}
+
+PAGE_SIZE_MAX = 15
+MAX_PAGES = 45
+
+LATENCY_MS = 40.0          # 평균 응답 지연
+LATENCY_JITTER_MS = 20.0
+MAX_RPS = 30.0             # 초당 처리 상한 (초과 시 429), None이면 무제한
+P_429 = 0.0                # 확률적 429 (상한과 별개)
+ADDR_MISS_RATE = 0.1       # 주소 검색 결과 없음 비율 (쿼리 해시 기준, 재현 가능)
+
+
+def load_bbox(shp_path: str = SHP_PATH):
+    """천안 경계 bbox (SHP 없거나 로드 실패 시 CHEONAN_BBOX)"""
+    if shp_path and os.path.exists(shp_path):
+        try:
+            from project2_cheonan_crawling_by_categories2 import load_cheonan_boundary_shp
+            _, geom, _ = load_cheonan_boundary_shp(shp_path)
+            return tuple(geom.bounds)
+        except Exception as e:
+            print(f"[WARN] boundary load failed, using approx bbox: {e}")
+    return CHEONAN_BBOX
+
+
+# =========================
+# 합성 POI
+# =========================
+class SyntheticPOIs:
+    """그룹별 좌표/이름 배열. rect·query 필터는 numpy 마스크로 처리."""
+
+    def __init__(self, bbox, group_sizes=GROUP_SIZES, seed: int = MOCK_SEED):
+        rng = np.random.default_rng(seed)
+        minX, minY, maxX, maxY = bbox
+        ids, groups, names, cats, xs, ys = [], [], [], [], [], []
+        n_id = 0
+        for gc, n in group_sizes.items():
+            n_hot = int(n * HOTSPOT_SHARE)
+            hx = np.concatenate([rng.normal(cx, sd, n_hot // len(HOTSPOTS) + 1) for cx, _, sd in HOTSPOTS])[:n_hot]
+            hy = np.concatenate([rng.normal(cy, sd, n_hot // len(HOTSPOTS) + 1) for _, cy, sd in HOTSPOTS])[:n_hot]
+            ux = rng.uniform(minX, maxX, n - n_hot)
+            uy = rng.uniform(minY, maxY, n - n_hot)
+            gx = np.clip(np.concatenate([hx, ux]), minX, maxX)
+            gy = np.clip(np.concatenate([hy, uy]), minY, maxY)
+            templates = NAME_TEMPLATES.get(gc, [("장소", "기타")])
+            for k in range(n):
+                base, cat = templates[k % len(templates)]
+                n_id += 1
+                ids.append(str(10_000_000 + n_id))
+                groups.append(gc)
+                names.append(f"천안 {base} {k + 1}")
+                cats.append(cat)
+            xs.append(gx)
+            ys.append(gy)
+        self.ids = np.array(ids)
+        self.groups = np.array(groups)
+        self.names = names
+        self.cats = cats
+        self.x = np.concatenate(xs)
+        self.y = np.concatenate(ys)
+        self._query_idx = {}
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.ids)
+
+    def query_mask(self, query: str) -> np.ndarray:
+        with self._lock:
+            m = self._query_idx.get(query)
+            if m is None:
+                q = query.strip()
+                m = np.fromiter(((q in n) or (q in c) for n, c in zip(self.names, self.cats)),
+                                dtype=bool, count=len(self.names))
+                self._query_idx[query] = m
+        return m
+
+    def rect_mask(self, rect: str) -> np.ndarray:
+        x0, y0, x1, y1 = [float(t) for t in rect.split(",")]
+        x0, x1 = min(x0, x1), max(x0, x1)
+        y0, y1 = min(y0, y1), max(y0, y1)
+        return (self.x >= x0) & (self.x <= x1) & (self.y >= y0) & (self.y <= y1)
+
+    def doc(self, i: int, group_code: str = "") -> dict:
+        return {
+            "id": self.ids[i],
+            "place_name": self.names[i],
+            "category_name": self.cats[i],
+            "category_group_code": self.groups[i] if not group_code else group_code,
+            "x": f"{self.x[i]:.7f}",
+            "y": f"{self.y[i]:.7f}",
+            "address_name": f"충남 천안시 동남구 합성동 {int(self.ids[i]) % 900 + 1}",
+            "road_address_name": f"충남 천안시 동남구 합성로 {int(self.ids[i]) % 300 + 1}",
+            "place_url": f"http://place.map.kakao.com/{self.ids[i]}",
+        }
+
+
+# =========================
+# 요청 처리
+# =========================
+def _paginate(idx: np.ndarray, page: int, size: int):
+    total = int(len(idx))
+    pageable = min(total, size * MAX_PAGES)
+    start = (page - 1) * size
+    sel = idx[start:min(start + size, pageable)] if start < pageable else idx[:0]
+    meta = {"total_count": total, "pageable_count": pageable, "is_end": page * size >= pageable}
+    return sel, meta
+
+
+def _addr_point(query: str, bbox):
+    """쿼리 해시 → bbox 내부 결정적 좌표 (ADDR_MISS_RATE 비율은 결과 없음)"""
+    h = int(hashlib.sha1(query.encode("utf-8")).hexdigest()[:12], 16)
+    if (h % 1000) / 1000.0 < ADDR_MISS_RATE:
+        return None
+    minX, minY, maxX, maxY = bbox
+    fx = ((h >> 10) % 100000) / 100000.0
+    fy = ((h >> 27) % 100000) / 100000.0
+    return minX + fx * (maxX - minX), minY + fy * (maxY - minY)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server_version = "KakaoMock/1.0"
+
+    def log_message(self, fmt, *args):  # 요청 로그 생략
+        pass
+
+    def _send(self, status: int, payload: dict):
+        body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json;charset=UTF-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        srv = self.server
+        u = urlparse(self.path)
+        params = {k: v[-1] for k, v in parse_qs(u.query).items()}
+        endpoint = u.path.rsplit("/", 1)[-1]
+
+        if srv.latency_ms > 0:
+            time.sleep(max(0.0, random.gauss(srv.latency_ms, srv.latency_jitter_ms)) / 1000.0)
+        if srv.throttle() or (srv.p_429 > 0 and random.random() < srv.p_429):
+            srv.count("429")
+            return self._send(429, {"errorType": "RateLimitExceeded", "message": "API limit has been exceeded."})
+        srv.count(endpoint)
+
+        try:
+            page = max(1, int(params.get("page", 1)))
+            size = min(PAGE_SIZE_MAX, max(1, int(params.get("size", PAGE_SIZE_MAX))))
+        except ValueError:
+            return self._send(400, {"errorType": "InvalidArgument", "message": "page/size"})
+
+        pois = srv.pois
+        if endpoint == "category.json":
+            gc = params.get("category_group_code", "")
+            if not gc or "rect" not in params:
+                return self._send(400, {"errorType": "InvalidArgument", "message": "category_group_code/rect"})
+            idx = np.flatnonzero((pois.groups == gc) & pois.rect_mask(params["rect"]))
+            sel, meta = _paginate(idx, page, size)
+            return self._send(200, {"meta": meta, "documents": [pois.doc(i) for i in sel]})
+
+        if endpoint == "keyword.json":
+            q = params.get("query", "")
+            if not q:
+                return self._send(400, {"errorType": "InvalidArgument", "message": "query"})
+            m = pois.query_mask(q)
+            if "rect" in params:
+                m = m & pois.rect_mask(params["rect"])
+            idx = np.flatnonzero(m)
+            sel, meta = _paginate(idx, page, size)
+            return self._send(200, {"meta": meta, "documents": [pois.doc(i) for i in sel]})
+
+        if endpoint == "address.json":
+            q = params.get("query", "")
+            pt = _addr_point(q, srv.bbox) if q else None
+            docs = []
+            if pt is not None:
+                x, y = f"{pt[0]:.7f}", f"{pt[1]:.7f}"
+                docs.append({
+                    "address_name": q, "address_type": "REGION_ADDR", "x": x, "y": y,
+                    "address": {"address_name": q, "x": x, "y": y},
+                    "road_address": {"address_name": q, "x": x, "y": y},
+                })
+            meta = {"total_count": len(docs), "pageable_count": len(docs), "is_end": True}
+            return self._send(200, {"meta": meta, "documents": docs})
+
+        return self._send(404, {"errorType": "NotFound", "message": u.path})
+
+
+class KakaoMockServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, host: str = MOCK_HOST, port: int = MOCK_PORT, *, bbox=None, group_sizes=GROUP_SIZES,
+                 seed: int = MOCK_SEED, latency_ms: float = LATENCY_MS, latency_jitter_ms: float = LATENCY_JITTER_MS,
+                 max_rps: float = MAX_RPS, p_429: float = P_429):
+        super().__init__((host, port), _Handler)
+        self.bbox = tuple(bbox) if bbox is not None else load_bbox()
+        self.pois = SyntheticPOIs(self.bbox, group_sizes, seed)
+        self.latency_ms = float(latency_ms)
+        self.latency_jitter_ms = float(latency_jitter_ms)
+        self.max_rps = max_rps
+        self.p_429 = float(p_429)
+        self.counts = {}
+        self._lock = threading.Lock()
+        self._window = []   # 최근 1초 처리 시각 (슬라이딩 윈도)
+        random.seed(seed)
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def count(self, key: str):
+        with self._lock:
+            self.counts[key] = self.counts.get(key, 0) + 1
+
+    def throttle(self) -> bool:
+        """최근 1초 요청 수가 max_rps 이상이면 True(429)"""
+        if not self.max_rps:
+            return False
+        now = time.monotonic()
+        with self._lock:
+            self._window = [t for t in self._window if now - t < 1.0]
+            if len(self._window) >= self.max_rps:
+                return True
+            self._window.append(now)
+            return False
+
+    def reset_counts(self):
+        with self._lock:
+            self.counts = {}
+
+
+def serve_in_thread(port: int = 0, **kwargs) -> KakaoMockServer:
+    """백그라운드 스레드로 목서버 실행 (port=0 → 빈 포트 자동). 종료: server.shutdown()"""
+    server = KakaoMockServer(MOCK_HOST, port, **kwargs)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+if __name__ == "__main__":
+    server = KakaoMockServer(MOCK_HOST, MOCK_PORT)
+    print(f"[INFO] Kakao mock server: {server.base_url} ({len(server.pois)} POIs, bbox={server.bbox})")
+    print(f"[INFO] export KAKAO_API_BASE={server.base_url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        server.shutdown()
@@ -0,0 +1,164 @@
+# -*- coding: utf-8 -*-
+"""
+정규화된 입력 로더 결과 디스크 캐시 (원본 CSV/XLSX 지문 기준)
+- 지문: 원본 파일 크기 + 수정 시각(ns) + 내용 해시(blake2b)
+  크기·시각이 같으면 해시 생략, 시각만 바뀌고 내용이 같으면(복사/touch) 캐시 그대로 사용
+- 값: 로더가 돌려준 정규화 DataFrame (dtype/인덱스 유지)
+  pyarrow 있으면 무압축 Feather(메모리 맵 읽기), 없거나 변환 불가한 열이면 pickle
+- 로더 코드가 바뀌면 version 을 올려 무효화
+"""
+
+import functools
+import hashlib
+import inspect
+import json
+import os
+
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    from pyarrow import feather
+except ImportError:
+    pa = None
+
+_HASH_CHUNK = 1 << 20
+
+
+def _file_hash(path: str) -> str:
+    h = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(_HASH_CHUNK), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def _stat(path: str) -> dict:
+    st = os.stat(path)
+    return {"path": os.path.abspath(path), "size": st.st_size, "mtime_ns": st.st_mtime_ns}
+
+
+class LoaderCache:
+    """
+    cache = LoaderCache(dir)
+    @cache.cached("public_parking", version=1)
+    def load_public_parking(csv_path): ...
+    - 경로 인자(기본: 이름이 _path 로 끝나는 인자, paths=로 지정) = 원본 파일 (없는 파일이면 캐시 없이 원래 로더 실행)
+    - 나머지 인자 = 로더 옵션 (위치/키워드 무관, 값별로 따로 캐시)
+    """
+
+    def __init__(self, cache_dir: str, *, enabled: bool = True):
+        self.cache_dir = cache_dir
+        self.enabled = enabled
+        self.hits = 0
+        self.misses = 0
+
+    def _paths(self, name: str, sources: list):
+        key = hashlib.sha1("|".join(s["path"] for s in sources).encode("utf-8")).hexdigest()[:12]
+        base = os.path.join(self.cache_dir, f"{name}-{key}")
+        return base + ".json", base
+
+    def _fresh(self, meta: dict, sources: list, version: int):
+        """
+        메타의 원본 지문과 현재 파일 비교 → False(무효) | True | "touched"(시각만 바뀜, 메타 갱신 필요)
+        """
+        if meta.get("version") != version or len(meta.get("sources", [])) != len(sources):
+            return False
+        touched = False
+        for old, cur in zip(meta["sources"], sources):
+            if old["path"] != cur["path"] or old["size"] != cur["size"]:
+                return False
+            if old["mtime_ns"] != cur["mtime_ns"]:
+                if old.get("hash") != _file_hash(cur["path"]):
+                    return False
+                old["mtime_ns"] = cur["mtime_ns"]
+                touched = True
+        return "touched" if touched else True
+
+    def _read(self, base: str, fmt: str) -> pd.DataFrame:
+        if fmt == "feather":
+            return feather.read_table(base + ".feather", memory_map=True).to_pandas()
+        return pd.read_pickle(base + ".pkl")
+
+    def _write(self, base: str, df: pd.DataFrame) -> str:
+        if pa is not None:
+            try:
+                table = pa.Table.from_pandas(df, preserve_index=True)
+                feather.write_feather(table, base + ".feather.tmp", compression="uncompressed")
+                os.replace(base + ".feather.tmp", base + ".feather")
+                return "feather"
+            except (pa.ArrowException, TypeError, ValueError):
+                pass   # 혼합 타입 object 열 등 → pickle
+        df.to_pickle(base + ".pkl.tmp")
+        os.replace(base + ".pkl.tmp", base + ".pkl")
+        return "pickle"
+
+    def load(self, name: str, source_paths, build, *, version: int = 1) -> pd.DataFrame:
+        """원본이 그대로면 캐시 DataFrame, 아니면 build() 결과를 저장 후 반환"""
+        source_paths = [str(p) for p in source_paths]
+        if not self.enabled or not all(os.path.isfile(p) for p in source_paths):
+            return build()
+        sources = [_stat(p) for p in source_paths]
+        meta_path, base = self._paths(name, sources)
+
+        if os.path.exists(meta_path):
+            try:
+                with open(meta_path, "r", encoding="utf-8") as f:
+                    meta = json.load(f)
+                fresh = self._fresh(meta, sources, version)
+                if fresh:
+                    df = self._read(base, meta["format"])
+                    if fresh == "touched":
+                        self._save_meta(meta_path, meta)
+                    self.hits += 1
+                    return df
+            except Exception as e:   # 손상/호환 안 되는 캐시 → 다시 생성
+                print(f"[WARN] Loader cache read failed ({name}): {e}")
+
+        self.misses += 1
+        df = build()
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            for s in sources:
+                s["hash"] = _file_hash(s["path"])
+            fmt = self._write(base, df)
+            self._save_meta(meta_path, {"version": version, "format": fmt, "sources": sources})
+        except OSError as e:
+            print(f"[WARN] Loader cache write failed ({name}): {e}")
+        return df
+
+    @staticmethod
+    def _save_meta(meta_path: str, meta: dict):
+        with open(meta_path + ".tmp", "w", encoding="utf-8") as f:
+            json.dump(meta, f, ensure_ascii=False, indent=1)
+        os.replace(meta_path + ".tmp", meta_path)
+
+    def cached(self, name: str, *, version: int = 1, paths=None):
+        """
+        로더 데코레이터: 인자를 로더 시그니처에 바인딩해 경로 인자만 원본 지문으로,
+        나머지(기간 등, 기본값 포함)는 값 그대로 캐시 키에 포함
+        """
+        def deco(fn):
+            sig = inspect.signature(fn)
+            path_params = tuple(paths) if paths is not None else tuple(p for p in sig.parameters if p.endswith("_path"))
+            unknown = [p for p in path_params if p not in sig.parameters]
+            if unknown:
+                raise ValueError(f"{fn.__name__}: 경로 인자 {unknown} 이(가) 시그니처에 없습니다.")
+
+            @functools.wraps(fn)
+            def wrapper(*args, **kwargs):
+                bound = sig.bind(*args, **kwargs)
+                bound.apply_defaults()
+                sources = [bound.arguments[p] for p in path_params]
+                options = {k: v for k, v in bound.arguments.items() if k not in path_params}
+                key = name
+                if options:
+                    raw = json.dumps(options, sort_keys=True, default=str)
+                    key = f"{name}-{hashlib.sha1(raw.encode('utf-8')).hexdigest()[:8]}"
+                return self.load(key, sources, lambda: fn(*bound.args, **bound.kwargs), version=version)
+            wrapper.uncached = fn
+            return wrapper
+        return deco
+
+    def summary(self) -> str:
+        return f"hits={self.hits} misses={self.misses}, format={'feather' if pa is not None else 'pickle'}"
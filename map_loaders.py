@@ -0,0 +1,126 @@
+# -*- coding: utf-8 -*-
+"""
+주차장 지도 공용 로더 (intro-dashboard cheonan_mapping_core / project2 크롤러 공용)
+- 카카오 GET: 응답 캐시 우선 (kakao_get_json)
+- 민영주차장: XLSX 정규화(read_private_parking) → 고유 주소만 비동기 일괄 지오코딩(geocode_private_parking)
+- 카카오 응답 캐시·공용 지오코딩 저장소는 첫 사용 때 연다 (import 만으로 SQLite 파일을 만들지 않음)
+- 교통량 통계: 교통량 큐브(traffic_cube)로 교차로별 기간 일평균
+"""
+
+import os
+import threading
+
+import pandas as pd
+
+from geocode_store import DEFAULT_STORE_PATH, open_shared_store
+from kakao_geocoder import PRECISE_SOURCES
+from kakao_geocoder_async import geocode_many
+from kakao_http_cache import KakaoResponseCache
+from traffic_cube import load_traffic_cube
+
+_SHARED = {}
+_SHARED_LOCK = threading.Lock()
+
+
+# =========================
+# 카카오 GET / 응답 캐시 / 지오코딩 저장소
+# =========================
+def _shared(key, factory):
+    """key별 첫 호출에서 factory()로 만들고, 이후 같은 객체 반환 (프로세스당 1개)"""
+    with _SHARED_LOCK:
+        obj = _SHARED.get(key)
+        if obj is None:
+            obj = _SHARED[key] = factory()
+        return obj
+
+
+def kakao_get_json(fetch, url, params, headers, cache=None):
+    """응답 캐시 우선, 없으면 fetch(url, params, headers) 응답을 JSON으로 저장"""
+    if cache is not None:
+        cached = cache.get(url, params)
+        if cached is not None:
+            return cached
+    payload = fetch(url, params, headers).json()
+    if cache is not None:
+        cache.put(url, params, payload)
+    return payload
+
+
+def shared_http_cache(path: str, **cache_kw) -> KakaoResponseCache:
+    """카카오 응답 캐시: 경로별 첫 호출에서 생성 (cache_kw: ttl_sec, max_bytes)"""
+    return _shared(("http_cache", os.path.abspath(path)), lambda: KakaoResponseCache(path, **cache_kw))
+
+
+def shared_geocode_store(extra_legacy=(), path: str = DEFAULT_STORE_PATH):
+    """공용 지오코딩 저장소: 경로별 첫 호출에서 열고(기존 JSON 캐시 이관) 이후 같은 객체 반환"""
+    return _shared(("geocode_store", os.path.abspath(path)), lambda: open_shared_store(path, extra_legacy=extra_legacy))
+
+
+# =========================
+# 민영주차장
+# =========================
+def read_private_parking(xlsx_path: str) -> pd.DataFrame:
+    """민영주차장 XLSX → name/road_address/jibun_address/query (지오코딩 전 단계, LoaderCache 대상)"""
+    dfm = pd.read_excel(xlsx_path)
+    rename = {}
+    if "주차장명" in dfm.columns: rename["주차장명"]="name"
+    if "소재지도로명주소" in dfm.columns: rename["소재지도로명주소"]="road_address"
+    if "소재지지번주소" in dfm.columns: rename["소재지지번주소"]="jibun_address"
+    dfm = dfm.rename(columns=rename)
+    # 도로명 주소 우선, 없으면 지번 주소 → 고유 주소만 일괄 지오코딩
+    road = dfm["road_address"].fillna("").astype(str).str.strip() if "road_address" in dfm.columns else pd.Series("", index=dfm.index)
+    jibun = dfm["jibun_address"].fillna("").astype(str).str.strip() if "jibun_address" in dfm.columns else pd.Series("", index=dfm.index)
+    dfm["query"] = road.where(road != "", jibun)
+    return dfm[["name","road_address","jibun_address","query"]]
+
+
+def geocode_addresses(queries, *, headers, store, rate, max_in_flight, cache=None):
+    """
+    주소 열 → (lon, lat) Series (입력 순서 유지)
+    - 중복/빈 주소 제거 → 저장소 일괄 조회 → 미스만 토큰버킷 아래 동시 조회 (센트로이드 대체값 제외)
+    """
+    q = pd.Series(queries, dtype=object).fillna("").astype(str).str.strip()
+    found = geocode_many(q.unique(), headers=headers, store=store, rate=rate,
+                         max_in_flight=max_in_flight, centroid_fallback=False,
+                         sources=PRECISE_SOURCES, cache=cache)
+    coords = pd.DataFrame.from_dict(found, orient="index", columns=["lat", "lon"], dtype=float)
+    return q.map(coords["lon"]).astype(float), q.map(coords["lat"]).astype(float)
+
+
+def geocode_private_parking(dfm: pd.DataFrame, **geocode_kw) -> pd.DataFrame:
+    """read_private_parking 결과 → 지오코딩 + 공통 스키마 (geocode_kw: geocode_addresses 인자)"""
+    dfm = dfm.copy()
+    lon, lat = geocode_addresses(dfm["query"], **geocode_kw)
+    dfm["lon"] = lon.to_numpy(); dfm["lat"] = lat.to_numpy()
+    dfm["category"] = "민영주차장"
+    dfm["source"] = "천안시/민영"
+    dfm["id"] = "private_" + dfm.index.astype(str)
+    return dfm[["id","name","lat","lon","road_address","jibun_address","category","source"]]
+
+
+# =========================
+# 교통량 통계
+# =========================
+def load_traffic_stats(csv_path: str, start: str = "2025-07-01", end: str = "2025-07-31", *,
+                       weekdays=None, hours=None, cube_path: str = None):
+    """
+    스마트교차로_통계.csv → 기간(기본 7월 2025-07-01~31) 교차로명별 일평균
+    - 교통량 큐브(.npz, 기본: CSV와 같은 폴더의 traffic_cube.npz)는 원본 CSV가 바뀔 때만 다시 만들고,
+      평균은 큐브의 mean_flow로 계산 (실행마다 CSV 전체를 다시 읽지 않음)
+    - weekdays(0=월~6=일)/hours(0~23): 요일·시간대 한정 (예: traffic_cube.WEEKDAYS, traffic_cube.PEAK_HOURS)
+    """
+    if cube_path is None:
+        cube_path = os.path.join(os.path.dirname(csv_path), "traffic_cube.npz")
+    cube = load_traffic_cube(csv_path, cube_path)
+    window = dict(start=start, end=end, weekdays=weekdays, hours=hours)
+    totals = cube.window_totals(**window)
+    mean = cube.mean_flow(**window)
+    keep = totals["count"].to_numpy() > 0       # 기간 안에 기록이 있는 교차로만
+    # 교차로명별 기간 일평균 (열 이름은 기존 7월 기준 이름 유지)
+    grp = pd.DataFrame({
+        "교차로명": totals.index[keep],
+        "july_mean": mean.to_numpy()[keep],
+        "july_sum": totals["sum"].to_numpy()[keep],
+        "days": totals["count"].to_numpy()[keep].astype(int),
+    })
+    return grp  # columns: 교차로명, july_mean, july_sum, days
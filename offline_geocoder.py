@@ -0,0 +1,172 @@
+# -*- coding: utf-8 -*-
+"""
+오프라인 퍼지 지오코더 (이미 해결된 주소 → 좌표 쌍 재사용, 네트워크 불필요)
+- 색인 원천: 공용 지오코딩 저장소의 정밀 결과(address/keyword/legacy)
+  (CSV는 좌표 출처 열이 있을 때만, 정밀 출처 행만 색인 → 센트로이드 대체 좌표가 퍼지 결과로 퍼지지 않도록)
+- 정규 주소(address_key) 문자열의 3-gram 역색인으로 후보 추출 → 문자열 유사도로 신뢰도(0~1) 산출
+  (rapidfuzz 설치 시 fuzz.ratio, 없으면 difflib)
+- 구조 가드: 행정구역·도로명·본번 중 하나라도 다르면 후보 제외, 부번만 다르면 감점
+- 신뢰도가 임계값 이상인 쿼리만 오프라인 좌표 사용, 나머지만 카카오 API로
+"""
+
+import os
+from difflib import SequenceMatcher
+
+import pandas as pd
+
+from address_key import canonical_key, parse_address
+from csv_sniff import read_csv_auto
+from geocode_store import GeocodeStore, KIND_QUERY, SOURCE_ADDRESS, SOURCE_KEYWORD, SOURCE_LEGACY
+
+try:
+    from rapidfuzz import fuzz
+except ImportError:
+    fuzz = None
+
+FUZZY_THRESHOLD = 0.90
+FUZZY_SUB_PENALTY = 0.95      # 본번 같고 부번만 다를 때 신뢰도 배율
+INDEX_SOURCES = (SOURCE_ADDRESS, SOURCE_KEYWORD, SOURCE_LEGACY)   # 센트로이드/퍼지 결과는 색인하지 않음
+
+_NGRAM = 3
+_MAX_POSTINGS = 3000          # 너무 흔한 n-gram(예: 동 이름)은 후보 추출에서 제외
+_TOP_CANDIDATES = 20
+
+
+def _text(p: dict) -> str:
+    """분해 결과 → 색인 문자열 (공백 없이 행정구역+도로명+번지+건물명)"""
+    return (p["admin"] + p["road"] + p["number"] + p["building"]).replace(" ", "")
+
+
+def _ngrams(text: str) -> set:
+    t = f" {text} "
+    return {t[i:i + _NGRAM] for i in range(max(len(t) - _NGRAM + 1, 1))}
+
+
+def _similarity(a: str, b: str) -> float:
+    if fuzz is not None:
+        return fuzz.ratio(a, b) / 100.0
+    return SequenceMatcher(None, a, b).ratio()
+
+
+def _split_number(number: str):
+    main, _, sub = number.partition("-")
+    return main, sub
+
+
+class OfflineGeocoder:
+    """
+    add()/add_store()/add_csv()로 색인 후 lookup()/match()로 조회
+    - lookup(q) → (lat, lng, score, 매칭 쿼리) | (None, None, 0.0, None)
+    """
+
+    def __init__(self, threshold: float = FUZZY_THRESHOLD):
+        self.threshold = float(threshold)
+        self._texts = []
+        self._parts = []
+        self._coords = []
+        self._queries = []
+        self._exact = {}         # 정규 키 → 행
+        self._postings = {}      # n-gram → [행]
+
+    def __len__(self):
+        return len(self._texts)
+
+    def add(self, query: str, lat, lng) -> bool:
+        if lat is None or lng is None or pd.isna(lat) or pd.isna(lng):
+            return False
+        key = canonical_key(query)
+        if not key or key in self._exact:
+            return False
+        p = parse_address(query)
+        row = len(self._texts)
+        self._exact[key] = row
+        self._texts.append(_text(p))
+        self._parts.append(p)
+        self._coords.append((float(lat), float(lng)))
+        self._queries.append(str(query))
+        for g in _ngrams(self._texts[row]):
+            self._postings.setdefault(g, []).append(row)
+        return True
+
+    def add_store(self, store: GeocodeStore, sources=INDEX_SOURCES) -> int:
+        """저장소의 정밀 결과(ok, sources) 색인. 반환: 추가 건수"""
+        n = 0
+        for query, lat, lng, source in store.iter_ok(kind=KIND_QUERY):
+            if source in sources:
+                n += self.add(query, lat, lng)
+        return n
+
+    def add_csv(self, path: str, query_col: str = "쿼리주소", lat_col: str = "위도", lng_col: str = "경도",
+                source_col: str = "좌표출처", sources=INDEX_SOURCES) -> int:
+        """
+        쿼리/좌표/출처 CSV 색인 (출처가 sources인 행만)
+        - 출처 열이 없으면(예: 2_02 결과 CSV, 센트로이드 대체 좌표가 섞임) 건너뜀
+        """
+        if not os.path.exists(path):
+            return 0
+        df = read_csv_auto(path)
+        if not {query_col, lat_col, lng_col}.issubset(df.columns):
+            return 0
+        if source_col not in df.columns:
+            print(f"[WARN] Offline geocoder: {path}에 '{source_col}' 열이 없어 색인하지 않음")
+            return 0
+        df = df[df[source_col].isin(sources)]
+        df = df[[query_col, lat_col, lng_col]].dropna().drop_duplicates(subset=[query_col])
+        return sum(self.add(q, lat, lng) for q, lat, lng in df.itertuples(index=False))
+
+    def _candidates(self, grams: set) -> list:
+        counts = {}
+        for g in grams:
+            rows = self._postings.get(g)
+            if rows is None or len(rows) > _MAX_POSTINGS:
+                continue
+            for r in rows:
+                counts[r] = counts.get(r, 0) + 1
+        return sorted(counts, key=counts.get, reverse=True)[:_TOP_CANDIDATES]
+
+    def lookup(self, query: str):
+        key = canonical_key(query)
+        if not key:
+            return None, None, 0.0, None
+        row = self._exact.get(key)
+        if row is not None:
+            lat, lng = self._coords[row]
+            return lat, lng, 1.0, self._queries[row]
+
+        p = parse_address(query)
+        text = _text(p)
+        q_main, q_sub = _split_number(p["number"])
+        best, best_score = None, 0.0
+        for r in self._candidates(_ngrams(text)):
+            c = self._parts[r]
+            if p["admin"] and c["admin"] and p["admin"] != c["admin"]:
+                continue
+            if p["road"] and c["road"] and p["road"] != c["road"]:
+                continue
+            c_main, c_sub = _split_number(c["number"])
+            if (q_main or c_main) and q_main != c_main:
+                continue
+            score = _similarity(text, self._texts[r])
+            if q_sub != c_sub:
+                score *= FUZZY_SUB_PENALTY
+            if score > best_score:
+                best, best_score = r, score
+        if best is None:
+            return None, None, 0.0, None
+        lat, lng = self._coords[best]
+        return lat, lng, best_score, self._queries[best]
+
+    def match(self, query: str):
+        """신뢰도 임계값 이상이면 (lat, lng), 아니면 (None, None)"""
+        lat, lng, score, _ = self.lookup(query)
+        return (lat, lng) if score >= self.threshold else (None, None)
+
+
+def build_offline_geocoder(store: GeocodeStore, csv_paths=(), threshold: float = FUZZY_THRESHOLD) -> OfflineGeocoder:
+    """저장소 정밀 결과 (+ 출처 열이 있는 CSV)로 색인 구성"""
+    geo = OfflineGeocoder(threshold)
+    n_store = geo.add_store(store)
+    n_csv = sum(geo.add_csv(p) for p in csv_paths)
+    print(f"[INFO] Offline geocoder: {len(geo)} addresses (store {n_store}, csv {n_csv}), "
+          f"scorer={'rapidfuzz' if fuzz is not None else 'difflib'}, threshold={geo.threshold}")
+    return geo
@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+"""
+수집 POI 컬럼형 누적기
+- 원본 카카오 문서(dict) 전체를 보관하지 않고 필요한 필드만 추출해 컬럼 배열에 추가
+  (id, name, x/y float64, 도로명/지번 주소, url, category_name, 그룹 비트마스크)
+- id → 행 번호 해시 인덱스로 중복 제거 (중복 id는 그룹 비트만 OR)
+- to_frame(): 행 단위 파이썬 변환 없이 DataFrame 생성
+"""
+
+import numpy as np
+import pandas as pd
+
+_STR_FIELDS = (
+    ("name", "place_name"),
+    ("road_address", "road_address_name"),
+    ("jibun_address", "address_name"),
+    ("url", "place_url"),
+    ("category_name", "category_name"),
+)
+
+
+def _to_float(v) -> float:
+    try:
+        return float(v)
+    except (TypeError, ValueError):
+        return np.nan
+
+
+class POIAccumulator:
+    """
+    tags: 그룹 태그 목록 (비트 순서 = 정렬 순서 → group_code는 가장 앞선 태그, 기존 sorted(_groups)[0]과 동일)
+    """
+
+    def __init__(self, tags, capacity: int = 4096):
+        self.tags = sorted(set(tags))
+        if len(self.tags) > 32:
+            raise ValueError("too many group tags (max 32)")
+        self._bit = {t: np.uint32(1 << i) for i, t in enumerate(self.tags)}
+        self._index = {}
+        self._ids = []
+        self._str = {col: [] for col, _ in _STR_FIELDS}
+        self._x = np.empty(capacity, dtype=np.float64)
+        self._y = np.empty(capacity, dtype=np.float64)
+        self._groups = np.zeros(capacity, dtype=np.uint32)
+        self._n = 0
+
+    def __len__(self):
+        return self._n
+
+    def _grow(self):
+        cap = max(1, len(self._x)) * 2
+        self._x = np.resize(self._x, cap)
+        self._y = np.resize(self._y, cap)
+        groups = np.zeros(cap, dtype=np.uint32)
+        groups[:self._n] = self._groups[:self._n]
+        self._groups = groups
+
+    def add(self, doc: dict, tag: str) -> bool:
+        """문서 1건 추가. 새 행이거나 기존 행에 새 태그가 붙으면 True"""
+        pid = doc.get("id")
+        if not pid:
+            return False
+        bit = self._bit[tag]
+        row = self._index.get(pid)
+        if row is not None:
+            if self._groups[row] & bit:
+                return False
+            self._groups[row] |= bit
+            return True
+
+        if self._n == len(self._x):
+            self._grow()
+        row = self._n
+        self._index[pid] = row
+        self._ids.append(pid)
+        for col, key in _STR_FIELDS:
+            self._str[col].append(doc.get(key, "") or "")
+        self._x[row] = _to_float(doc.get("x"))
+        self._y[row] = _to_float(doc.get("y"))
+        self._groups[row] = bit
+        self._n += 1
+        return True
+
+    def add_docs(self, docs, tag: str) -> int:
+        """여러 문서 추가. 반환: 새로 병합된 건수(신규 행 + 새 태그)"""
+        return sum(self.add(d, tag) for d in docs)
+
+    def group_codes(self) -> np.ndarray:
+        """행별 대표 그룹 (비트마스크 최하위 비트 → 태그)"""
+        mask = self._groups[:self._n]
+        low = mask & (~mask + np.uint32(1))
+        idx = np.zeros(self._n, dtype=np.int64)
+        nz = low > 0
+        idx[nz] = np.log2(low[nz]).astype(np.int64)
+        out = np.asarray(self.tags, dtype=object)[idx]
+        out[~nz] = None
+        return out
+
+    def to_frame(self) -> pd.DataFrame:
+        n = self._n
+        return pd.DataFrame({
+            "id": self._ids,
+            "name": self._str["name"],
+            "lon": self._x[:n].copy(),
+            "lat": self._y[:n].copy(),
+            "road_address": self._str["road_address"],
+            "jibun_address": self._str["jibun_address"],
+            "url": self._str["url"],
+            "category_name": self._str["category_name"],
+            "group_code": self.group_codes(),
+        })
@@ -20,8 +20,8 @@ Cheonan (Category-based) POI + Parking + Traffic Sensors + Boundary Map (VWorld
 """
 
 import os
+import sys
 import time
-import json
 import re
 import pandas as pd
 import numpy as np
@@ -38,6 +38,19 @@ import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
+from kakao_async import make_job, run_crawl_jobs, docs_inside_polygon
+from kakao_api import KAKAO_KEYWORD_URL
+from loader_cache import LoaderCache
+from boundary_cache import read_cheonan_features
+from csv_sniff import read_csv_auto
+from map_loaders import (
+    kakao_get_json, shared_http_cache, shared_geocode_store,
+    read_private_parking, geocode_private_parking, load_traffic_stats,
+)
+from crawl_journal import CrawlJournal
+from crawl_delta import latest_snapshot, diff_poi_snapshots
+from poi_accumulator import POIAccumulator
+
 # =========================
 # 설정
 # =========================
@@ -55,15 +68,16 @@ if REBUILD_MAP and not VWORLD_KEY:
     raise RuntimeError("REBUILD_MAP=True인데 환경변수 VWORLD_API_KEY가 비어있습니다.")
 
 HEADERS = {"Authorization": f"KakaoAK {KAKAO_REST_KEY}"} if KAKAO_REST_KEY else {}
-KAKAO_CAT_URL  = "https://dapi.kakao.com/v2/local/search/category.json"
-KAKAO_ADDR_URL = "https://dapi.kakao.com/v2/local/search/address.json"
-KAKAO_KEYWORD_URL = "https://dapi.kakao.com/v2/local/search/keyword.json"
 
 PAGE_SIZE = 15
 MAX_PAGES = 45
 MAX_FETCHABLE = PAGE_SIZE * MAX_PAGES  # 675
 SLEEP_SEC = 0.25
 GEOCODE_SLEEP_SEC = 0.2
+GEOCODE_RPS = 1.0 / GEOCODE_SLEEP_SEC   # 일괄 지오코딩: 초당 요청 상한(토큰버킷)
+GEOCODE_MAX_IN_FLIGHT = 4              # 일괄 지오코딩: 동시 요청 상한
+KAKAO_RPS = 8.0        # 비동기 수집: 초당 요청 상한(토큰버킷)
+MAX_IN_FLIGHT = 16     # 비동기 수집: 동시 요청 상한
 
 # 안정적 세션
 SESSION = requests.Session()
@@ -81,6 +95,18 @@ PRIVATE_PARKING_XLSX = "./project2_cheonan_data/충청남도_천안시_민영주
 SENSORS_CSV = "./project2_cheonan_data/천안_교차로_행정동_정확매핑.csv"
 TRAFFIC_STATS_CSV = "./project2_cheonan_data/스마트교차로_통계.csv"
 
+# 카카오 검색 밀도 쿼드트리 (셀별 675건 이하 리프 타일 캐시)
+QUADTREE_PATH = os.path.join(SAVE_DIR, "crawl_quadtree.json")
+
+# 수집 저널 (완료 단위 append 기록 → 중단 시 이어서 수집, 정상 종료 시 삭제)
+CRAWL_JOURNAL_PATH = os.path.join(SAVE_DIR, "crawl_journal.jsonl")
+
+# 증분 수집: 리프 타일 total_count가 직전과 같으면 저장 문서 재사용 (첫 실행은 전체 수집)
+# 기본 꺼짐 (1페이지는 응답 캐시를 건너뛰고 새로 받으므로 캐시가 유효한 재실행에서는 오히려 요청이 늘어남)
+# → 변경분 반영이 필요할 때 `--delta` 로 실행
+DELTA_CRAWL = False
+TILE_SNAPSHOT_PATH = os.path.join(SAVE_DIR, "crawl_tiles.json")
+
 # 지도 중심
 MAP_CENTER_LAT, MAP_CENTER_LON = 36.815, 127.147
 MAP_ZOOM = 12
@@ -94,15 +120,23 @@ BOUNDARY_LINE_WEIGHT = 3.5
 DN_COLOR = "#BA2FE5"   # 동남구: 밝은 보라 (가시성 ↑)
 SB_COLOR = "#FF5722"   # 서북구: 강한 주황 (전체 경계와 확실한 대비)
 
-# 지오코딩 캐시
-GEOCODE_CACHE_PATH = os.path.join(SAVE_DIR, "geocode_cache.json")
-_geocode_cache = {}
-if os.path.exists(GEOCODE_CACHE_PATH):
-    try:
-        with open(GEOCODE_CACHE_PATH, "r", encoding="utf-8") as f:
-            _geocode_cache = json.load(f)
-    except Exception:
-        _geocode_cache = {}
+# 카카오 API 응답 캐시 (SQLite, TTL + 용량 상한) → 첫 카카오 호출 때 생성 (import 시 파일 생성 없음)
+HTTP_CACHE_PATH = os.path.join(SAVE_DIR, "kakao_http_cache.sqlite")
+HTTP_CACHE_TTL_SEC = 7 * 24 * 3600
+HTTP_CACHE_MAX_BYTES = 512 * 1024 * 1024
+def _http_cache():
+    return shared_http_cache(HTTP_CACHE_PATH, ttl_sec=HTTP_CACHE_TTL_SEC, max_bytes=HTTP_CACHE_MAX_BYTES)
+
+# 입력 로더 결과 캐시 (원본 CSV/XLSX 크기·수정시각·해시가 같으면 정규화 결과를 그대로 읽음)
+LOADER_CACHE_DIR = os.path.join(SAVE_DIR, "loader_cache")
+LOADER_CACHE = LoaderCache(LOADER_CACHE_DIR)
+
+# 천안 경계 피처만 GeoParquet으로 1회 변환 (원본 SHP가 같으면 SHP를 열지 않음)
+BOUNDARY_CACHE_PATH = os.path.join(SAVE_DIR, "cheonan_boundary.parquet")
+
+# 지오코딩: 공용 저장소(SQLite, 불법주정차 2_02와 공유, 첫 지오코딩 때 열기) + 비동기 일괄 지오코딩
+GEOCODE_CACHE_PATH = os.path.join(SAVE_DIR, "geocode_cache.json")  # 기존 JSON 캐시 ([lon, lat]) → 저장소로 이관
+GEOCODE_LEGACY_CACHES = [(GEOCODE_CACHE_PATH, "lonlat", "query")]
 
 # =========================
 # 빠른 종료
@@ -126,9 +160,13 @@ def load_cheonan_boundary_shp(shp_path: str):
       - cheonan_geom: 천안 전체 단일 geometry
       - gu_gdf_map: {"동남구": GDF, "서북구": GDF}
     """
-    gdf = gpd.read_file(shp_path)
-    if gdf.crs is not None and gdf.crs.to_epsg() != 4326:
-        gdf = gdf.to_crs(epsg=4326)
+    # 천안 bbox + BJCD 필터를 읽기 단계에서 적용 (캐시 있으면 캐시)
+    gdf = read_cheonan_features(shp_path, BOUNDARY_CACHE_PATH)
+    if gdf is None:
+        # BJCD 없음/불일치 → 전체 읽기 후 아래 이름 매칭으로 선택
+        gdf = gpd.read_file(shp_path)
+        if gdf.crs is not None and gdf.crs.to_epsg() != 4326:
+            gdf = gdf.to_crs(epsg=4326)
 
     target_sig5 = {"44130", "44131", "44133"}
     sel = gdf.iloc[0:0].copy()
@@ -199,63 +237,9 @@ def _kakao_get(url, params, headers, max_retries=3):
     else:
         raise requests.HTTPError("Request failed with unknown error")
 
-def search_category_rect(group_code, minX, minY, maxX, maxY, *, headers=HEADERS, page_size=PAGE_SIZE):
-    # 정렬
-    minX, maxX = (minX, maxX) if minX <= maxX else (maxX, minX)
-    minY, maxY = (minY, maxY) if minY <= maxY else (maxY, minY)
-
-    page_num = 1
-    base_params = {
-        "category_group_code": group_code,
-        "page": page_num,
-        "size": page_size,
-        "rect": f"{minX},{minY},{maxX},{maxY}"
-    }
-    resp = _kakao_get(KAKAO_CAT_URL, base_params, headers)
-    payload = resp.json()
-    total_count = payload.get("meta", {}).get("total_count", 0)
-
-    if total_count > MAX_FETCHABLE:
-        docs = []
-        midX = (minX + maxX)/2.0
-        midY = (minY + maxY)/2.0
-        docs.extend(search_category_rect(group_code, minX, minY, midX,  midY, headers=headers, page_size=page_size))
-        docs.extend(search_category_rect(group_code, midX,  minY, maxX,  midY, headers=headers, page_size=page_size))
-        docs.extend(search_category_rect(group_code, minX, midY,  midX,  maxY, headers=headers, page_size=page_size))
-        docs.extend(search_category_rect(group_code, midX,  midY,  maxX,  maxY, headers=headers, page_size=page_size))
-        return docs
-
-    documents = []
-    while True:
-        cur = payload if page_num == 1 else _kakao_get(KAKAO_CAT_URL, {**base_params, "page": page_num}, headers).json()
-        docs = cur.get("documents", [])
-        documents.extend(docs)
-        if cur.get("meta", {}).get("is_end", True) or page_num >= MAX_PAGES:
-            break
-        page_num += 1
-        time.sleep(SLEEP_SEC)
-    return documents
-
-def overlapped_category_in_polygon(group_code, bbox, num_x, num_y, poly, *, headers=HEADERS, page_size=PAGE_SIZE):
-    minX, minY, maxX, maxY = bbox
-    step_x = (maxX - minX)/float(num_x)
-    step_y = (maxY - minY)/float(num_y)
-
-    results = []
-    for i in range(num_x):
-        for j in range(num_y):
-            cell_minX = minX + i*step_x
-            cell_maxX = cell_minX + step_x
-            cell_minY = minY + j*step_y
-            cell_maxY = cell_minY + step_y
-            cell_geom = box(cell_minX, cell_minY, cell_maxX, cell_maxY)
-            if not poly.intersects(cell_geom):
-                continue
-            docs = search_category_rect(group_code, cell_minX, cell_minY, cell_maxX, cell_maxY,
-                                        headers=headers, page_size=page_size)
-            results.extend(docs)
-            time.sleep(SLEEP_SEC)
-    return results
+def _kakao_get_json(url, params, headers):
+    """응답 캐시 우선, 없으면 _kakao_get 호출 후 JSON 저장"""
+    return kakao_get_json(_kakao_get, url, params, headers, cache=_http_cache())
 
 def search_keyword_rect(keyword, minX, minY, maxX, maxY, *, headers=HEADERS, page_size=PAGE_SIZE):
     # 정렬
@@ -269,11 +253,10 @@ def search_keyword_rect(keyword, minX, minY, maxX, maxY, *, headers=HEADERS, pag
         "size": page_size,
         "rect": f"{minX},{minY},{maxX},{maxY}"
     }
-    resp = _kakao_get(KAKAO_KEYWORD_URL, base_params, headers)
-    payload = resp.json()
+    payload = _kakao_get_json(KAKAO_KEYWORD_URL, base_params, headers)
     documents = []
     while True:
-        cur = payload if page_num == 1 else _kakao_get(KAKAO_KEYWORD_URL, {**base_params, "page": page_num}, headers).json()
+        cur = payload if page_num == 1 else _kakao_get_json(KAKAO_KEYWORD_URL, {**base_params, "page": page_num}, headers)
         docs = cur.get("documents", [])
         documents.extend(docs)
         if cur.get("meta", {}).get("is_end", True) or page_num >= MAX_PAGES:
@@ -343,49 +326,48 @@ def category_passes_filter(group_code: str, doc: dict) -> bool:
 
     return True
 
+# 키워드 보강 규칙: 포함/제외 (편의점 택배취급점 등 잡음 제거)
+KEYWORDS_PO3_EXTRA = ["우체국", "보건지소", "보건진료소", "보건소"]
+KEYWORDS_HP8_EXTRA = ["요양병원", "재활병원"]
+
+_re_post_office = re.compile(r"(우체국|Post\s*Office)", re.IGNORECASE)
+_re_health_post = re.compile(r"(보건지소|보건진료소|보건소)", re.IGNORECASE)
+_re_exclude = re.compile(r"(택배|편의점|CU|GS25|세븐일레븐|7\-?Eleven|이마트24|무인|대리점|편의)", re.IGNORECASE)
+_re_care_hospital = re.compile(r"(요양병원|재활병원)", re.IGNORECASE)
+_re_exclude_med = re.compile(r"(치과|한의원|동물|의원)", re.IGNORECASE)
+
+def po3_backfill_passes(doc: dict) -> bool:
+    """공공기관(PO3) 보강: 우체국/보건지소/보건진료소만, 택배취급점 등 제외"""
+    name = str(doc.get("place_name", "") or "")
+    catname = str(doc.get("category_name", "") or "")
+    is_post = bool(_re_post_office.search(name) or _re_post_office.search(catname))
+    is_health = bool(_re_health_post.search(name) or _re_health_post.search(catname))
+    if not (is_post or is_health):
+        return False
+    return not _re_exclude.search(name)
+
+def hp8_backfill_passes(doc: dict) -> bool:
+    """병원(HP8) 보강: 요양/재활병원만, 치과/한의원/동물/의원 제외"""
+    name = str(doc.get("place_name", "") or "")
+    catname = str(doc.get("category_name", "") or "")
+    if not (_re_care_hospital.search(name) or _re_care_hospital.search(catname)):
+        return False
+    return not _re_exclude_med.search(name)
+
+# 수집 작업 목록: (종류, 코드/검색어, 병합 태그, 필터, 우선순위) — 작을수록 먼저 토큰 배정
+CRAWL_JOBS = (
+    [make_job("category", gc, rule=lambda d, gc=gc: category_passes_filter(gc, d), priority=0)
+     for gc in TARGET_GROUPS]
+    + [make_job("keyword", kw, tag="PO3", rule=po3_backfill_passes, priority=1) for kw in KEYWORDS_PO3_EXTRA]
+    + [make_job("keyword", kw, tag="HP8", rule=hp8_backfill_passes, priority=1) for kw in KEYWORDS_HP8_EXTRA]
+)
+
 # =========================
 # Geocoding & Data loaders (주차장/수집기)
 # =========================
-def _kakao_get_addr(query: str):
-    if not query or not str(query).strip():
-        return (np.nan, np.nan)
-    key = str(query).strip()
-    if key in _geocode_cache:
-        lon, lat = _geocode_cache[key]
-        return (float(lon), float(lat)) if (lon is not None and lat is not None) else (np.nan, np.nan)
-
-    params = {"query": key}
-    last_exc = None
-    for attempt in range(1, 3+1):
-        try:
-            resp = _kakao_get(KAKAO_ADDR_URL, params, HEADERS)
-            docs = resp.json().get("documents", [])
-            if not docs:
-                _geocode_cache[key] = (None, None)
-                break
-            x = docs[0].get("x"); y = docs[0].get("y")
-            lon = float(x); lat = float(y)
-            _geocode_cache[key] = (lon, lat)
-            try:
-                with open(GEOCODE_CACHE_PATH, "w", encoding="utf-8") as f:
-                    json.dump(_geocode_cache, f, ensure_ascii=False)
-            except Exception:
-                pass
-            time.sleep(GEOCODE_SLEEP_SEC)
-            return (lon, lat)
-        except (requests.exceptions.RequestException, requests.HTTPError) as e:
-            last_exc = e
-            time.sleep(SLEEP_SEC * attempt)
-            continue
-    if last_exc:
-        print(f"[WARN] Geocode failed after retries: {key} | {last_exc}")
-    return (np.nan, np.nan)
-
+@LOADER_CACHE.cached("public_parking")
 def load_public_parking(csv_path: str):
-    try:
-        dfp = pd.read_csv(csv_path)
-    except UnicodeDecodeError:
-        dfp = pd.read_csv(csv_path, encoding="cp949")
+    dfp = read_csv_auto(csv_path)
     rename = {}
     if "주차장명" in dfp.columns: rename["주차장명"]="name"
     if "주소" in dfp.columns: rename["주소"]="address"
@@ -401,31 +383,17 @@ def load_public_parking(csv_path: str):
     dfp["id"] = "public_" + dfp.index.astype(str)
     return dfp[["id","name","lat","lon","road_address","jibun_address","category","source"]]
 
+_read_private_parking = LOADER_CACHE.cached("private_parking")(read_private_parking)
+
 def load_private_parking(xlsx_path: str):
-    dfm = pd.read_excel(xlsx_path)
-    rename = {}
-    if "주차장명" in dfm.columns: rename["주차장명"]="name"
-    if "소재지도로명주소" in dfm.columns: rename["소재지도로명주소"]="road_address"
-    if "소재지지번주소" in dfm.columns: rename["소재지지번주소"]="jibun_address"
-    dfm = dfm.rename(columns=rename)
-    lons, lats = [], []
-    for _, row in dfm.iterrows():
-        cand1 = str(row.get("road_address") or "").strip()
-        cand2 = str(row.get("jibun_address") or "").strip()
-        query = cand1 if cand1 else cand2
-        lon, lat = _kakao_get_addr(query)
-        lons.append(lon); lats.append(lat)
-    dfm["lon"] = lons; dfm["lat"] = lats
-    dfm["category"] = "민영주차장"
-    dfm["source"] = "천안시/민영"
-    dfm["id"] = "private_" + dfm.index.astype(str)
-    return dfm[["id","name","lat","lon","road_address","jibun_address","category","source"]]
+    """민영주차장 → 좌표 포함 공통 스키마 (XLSX 정규화는 로더 캐시, 지오코딩은 공용 저장소 + 비동기 일괄 조회)"""
+    return geocode_private_parking(
+        _read_private_parking(xlsx_path), headers=HEADERS, store=shared_geocode_store(GEOCODE_LEGACY_CACHES),
+        rate=GEOCODE_RPS, max_in_flight=GEOCODE_MAX_IN_FLIGHT, cache=_http_cache())
 
+@LOADER_CACHE.cached("traffic_sensors")
 def load_traffic_sensors_exact(csv_path: str):
-    try:
-        df = pd.read_csv(csv_path)
-    except UnicodeDecodeError:
-        df = pd.read_csv(csv_path, encoding="cp949")
+    df = read_csv_auto(csv_path)
     if "lon" not in df.columns or "lat" not in df.columns:
         raise ValueError("수집기 CSV에 lon/lat 열이 없습니다.")
 
@@ -472,33 +440,6 @@ def make_cluster(thresholds=(5, 10)):
     }}"""
     return MarkerCluster(icon_create_function=js)
 
-def load_traffic_stats(csv_path: str):
-    """스마트교차로_통계.csv → 7월(2025-07-01~31)만 필터, 교차로명별 일평균 계산"""
-    try:
-        df = pd.read_csv(csv_path)
-    except UnicodeDecodeError:
-        df = pd.read_csv(csv_path, encoding="cp949")
-
-    # 필수 컬럼 체크
-    for col in ["일자", "교차로명", "합계"]:
-        if col not in df.columns:
-            raise ValueError(f"교통량 통계 CSV에 '{col}' 열이 없습니다.")
-
-    df["일자"] = pd.to_datetime(df["일자"], errors="coerce")
-    df["합계"] = pd.to_numeric(df["합계"], errors="coerce")
-
-    # 2025-07-01 ~ 2025-07-31
-    mask = (df["일자"] >= pd.Timestamp("2025-07-01")) & (df["일자"] <= pd.Timestamp("2025-07-31"))
-    df_july = df.loc[mask].copy()
-
-    # 교차로명별 7월 일평균
-    grp = df_july.groupby("교차로명", as_index=False).agg(
-        july_mean=("합계", "mean"),
-        july_sum =("합계", "sum"),
-        days     =("합계", "count"),
-    )
-    return grp  # columns: 교차로명, july_mean, july_sum, days
-
 
 # =========================
 # 팝업 HTML 빌더 (줄겹침 방지)
@@ -706,10 +647,6 @@ def add_traffic_sensors_layer(m, df_sensors):
 # =========================
 # Helpers
 # =========================
-def _safe_float(x):
-    try: return float(x)
-    except Exception: return np.nan
-
 def _inside(poly, lon, lat):
     try: return poly.contains(Point(float(lon), float(lat)))
     except Exception: return False
@@ -723,132 +660,28 @@ if __name__ == "__main__":
     minX, minY, maxX, maxY = cheonan_geom.bounds
     print(f"[INFO] Cheonan bbox: ({minX:.6f}, {minY:.6f}) ~ ({maxX:.6f}, {maxY:.6f})")
 
-    # 2) 카테고리별 수집 (천안 폴리곤 교차 셀만)
+    # 2) 카테고리 + 키워드 보강 작업을 하나의 RPS 예산으로 인터리빙 수집 (천안 폴리곤 교차 셀만)
     GRID_X, GRID_Y = 6, 4
-    by_id = {}
-    for gc in TARGET_GROUPS:
-        print(f"[INFO] Collecting category: {gc}")
-        raw_docs = overlapped_category_in_polygon(gc, (minX, minY, maxX, maxY), GRID_X, GRID_Y, cheonan_geom,
-                                                  headers=HEADERS, page_size=PAGE_SIZE)
-        for d in raw_docs:
-            pid = d.get("id")
-            if not pid: continue
-            if not category_passes_filter(gc, d):  # 대학/대형병원 필터 등
-                continue
-            lon = _safe_float(d.get("x")); lat = _safe_float(d.get("y"))
-            if np.isnan(lon) or np.isnan(lat): continue
-            if not _inside(cheonan_geom, lon, lat): continue
-            if pid not in by_id:
-                by_id[pid] = {**d, "_groups": {gc}}
-            else:
-                by_id[pid]["_groups"].add(gc)
-
-    # 2.1) 공공기관(PO3) 키워드 보강: 우체국/보건지소/보건진료소를 PO3로 묶기
-    print("[INFO] Keyword backfill for PO3: 우체국/보건지소/보건진료소")
-
-    # 포함/제외 규칙 (편의점 택배취급점 등 잡음 제거)
-    _re_post_office = re.compile(r"(우체국|Post\s*Office)", re.IGNORECASE)
-    _re_health_post = re.compile(r"(보건지소|보건진료소|보건소)", re.IGNORECASE)
-    _re_exclude = re.compile(r"(택배|편의점|CU|GS25|세븐일레븐|7\-?Eleven|이마트24|무인|대리점|편의)", re.IGNORECASE)
-
-    KEYWORDS_PO3_EXTRA = ["우체국", "보건지소", "보건진료소", "보건소"]
-
-    extra_docs_all = []
-    for kw in KEYWORDS_PO3_EXTRA:
-        extra_docs_all.extend(
-            overlapped_keyword_in_polygon(
-                kw, (minX, minY, maxX, maxY), GRID_X, GRID_Y, cheonan_geom,
-                headers=HEADERS, page_size=PAGE_SIZE
-            )
-        )
-
-    added_cnt = 0
-    for d in extra_docs_all:
-        pid = d.get("id")
-        if not pid:
-            continue
-
-        name = str(d.get("place_name", "") or "")
-        catname = str(d.get("category_name", "") or "")
-        lon = _safe_float(d.get("x")); lat = _safe_float(d.get("y"))
-
-        # 좌표/경계 체크
-        if np.isnan(lon) or np.isnan(lat):
-            continue
-        if not _inside(cheonan_geom, lon, lat):
-            continue
-
-        # 포함/제외 필터
-        is_post = bool(_re_post_office.search(name) or _re_post_office.search(catname))
-        is_health = bool(_re_health_post.search(name) or _re_health_post.search(catname))
-        if not (is_post or is_health):
-            continue
-        if _re_exclude.search(name):
-            continue
-
-        # by_id에 주입: 그룹을 PO3로 강제 태깅해 공공기관 레이어로 표시
-        if pid not in by_id:
-            by_id[pid] = {**d, "_groups": {"PO3"}}
-            added_cnt += 1
-        else:
-            prev = len(by_id[pid].get("_groups", set()))
-            by_id[pid].setdefault("_groups", set()).add("PO3")
-            if len(by_id[pid]["_groups"]) > prev:
-                added_cnt += 1
-
-    print(f"[INFO] PO3 keyword backfill merged: +{added_cnt}")
-
-    # 2.2) HP8 보강: '요양병원' + '재활병원' 키워드
-    print("[INFO] Keyword backfill for HP8: 요양/재활병원")
-
-    _re_care_hospital = re.compile(r"(요양병원|재활병원)", re.IGNORECASE)
-    # 제외 규칙: 원치 않는 병원 유형 필터링 (선택)
-    _re_exclude_med = re.compile(r"(치과|한의원|동물|의원)", re.IGNORECASE)
-
-    KEYWORDS_HP8_EXTRA = ["요양병원", "재활병원"]
-
-    extra_hp8_docs = []
-    for kw in KEYWORDS_HP8_EXTRA:
-        extra_hp8_docs.extend(
-            overlapped_keyword_in_polygon(
-                kw, (minX, minY, maxX, maxY), GRID_X, GRID_Y, cheonan_geom,
-                headers=HEADERS, page_size=PAGE_SIZE
-            )
-        )
-
-    added_hp8 = 0
-    for d in extra_hp8_docs:
-        pid = d.get("id")
-        if not pid:
-            continue
-        name = str(d.get("place_name", "") or "")
-        catname = str(d.get("category_name", "") or "")
-        lon = _safe_float(d.get("x")); lat = _safe_float(d.get("y"))
-
-        if np.isnan(lon) or np.isnan(lat):
-            continue
-        if not _inside(cheonan_geom, lon, lat):
-            continue
-
-        # 포함/제외 규칙 적용
-        if not (_re_care_hospital.search(name) or _re_care_hospital.search(catname)):
-            continue
-        if _re_exclude_med.search(name):
-            continue
-
-        if pid not in by_id:
-            by_id[pid] = {**d, "_groups": {"HP8"}}
-            added_hp8 += 1
-        else:
-            prev = len(by_id[pid].get("_groups", set()))
-            by_id[pid].setdefault("_groups", set()).add("HP8")
-            if len(by_id[pid]["_groups"]) > prev:
-                added_hp8 += 1
-
-    print(f"[INFO] HP8 keyword backfill merged: +{added_hp8}")
-
-
-    results = list(by_id.values())
+    # 2.1) 셀 단위 스트리밍 병합: 폴리곤 내부 + 작업 필터 통과 → 필요한 필드만 누적 (작업 태그 비트 부여)
+    #      (키워드 보강분은 PO3/HP8 태그로 강제 태깅해 해당 레이어로 표시)
+    poi_acc = POIAccumulator([job["tag"] for job in CRAWL_JOBS])
+    added_by_job = {job["name"]: 0 for job in CRAWL_JOBS}
+
+    def merge_cell(job, docs):
+        inside_mask = docs_inside_polygon(docs, cheonan_geom)  # 내부 타일은 검사 생략, 경계 타일만 일괄 판정
+        kept = [d for d, is_inside in zip(docs, inside_mask) if is_inside and job["rule"](d)]
+        added_by_job[job["name"]] += poi_acc.add_docs(kept, job["tag"])
+
+    journal = CrawlJournal(CRAWL_JOURNAL_PATH)
+    run_crawl_jobs(
+        CRAWL_JOBS, (minX, minY, maxX, maxY), GRID_X, GRID_Y, cheonan_geom,
+        headers=HEADERS, rate=KAKAO_RPS, max_in_flight=MAX_IN_FLIGHT, page_size=PAGE_SIZE,
+        quadtree_path=QUADTREE_PATH, cache=_http_cache(), journal=journal,
+        tile_snapshot_path=TILE_SNAPSHOT_PATH, delta=DELTA_CRAWL or "--delta" in sys.argv, sink=merge_cell,
+    )
+    for job in CRAWL_JOBS:
+        print(f"[INFO] {job['name']}: merged +{added_by_job[job['name']]} ({job['tag']})")
+    print(f"[INFO] Unique POIs accumulated: {len(poi_acc)}")
 
 #    # 2.5) 대학 누락 보정: 키워드 기반 수집(“대학” + 사용자 특정명)
 #    print("[INFO] Keyword backfill for universities...")
@@ -886,18 +719,8 @@ if __name__ == "__main__":
 #            by_id[pid].setdefault("_groups", set()).add("SC4")
 
 
-    # 3) DF 변환
-    df_cat = pd.DataFrame({
-        "id":   [p.get("id","") for p in results],
-        "name": [p.get("place_name","") for p in results],
-        "lon":  [_safe_float(p.get("x")) for p in results],
-        "lat":  [_safe_float(p.get("y")) for p in results],
-        "road_address": [p.get("road_address_name","") for p in results],
-        "jibun_address": [p.get("address_name","") for p in results],
-        "url":  [p.get("place_url","") for p in results],
-        "category_name": [p.get("category_name","") for p in results],
-        "group_code": [sorted(list(p.get("_groups", [])))[0] if p.get("_groups") else None for p in results],
-    })
+    # 3) DF 변환 (누적 컬럼 배열 그대로)
+    df_cat = poi_acc.to_frame()
     df_cat = df_cat.dropna(subset=["lat","lon"]).reset_index(drop=True)
     print(f"[INFO] POI (category-based, filtered): {len(df_cat)}")
 
@@ -933,9 +756,19 @@ if __name__ == "__main__":
     # 4) CSV 저장(옵션)
     ts = datetime.now().strftime("%Y%m%d_%H%M")
     cat_csv = os.path.join(SAVE_DIR, f"cheonan_POI_category_{ts}.csv")
+    prev_csv = latest_snapshot(SAVE_DIR, exclude=cat_csv)
     df_cat.to_csv(cat_csv, index=False, encoding="utf-8-sig")
     print(f"[INFO] Saved CSV (category): {cat_csv}")
 
+    # 4-1) 직전 스냅샷 대비 추가/삭제 place id
+    if prev_csv:
+        df_diff = diff_poi_snapshots(pd.read_csv(prev_csv, encoding="utf-8-sig", dtype={"id": str}), df_cat)
+        diff_csv = os.path.join(SAVE_DIR, f"cheonan_POI_diff_{ts}.csv")
+        df_diff.to_csv(diff_csv, index=False, encoding="utf-8-sig")
+        n_add = int((df_diff["change"] == "added").sum())
+        print(f"[INFO] Diff vs {os.path.basename(prev_csv)}: +{n_add} / -{len(df_diff) - n_add} → {diff_csv}")
+    journal.clear()  # 결과 저장 완료 → 다음 실행은 새 수집
+
     # 5) 주차장/수집기 로드 (+천안 내부 필터)
     df_pub = load_public_parking(PUBLIC_PARKING_CSV)
     df_pri = load_private_parking(PRIVATE_PARKING_XLSX)
@@ -0,0 +1,159 @@
+# -*- coding: utf-8 -*-
+"""
+스마트교차로 통계 큐브 (접근로 × 일자 × 시간, numpy)
+- 스마트교차로_통계.csv의 00시~23시 열을 float32 배열 values[접근로, 일자, 시]로 보관 (없는 값은 NaN)
+  접근로 = (교차로명, 접근로명), 교차로/접근로/일자는 정수 인덱스
+- .npz로 저장, 원본 CSV 크기·수정 시각이 같으면 CSV를 다시 읽지 않음
+- 임의 기간·요일·시간대 조회를 배열 연산으로 처리
+  예) cube.mean_flow(month="2025-07", weekdays=WEEKDAYS, hours=PEAK_HOURS) → 교차로명별 평균
+- 평균은 접근로·일 기록 기준 (hours 없이 조회하면 '합계' 열의 일평균과 같음)
+- map_loaders.load_traffic_stats (주차장 지도 공용) 가 이 큐브로 교차로별 기간 평균(july_mean)을 계산
+"""
+
+import os
+
+import numpy as np
+import pandas as pd
+
+from csv_sniff import clean_columns, sniff_csv
+
+HOUR_COLS = [f"{h:02d}시" for h in range(24)]
+WEEKDAYS = (0, 1, 2, 3, 4)              # 월~금
+PEAK_HOURS = (7, 8, 9, 17, 18, 19)      # 출퇴근 시간대
+CUBE_CHUNK_ROWS = 200_000
+
+
+class TrafficCube:
+
+    def __init__(self, intersections, approaches, approach_inter, days, values):
+        self.intersections = np.asarray(intersections, dtype=str)     # [교차로]
+        self.approaches = np.asarray(approaches, dtype=str)           # [접근로]
+        self.approach_inter = np.asarray(approach_inter, dtype=np.int32)  # 접근로 → 교차로 인덱스
+        self.days = np.asarray(days, dtype="datetime64[D]")            # [일자] 오름차순
+        self.values = np.asarray(values, dtype=np.float32)            # [접근로, 일자, 24]
+        self._inter_pd = pd.Index(self.intersections, name="교차로명")
+        # 조회용: 접근로를 교차로로 미리 합친 [일자, 교차로, 시] 합계 / [일자, 교차로] 기록 수
+        exists = ~np.isnan(self.values).all(axis=2)
+        self._day_sum = np.zeros((len(self.days), len(self.intersections), 24), dtype=np.float64)
+        self._day_cnt = np.zeros((len(self.days), len(self.intersections)), dtype=np.int64)
+        np.add.at(self._day_sum.transpose(1, 0, 2), self.approach_inter, np.nan_to_num(self.values))
+        np.add.at(self._day_cnt.T, self.approach_inter, exists)
+        self._weekday = ((self.days.astype("int64") + 3) % 7).astype(np.int8)   # 1970-01-01 = 목(3)
+
+    def __repr__(self):
+        span = f"{self.days[0]}~{self.days[-1]}" if len(self.days) else "-"
+        return (f"TrafficCube({len(self.intersections)} intersections, {len(self.approaches)} approaches, "
+                f"{len(self.days)} days {span})")
+
+    # -------------------------
+    # 저장/읽기
+    # -------------------------
+    def save(self, path: str, source: dict = None):
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        src = source or {}
+        tmp = path + ".tmp.npz"
+        np.savez(tmp, intersections=self.intersections, approaches=self.approaches,
+                 approach_inter=self.approach_inter, days=self.days, values=self.values,
+                 source_size=np.int64(src.get("size", -1)), source_mtime_ns=np.int64(src.get("mtime_ns", -1)))
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path: str):
+        """반환: (cube, {'size', 'mtime_ns'})"""
+        with np.load(path, allow_pickle=False) as z:
+            cube = cls(z["intersections"], z["approaches"], z["approach_inter"], z["days"], z["values"])
+            source = {"size": int(z["source_size"]), "mtime_ns": int(z["source_mtime_ns"])}
+        return cube, source
+
+    # -------------------------
+    # 조회
+    # -------------------------
+    def _day_mask(self, start=None, end=None, month=None, weekdays=None):
+        if month is not None:
+            m = np.datetime64(str(month), "M")
+            start, end = m.astype("datetime64[D]"), (m + 1).astype("datetime64[D]") - 1
+        mask = np.ones(len(self.days), dtype=bool)
+        if start is not None:
+            mask &= self.days >= np.datetime64(pd.Timestamp(start).date(), "D")
+        if end is not None:
+            mask &= self.days <= np.datetime64(pd.Timestamp(end).date(), "D")
+        if weekdays is not None:
+            wd = np.zeros(7, dtype=bool)
+            wd[list(weekdays)] = True
+            mask &= wd[self._weekday]
+        return mask
+
+    def _hour_index(self, hours=None):
+        return np.arange(24) if hours is None else np.asarray(list(hours), dtype=np.intp)
+
+    def window_totals(self, *, start=None, end=None, month=None, weekdays=None, hours=None) -> pd.DataFrame:
+        """
+        교차로명별 선택 시간대 통행량 합(sum)과 기록 수(count, 기록이 있는 접근로·일)
+        - start/end: 'YYYY-MM-DD' (포함), month: 'YYYY-MM', weekdays: 0=월 ~ 6=일, hours: 0~23
+        """
+        d = self._day_mask(start, end, month, weekdays)
+        sums = self._day_sum[d].sum(axis=0)[:, self._hour_index(hours)].sum(axis=1)
+        counts = self._day_cnt[d].sum(axis=0)
+        return pd.DataFrame({"sum": sums, "count": counts}, index=self._inter_pd)
+
+    def mean_flow(self, **window) -> pd.Series:
+        """교차로명별 평균 통행량 (window_totals 의 sum / count, 기간 안에 기록이 없는 교차로는 NaN)"""
+        t = self.window_totals(**window)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            mean = t["sum"].to_numpy() / t["count"].to_numpy()
+        return pd.Series(mean, index=self._inter_pd, name="mean_flow")
+
+
+# =========================
+# CSV → 큐브
+# =========================
+def build_traffic_cube(csv_path: str, chunksize: int = CUBE_CHUNK_ROWS) -> TrafficCube:
+    """일자/교차로명/접근로명/00시~23시만 청크 단위로 읽어 큐브 구성 (같은 접근로·일 중복 행은 마지막 값)"""
+    info = sniff_csv(csv_path)
+    need = ["일자", "교차로명", "접근로명"] + HOUR_COLS
+    header = clean_columns(pd.read_csv(csv_path, encoding=info["encoding"], sep=info["sep"], nrows=0))
+    missing = [c for c in need if c not in header.columns]
+    if missing:
+        raise ValueError(f"교통량 통계 CSV에 필요한 열이 없습니다: {missing}")
+
+    keys, days, hours = [], [], []
+    reader = pd.read_csv(csv_path, encoding=info["encoding"], sep=info["sep"], chunksize=chunksize,
+                         usecols=lambda c: c.lstrip("\ufeff") in need, dtype={"교차로명": str, "접근로명": str})
+    for chunk in reader:
+        chunk = clean_columns(chunk)
+        d = pd.to_datetime(chunk["일자"], errors="coerce")
+        ok = d.notna() & chunk["교차로명"].notna()
+        chunk = chunk[ok]
+        keys.append(chunk[["교차로명", "접근로명"]].fillna(""))
+        days.append(d[ok].to_numpy(dtype="datetime64[D]"))
+        hours.append(chunk[HOUR_COLS].apply(pd.to_numeric, errors="coerce").to_numpy(dtype=np.float32))
+
+    keys = pd.concat(keys, ignore_index=True) if keys else pd.DataFrame(columns=["교차로명", "접근로명"])
+    days = np.concatenate(days) if days else np.array([], dtype="datetime64[D]")
+    hours = np.concatenate(hours) if hours else np.empty((0, 24), dtype=np.float32)
+
+    appr_codes, appr_uniques = pd.MultiIndex.from_frame(keys).factorize(sort=True)
+    inter_codes, intersections = pd.factorize(appr_uniques.get_level_values(0), sort=True)
+    day_codes, day_uniques = pd.factorize(days, sort=True)
+
+    values = np.full((len(appr_uniques), len(day_uniques), 24), np.nan, dtype=np.float32)
+    values[appr_codes, day_codes] = hours
+    return TrafficCube(intersections.to_numpy(), appr_uniques.get_level_values(1).to_numpy(),
+                       inter_codes, np.asarray(day_uniques, dtype="datetime64[D]"), values)
+
+
+def load_traffic_cube(csv_path: str, cube_path: str) -> TrafficCube:
+    """저장된 큐브가 원본 CSV(크기·수정 시각)와 같으면 그대로, 아니면 다시 만들어 저장"""
+    st = os.stat(csv_path)
+    source = {"size": st.st_size, "mtime_ns": st.st_mtime_ns}
+    if os.path.exists(cube_path):
+        try:
+            cube, saved = TrafficCube.load(cube_path)
+            if saved == source:
+                return cube
+        except (OSError, ValueError, KeyError) as e:
+            print(f"[WARN] Traffic cube read failed: {e}")
+    cube = build_traffic_cube(csv_path)
+    cube.save(cube_path, source)
+    print(f"[INFO] {cube} → {cube_path}")
+    return cube
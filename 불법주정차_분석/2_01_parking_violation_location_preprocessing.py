@@ -1,19 +1,16 @@
 # 특정 키워드("앞", "부근", "주변")만 제거하고 나머지 텍스트는 유지하도록 전처리
 
 import re
-import pandas as pd
+
+import _repo_path  # noqa: F401  저장소 루트의 공용 CSV 판별 모듈(csv_sniff) 사용
+from csv_sniff import read_csv_auto
 
 # 파일 경로 다시 지정
 in_path = "data/충청남도 천안시_불법주정차단속현황_2022.CSV"
 out_path = "data/충청남도_천안시_불법주정차단속현황_2022_clean_text_removed.csv"
 
-# 1) 로드 (이미 enc 확인했으므로 cp949 우선)
-for enc in ["utf-8", "cp949", "euc-kr"]:
-    try:
-        df = pd.read_csv(in_path, encoding=enc, low_memory=False)
-        break
-    except UnicodeDecodeError:
-        continue
+# 1) 로드 (인코딩은 BOM·바이트 표본으로 1회 판별)
+df = read_csv_auto(in_path)
 
 # 2) D열 컬럼명 (단속장소)
 col_D = df.columns[3]
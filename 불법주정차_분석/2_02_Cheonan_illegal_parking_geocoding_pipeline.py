@@ -3,22 +3,40 @@
 천안시 불법주정차 단속장소 지오코딩 (카카오맵 API)
 - C열(단속동) + D열(단속장소) 결합
 - D열이 숫자만이면 '{단속동} {숫자}번지'로 보정
-- 주소 API 실패 -> 키워드 API 폴백 -> 행정동 센트로이드 대체
-- 캐시/실패내역/체크포인트 저장, 병렬+레이트리밋, 숫자좌표/국내범위 가드
-- CSV 인코딩 자동 탐지(utf-8-sig, utf-8, cp949, euc-kr)
+- 주소 API 실패 -> 키워드 API 폴백 -> 행정동 센트로이드 대체 (공용 kakao_geocoder 와 동일 규칙)
+  센트로이드는 행정동 경계(BND_ADM_DONG_PG) 내부점 우선 (dong_locator, API 호출 없음)
+- 결과는 공용 지오코딩 저장소(SQLite, 주차장 지도와 공유)에 기록, 기존 JSON 캐시는 1회 이관
+- 실패내역 저장, 숫자좌표/국내범위 가드
+- 체크포인트: 새 결과만 part 파일로 append → 재시작 시 part만 읽어 이어서 처리, 종료 시 한 번에 병합
+- 캐시 조회는 정규 주소 키(address_key) 기준 → 표기만 다른 쿼리는 1회만 호출
+  (`--key-report`: 연도별 단속현황에서 정규 키로 줄어드는 호출 수 리포트)
+- 비동기 엔진(kakao_geocoder_async): 토큰버킷 QPS 상한 + 동시 요청 상한, 쿼리별 폴백 체인 병행
+- 오프라인 퍼지 지오코더(offline_geocoder, `--fuzzy`로 켬): 저장소 정밀 결과와 신뢰도 높게 일치하면 API 없이 좌표 사용
+  퍼지 좌표는 이번 실행 결과에만 쓰고 저장소에는 기록하지 않음 (주차장 지도 등 정밀 조회에 섞이지 않도록)
+  (`--offline`: API 호출 없이 저장소 + 퍼지 매칭만으로 실행, 퍼지 매칭 포함)
+- `--batch [22년 23년 ...]`: 연도별 단속현황을 한 번에 처리 (전 연도 공통 쿼리 계획 → 연도별 결과 + _grouped 집계)
+- CSV 인코딩/구분자 자동 판별(csv_sniff: BOM·바이트 표본으로 1회 판별 후 한 번만 파싱)
 """
 
 import os
-import re
+import glob
 import json
-import time
+import re
+import sys
 import requests
 import pandas as pd
-from typing import Tuple, Optional, Dict, List
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Tuple, Optional, Dict
 from urllib3.util.retry import Retry
 from requests.adapters import HTTPAdapter
-from threading import Lock
+
+# 저장소 루트의 공용 모듈(address_key, csv_sniff, dong_locator, geocode_store, kakao_geocoder_async, offline_geocoder) 사용
+import _repo_path  # noqa: F401
+from address_key import canonical_key
+from csv_sniff import read_csv_auto
+from dong_locator import load_dong_locator
+from geocode_store import open_shared_store
+from kakao_geocoder_async import geocode_many
+from offline_geocoder import build_offline_geocoder
 
 # =========================
 # 설정: 파일 경로 (필요시 변경)
@@ -26,16 +44,37 @@ from threading import Lock
 INPUT_CSV      = "data/충청남도_천안시_불법주정차단속현황_2022_clean_text_removed.csv"
 OUTPUT_CSV     = "data/천안시_단속장소_위도경도_22년.csv"
 FAILED_CSV     = "data/geocode_failed_22년.csv"
-CHECKPOINT_CSV = "data/천안시_단속장소_위도경도_22년_checkpoint.csv"
+CHECKPOINT_DIR = "data/천안시_단속장소_위도경도_22년_checkpoint"   # part-00001.csv, ... (쿼리주소/위도/경도)
+CHECKPOINT_EVERY = 300
 
-# 캐시 (주소쿼리 ↔ 좌표), (행정동 ↔ 센트로이드)
+# 기존 JSON 캐시 (주소쿼리 ↔ 좌표), (행정동 ↔ 센트로이드) → 공용 저장소로 이관만 함
 CACHE_ADDR_JSON = "data/kakao_geocode_cache.json"
 CACHE_DONG_JSON = "data/kakao_geocode_dong_centroid.json"
 
+# 정규 키 절감 리포트 대상 (2_01 전처리 결과, 연도별)
+ENFORCEMENT_CSVS = {
+    "22년": INPUT_CSV,
+    "23년": "data/충청남도_천안시_불법주정차단속현황_2023_clean_text_removed.csv",
+    "24년": "data/충청남도_천안시_불법주정차단속현황_2024_clean_text_removed.csv",
+}
+
+# 연도 일괄 실행(--batch) 출력: 연도 라벨(22년, ...)별 결과 / 좌표별 단속건수(2_03과 같은 형식) / 실패 목록
+OUTPUT_PATTERN       = "data/천안시_단속장소_위도경도_{label}.csv"
+GROUPED_PATTERN      = "data/천안시_단속장소_위도경도_{label}_grouped.csv"
+FAILED_PATTERN       = "data/geocode_failed_{label}.csv"
+BATCH_CHECKPOINT_DIR = "data/천안시_단속장소_위도경도_batch_checkpoint"
+
+# 오프라인 퍼지 지오코더: 저장소 정밀 결과(address/keyword/legacy)만 색인 (기본 꺼짐, --fuzzy/--offline)
+# 이전 결과 CSV는 센트로이드 대체 좌표와 구분되지 않으므로 색인하지 않음
+USE_OFFLINE_GEOCODER = False
+FUZZY_THRESHOLD      = 0.90   # 이 신뢰도 이상만 오프라인 좌표 사용
+
 # 지오코딩 기본 설정
 CITY_PREFIX       = "충청남도 천안시"  # ★ 보다 정확한 검색을 위해 도/시 포함
-MAX_WORKERS       = 6                 # 동시 스레드 수
+MAX_WORKERS       = 6                 # 동시 요청 수 (비동기 엔진 in-flight 상한)
 RATE_LIMIT_DELAY  = 0.30              # 전역 rate-limit 간격(초)
+GEOCODE_QPS       = 1.0 / RATE_LIMIT_DELAY   # 토큰버킷 초당 요청 상한
+GEOCODE_BURST     = 2                 # 토큰버킷 순간 허용량
 REQUEST_TIMEOUT   = 8                 # 초
 RETRY_TOTAL       = 5
 BACKOFF_FACTOR    = 0.7
@@ -117,126 +156,62 @@ def make_session() -> requests.Session:
     sess.mount("http://", adapter)
     return sess
 
-def is_number_like(v) -> bool:
-    try:
-        v = str(v).strip()
-        if v == "":
-            return False
-        float(v)
-        return True
-    except Exception:
-        return False
-
-# 국내 위도/경도 대략 가드(대한민국 본토 범위 근사)
-def in_korea_bounds(lat: float, lng: float) -> bool:
-    return (33.0 <= lat <= 43.5) and (124.0 <= lng <= 132.5)
-
-# =========================
-# Kakao Geocoding
-# =========================
-def geocode_address(session: requests.Session, q: str) -> Tuple[Optional[float], Optional[float]]:
-    url = "https://dapi.kakao.com/v2/local/search/address.json"
-    try:
-        r = session.get(url, headers=make_headers(), params={"query": q}, timeout=REQUEST_TIMEOUT)
-    except requests.RequestException:
-        return None, None
-    if r.status_code != 200:
-        return None, None
-    docs = r.json().get("documents", [])
-    for d in docs:
-        ra = d.get("road_address")
-        if ra and is_number_like(ra.get("y")) and is_number_like(ra.get("x")):
-            lat, lng = float(ra["y"]), float(ra["x"])
-            return (lat, lng) if in_korea_bounds(lat, lng) else (None, None)
-        ad = d.get("address")
-        if ad and is_number_like(ad.get("y")) and is_number_like(ad.get("x")):
-            lat, lng = float(ad["y"]), float(ad["x"])
-            return (lat, lng) if in_korea_bounds(lat, lng) else (None, None)
-    return None, None
-
-def geocode_keyword(session: requests.Session, q: str) -> Tuple[Optional[float], Optional[float]]:
-    url = "https://dapi.kakao.com/v2/local/search/keyword.json"
-    try:
-        r = session.get(url, headers=make_headers(), params={"query": q}, timeout=REQUEST_TIMEOUT)
-    except requests.RequestException:
-        return None, None
-    if r.status_code != 200:
-        return None, None
-    docs = r.json().get("documents", [])
-    for d in docs:
-        y, x = d.get("y"), d.get("x")
-        if is_number_like(y) and is_number_like(x):
-            lat, lng = float(y), float(x)
-            return (lat, lng) if in_korea_bounds(lat, lng) else (None, None)
-    return None, None
-
-def geocode_any(session: requests.Session, q: str) -> Tuple[Optional[float], Optional[float]]:
-    lat, lng = geocode_address(session, q)
-    if lat is not None and lng is not None:
-        return lat, lng
-    return geocode_keyword(session, q)
-
-# =========================
-# 캐시 로드/세이브
-# =========================
-def load_cache(path: str) -> Dict[str, List[Optional[float]]]:
-    if not os.path.exists(path):
-        return {}
-    try:
-        with open(path, "r", encoding="utf-8") as f:
-            return json.load(f)
-    except Exception:
-        return {}
-
-def save_cache(path: str, cache: Dict[str, List[Optional[float]]]):
-    os.makedirs(os.path.dirname(path), exist_ok=True)
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(cache, f, ensure_ascii=False, indent=2)
-
 # =========================
-# 행정동 센트로이드 (지오코딩 기반 대체)
+# 증분 체크포인트 (part 파일)
 # =========================
-def get_dong_centroid(session: requests.Session, dong: str, cache_dong: Dict[str, List[Optional[float]]]) -> Tuple[Optional[float], Optional[float]]:
-    """행정동 중심좌표: 행정복지센터 키워드 → 실패 시 동명 주소로 추정"""
-    if not dong:
-        return None, None
-    if dong in cache_dong and len(cache_dong[dong]) == 2:
-        lat, lng = cache_dong[dong]
-        return (lat, lng) if (lat is not None and lng is not None) else (None, None)
-
-    # 1) 행정복지센터(POI) 우선
-    q1 = f"{CITY_PREFIX} {dong} 행정복지센터"
-    lat, lng = geocode_keyword(session, q1)
-    if lat is None or lng is None:
-        # 2) 동명 자체를 주소로
-        q2 = f"{CITY_PREFIX} {dong}"
-        lat, lng = geocode_address(session, q2)
-        if lat is None or lng is None:
-            lat, lng = geocode_keyword(session, q2)
-
-    cache_dong[dong] = [lat, lng] if (lat is not None and lng is not None) else [None, None]
-    return lat, lng
+class PartCheckpoint:
+    """
+    주소 → 좌표 결과를 every건마다 새 part 파일로 기록 (기존 파일은 다시 쓰지 않음)
+    - load(): 이전 실행의 part 전부 → {주소: (lat, lng)}
+    - clear(): 최종 저장 후 part 삭제
+    """
 
-# =========================
-# CSV 인코딩 자동 로더
-# =========================
-def read_csv_auto(path: str, encodings=("utf-8-sig", "utf-8", "cp949", "euc-kr")) -> pd.DataFrame:
-    last_err = None
-    for enc in encodings:
-        try:
-            return pd.read_csv(path, encoding=enc, low_memory=False)
-        except Exception as e:
-            last_err = e
-            continue
-    raise last_err if last_err else RuntimeError("CSV 읽기 실패")
+    def __init__(self, dir_path: str, every: int = CHECKPOINT_EVERY):
+        self.dir_path = dir_path
+        self.every = int(every)
+        self._buf = []
+        os.makedirs(dir_path, exist_ok=True)
+        self._n_parts = len(self._parts())
+
+    def _parts(self):
+        return sorted(glob.glob(os.path.join(self.dir_path, "part-*.csv")))
+
+    def load(self) -> Dict[str, Tuple[Optional[float], Optional[float]]]:
+        parts = self._parts()
+        if not parts:
+            return {}
+        df = pd.concat([pd.read_csv(p, encoding="utf-8-sig") for p in parts], ignore_index=True)
+        df = df.drop_duplicates(subset=["쿼리주소"], keep="last")
+        lat = df["위도"].astype(object).where(df["위도"].notna(), None)
+        lng = df["경도"].astype(object).where(df["경도"].notna(), None)
+        return dict(zip(df["쿼리주소"], zip(lat, lng)))
+
+    def add(self, addr: str, lat, lng):
+        self._buf.append((addr, lat, lng))
+        if len(self._buf) >= self.every:
+            self.flush()
+
+    def flush(self):
+        if not self._buf:
+            return
+        self._n_parts += 1
+        path = os.path.join(self.dir_path, f"part-{self._n_parts:05d}.csv")
+        pd.DataFrame(self._buf, columns=["쿼리주소", "위도", "경도"]).to_csv(path + ".tmp", index=False, encoding="utf-8-sig")
+        os.replace(path + ".tmp", path)   # 중간에 끊겨도 완성된 part만 남음
+        print(f"[Checkpoint] part {self._n_parts} (+{len(self._buf)}건) 저장")
+        self._buf = []
+
+    def clear(self):
+        for p in self._parts():
+            os.remove(p)
+        self._buf = []
+        self._n_parts = 0
 
 # =========================
-# 메인 파이프라인
+# 쿼리 구성
 # =========================
-def main():
-    # 1) CSV 로드 (인코딩 자동)
-    df = read_csv_auto(INPUT_CSV)
-
+def add_queries(df: pd.DataFrame) -> pd.DataFrame:
+    """단속동/단속장소 컬럼 확인·보강 후 '쿼리주소' 컬럼 추가"""
     # 필수 컬럼 확인/보강
     if "단속장소" not in df.columns:
         # D열이 '단속장소'가 아닌 경우, 4번째 컬럼을 단속장소로 간주
@@ -251,101 +226,218 @@ def main():
         except Exception:
             df["단속동"] = ""
 
-    # 2) 쿼리 구성
     df["단속동"] = df["단속동"].fillna("").astype(str).str.strip()
     df["단속장소"] = df["단속장소"].fillna("").astype(str).str.strip()
     df["쿼리주소"] = df.apply(lambda r: build_query(r["단속동"], r["단속장소"]), axis=1)
+    return df
 
-    # 3) 캐시 로드
-    cache_addr = load_cache(CACHE_ADDR_JSON)   # 주소쿼리 캐시
-    cache_dong = load_cache(CACHE_DONG_JSON)   # 동 센트로이드 캐시
-
-    # 4) 세션/레이트리밋
-    session = make_session()
-    rate_lock = Lock()
-    last_call_time = [0.0]
-
-    def rate_limit_sleep():
-        with rate_lock:
-            now = time.time()
-            elapsed = now - last_call_time[0]
-            if elapsed < RATE_LIMIT_DELAY:
-                time.sleep(RATE_LIMIT_DELAY - elapsed)
-            last_call_time[0] = time.time()
-
-    # 5) 고유 쿼리 우선순위 (빈도 높은 것부터)
-    priority = df["쿼리주소"].value_counts().rename_axis("addr").reset_index(name="cnt")
-    unique_addrs = priority["addr"].tolist()
-
-    results: Dict[str, Tuple[Optional[float], Optional[float]]] = {}
-    # 캐시에 있는 것은 미리 반영
-    for a in unique_addrs:
-        if a in cache_addr and isinstance(cache_addr[a], list) and len(cache_addr[a]) == 2:
-            results[a] = (cache_addr[a][0], cache_addr[a][1])
+# =========================
+# 정규 키 절감 리포트
+# =========================
+def _key_savings(queries) -> Tuple[int, int]:
+    """(고유 쿼리 수, 고유 정규 키 수)"""
+    uniq = set(queries)
+    return len(uniq), len({canonical_key(q) or q for q in uniq})
+
+def report_key_savings(paths: Dict[str, str] = None):
+    """연도별 단속현황 쿼리 → 원문 키 대비 정규 키로 줄어드는 API 호출 수(쿼리당 최소 1회 기준)"""
+    paths = paths or ENFORCEMENT_CSVS
+    all_queries = []
+    for label, path in paths.items():
+        if not os.path.exists(path):
+            print(f"[SKIP] {label}: {path} 없음")
+            continue
+        queries = add_queries(read_csv_auto(path))["쿼리주소"].tolist()
+        all_queries.extend(queries)
+        n_raw, n_key = _key_savings(queries)
+        print(f"[KEY] {label}: 행 {len(queries)} | 고유 쿼리 {n_raw} → 정규 키 {n_key} | "
+              f"절감 {n_raw - n_key}건 ({(n_raw - n_key) / max(n_raw, 1) * 100:.1f}%)")
+
+    if not all_queries and os.path.exists(CACHE_ADDR_JSON):
+        # 원본 단속현황이 없으면 이전 실행들의 쿼리 이력(기존 JSON 캐시 키)으로 대신 집계
+        with open(CACHE_ADDR_JSON, "r", encoding="utf-8") as f:
+            all_queries = list(json.load(f))
+        print(f"[KEY] 원본 없음 → 쿼리 이력 사용: {CACHE_ADDR_JSON}")
+
+    n_raw, n_key = _key_savings(all_queries)
+    print(f"[KEY] 전체: 고유 쿼리 {n_raw} → 정규 키 {n_key} | "
+          f"절감 {n_raw - n_key}건 ({(n_raw - n_key) / max(n_raw, 1) * 100:.1f}%)")
+
+# =========================
+# 고유 쿼리 → 좌표 (체크포인트 → 저장소 → 오프라인 퍼지 → API)
+# =========================
+def resolve_addresses(unique_addrs, store, checkpoint: PartCheckpoint, offline: bool = False,
+                      fuzzy: bool = False):
+    """
+    빈도순 고유 쿼리 목록 → ({주소: (lat, lng)}, 실패 주소 목록)
+    - 단일 연도 main()과 연도 일괄 run_batch()가 같이 사용
+    - fuzzy: 오프라인 퍼지 매칭 사용 (offline이면 항상 사용)
+    """
+    # 이전 실행 체크포인트(part) → 이미 처리한 주소는 건너뜀
+    results: Dict[str, Tuple[Optional[float], Optional[float]]] = checkpoint.load()
+    failed_addrs = [a for a, (lat, lng) in results.items() if lat is None or lng is None]
+    if results:
+        print(f"[INFO] 체크포인트 복원: {len(results)}건 ({checkpoint.dir_path})")
+
+    # 저장소에 있는 것은 미리 반영 (일괄 조회)
+    for a, rec in store.get_many([a for a in unique_addrs if a not in results]).items():
+        results[a] = (rec["lat"], rec["lng"])
 
     addrs_to_fetch = [a for a in unique_addrs if a not in results]
-    print(f"총 고유 쿼리: {len(unique_addrs)} / 새 조회: {len(addrs_to_fetch)}")
 
-    # 6) 병렬 지오코딩 함수
-    def fetch(addr: str):
-        rate_limit_sleep()
-        lat, lng = geocode_any(session, addr)
-        # 실패 시, addr에서 동명을 추출해서 센트로이드 대체
+    # 오프라인 퍼지 매칭 → 신뢰도 높은 쿼리는 API 생략 (결과에만 반영, 저장소·체크포인트에는 기록 안 함)
+    if USE_OFFLINE_GEOCODER or fuzzy or offline:
+        geocoder = build_offline_geocoder(store, threshold=FUZZY_THRESHOLD)
+        n_fuzzy = 0
+        for a in addrs_to_fetch:
+            lat, lng = geocoder.match(a)
+            if lat is not None and lng is not None:
+                results[a] = (lat, lng)
+                n_fuzzy += 1
+        addrs_to_fetch = [a for a in addrs_to_fetch if a not in results]
+        print(f"[INFO] 오프라인 퍼지 매칭: {n_fuzzy}건 해결 (임계값 {FUZZY_THRESHOLD})")
+
+    # 실패 결과는 원인별 TTL이 지난 것만 다시 조회됨 (영구 실패는 저장소 결과로 바로 반영)
+    print(f"총 고유 쿼리: {len(unique_addrs)} / 새 조회(재시도 포함): {len(addrs_to_fetch)} | "
+          f"저장소 재시도 대상 실패: {len(store.retryable())}")
+
+    # 비동기 지오코딩 (주소 → 키워드 → 실패 시 addr의 동명으로 센트로이드 대체, 결과는 저장소 기록) + 체크포인트
+    def on_result(addr: str, lat, lng):
+        results[addr] = (lat, lng)
         if lat is None or lng is None:
-            tail = addr.replace(CITY_PREFIX, "", 1).strip()
-            dong = tail.split()[0] if tail else ""
-            if dong:
-                rate_limit_sleep()
-                lat, lng = get_dong_centroid(session, dong, cache_dong)
-        return addr, lat, lng
-
-    # 7) 병렬 실행 + 체크포인트
-    failed_addrs = []
-    processed = 0
-    checkpoint_every = 300
+            failed_addrs.append(addr)
+        checkpoint.add(addr, lat, lng)
+
+    if offline:
+        # 네트워크 없이 실행: 남은 쿼리는 실패로 보고만 함 (저장소에는 기록하지 않음 → 다음 온라인 실행에서 조회)
+        failed_addrs.extend(addrs_to_fetch)
+        print(f"[INFO] 오프라인 실행: API 조회 생략 {len(addrs_to_fetch)}건")
+    else:
+        locator = load_dong_locator()
+        geocode_many(addrs_to_fetch, headers=make_headers(), store=store, rate=GEOCODE_QPS, burst=GEOCODE_BURST,
+                     max_in_flight=MAX_WORKERS, city_prefix=CITY_PREFIX, on_result=on_result, locator=locator)
+        print(f"[INFO] 로컬 행정동 내부점 사용: {locator.hits}건 ({len(locator)}개 이름)")
+    checkpoint.flush()
+    return results, failed_addrs
+
+# =========================
+# 결과 저장 (단속 행 ← 주소별 좌표, 좌표별 단속건수)
+# =========================
+def attach_coords(df: pd.DataFrame, results: dict) -> pd.DataFrame:
+    """주소 → 좌표 표를 한 번에 병합"""
+    coords = pd.DataFrame.from_dict(results, orient="index", columns=["위도", "경도"], dtype=float)
+    df["위도"] = df["쿼리주소"].map(coords["위도"])
+    df["경도"] = df["쿼리주소"].map(coords["경도"])
+    df["지오코딩성공"] = df["위도"].notna() & df["경도"].notna()
+    return df
+
+def group_by_coordinate(df: pd.DataFrame) -> pd.DataFrame:
+    """(위도, 경도)별 단속건수 (2_03 과 같은 집계)"""
+    return (
+        df.dropna(subset=["위도", "경도"])
+          .groupby(["위도", "경도"], as_index=False)
+          .size()
+          .rename(columns={"size": "단속건수"})
+          .sort_values("단속건수", ascending=False)
+    )
 
+def save_failed(failed_addrs, path: str):
+    if failed_addrs:
+        pd.DataFrame({"failed_query": sorted(set(failed_addrs))}).to_csv(path, index=False, encoding="utf-8-sig")
+        print(f"[참고] 실패 쿼리 {len(set(failed_addrs))}건 저장: {path}")
+
+def open_pipeline_store():
+    """공용 지오코딩 저장소 (기존 JSON 캐시는 변경 시에만 이관)"""
+    return open_shared_store(extra_legacy=[(CACHE_ADDR_JSON, "latlng", "query"),
+                                           (CACHE_DONG_JSON, "latlng", "dong")])
+
+# =========================
+# 메인 파이프라인 (단일 연도: INPUT_CSV → OUTPUT_CSV)
+# =========================
+def main(offline: bool = False, fuzzy: bool = False):
+    # 1~2) CSV 로드 (인코딩 자동) + 쿼리 구성
+    df = add_queries(read_csv_auto(INPUT_CSV))
+
+    # 3) 공용 지오코딩 저장소
+    store = open_pipeline_store()
+
+    # 4~5) 고유 쿼리 우선순위 (빈도 높은 것부터)
+    unique_addrs = df["쿼리주소"].value_counts().index.tolist()
+
+    # 6~7) 체크포인트 → 저장소 → 오프라인 퍼지 → 비동기 API
     os.makedirs(os.path.dirname(OUTPUT_CSV), exist_ok=True)
-    os.makedirs(os.path.dirname(CHECKPOINT_CSV), exist_ok=True)
     os.makedirs(os.path.dirname(FAILED_CSV), exist_ok=True)
-    os.makedirs(os.path.dirname(CACHE_ADDR_JSON), exist_ok=True)
-
-    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as ex:
-        futures = [ex.submit(fetch, a) for a in addrs_to_fetch]
-        for fut in as_completed(futures):
-            addr, lat, lng = fut.result()
-            results[addr] = (lat, lng)
-            cache_addr[addr] = [lat, lng] if (lat is not None and lng is not None) else [None, None]
-            if lat is None or lng is None:
-                failed_addrs.append(addr)
-            processed += 1
-
-            if processed % checkpoint_every == 0:
-                # 캐시 저장
-                save_cache(CACHE_ADDR_JSON, cache_addr)
-                save_cache(CACHE_DONG_JSON, cache_dong)
-                # 체크포인트 CSV
-                df["위도"] = df["쿼리주소"].map(lambda a: results.get(a, (None, None))[0])
-                df["경도"] = df["쿼리주소"].map(lambda a: results.get(a, (None, None))[1])
-                df["지오코딩성공"] = df["위도"].notna() & df["경도"].notna()
-                df.to_csv(CHECKPOINT_CSV, index=False, encoding="utf-8-sig")
-                print(f"[Checkpoint] {processed}건 처리, 임시 저장 완료")
+    checkpoint = PartCheckpoint(CHECKPOINT_DIR)
+    results, failed_addrs = resolve_addresses(unique_addrs, store, checkpoint, offline=offline, fuzzy=fuzzy)
 
     # 8) 최종 매핑/저장
-    df["위도"] = df["쿼리주소"].map(lambda a: results.get(a, (None, None))[0])
-    df["경도"] = df["쿼리주소"].map(lambda a: results.get(a, (None, None))[1])
-    df["지오코딩성공"] = df["위도"].notna() & df["경도"].notna()
-
+    df = attach_coords(df, results)
     df.to_csv(OUTPUT_CSV, index=False, encoding="utf-8-sig")
+    checkpoint.clear()
     print(f"[완료] 저장: {OUTPUT_CSV} | 성공률: {df['지오코딩성공'].mean()*100:.1f}% ({df['지오코딩성공'].sum()} / {len(df)})")
 
     # 9) 실패 목록 저장
-    if failed_addrs:
-        pd.DataFrame({"failed_query": sorted(set(failed_addrs))}).to_csv(FAILED_CSV, index=False, encoding="utf-8-sig")
-        print(f"[참고] 실패 쿼리 {len(set(failed_addrs))}건 저장: {FAILED_CSV}")
+    save_failed(failed_addrs, FAILED_CSV)
 
-    # 10) 캐시 저장
-    save_cache(CACHE_ADDR_JSON, cache_addr)
-    save_cache(CACHE_DONG_JSON, cache_dong)
+    # 10) 저장소 요약
+    print(f"[참고] 지오코딩 저장소: {store.summary()}")
+    store.close()
+
+# =========================
+# 연도 일괄 실행 (전 연도 공통 쿼리 계획 1회 → 연도별 결과/집계 파일)
+# =========================
+def run_batch(paths: Dict[str, str] = None, offline: bool = False, fuzzy: bool = False):
+    """
+    연도별 단속현황(ENFORCEMENT_CSVS) → 연도별 OUTPUT_PATTERN / GROUPED_PATTERN / FAILED_PATTERN
+    - 전 연도 쿼리를 합친 빈도순 고유 쿼리 계획을 한 번만 세움 → 여러 해에 걸친 장소도 1회 조회
+    - 체크포인트는 BATCH_CHECKPOINT_DIR 하나 (중단 후 재실행 시 연도 구분 없이 이어서 처리)
+    """
+    paths = paths or ENFORCEMENT_CSVS
+    frames = {}
+    for label, path in paths.items():
+        if not os.path.exists(path):
+            print(f"[SKIP] {label}: {path} 없음")
+            continue
+        frames[label] = add_queries(read_csv_auto(path))
+        print(f"[INFO] {label}: {len(frames[label])}행 ({path})")
+    if not frames:
+        print("[INFO] 처리할 연도 파일이 없습니다.")
+        return
+
+    all_queries = pd.concat([df["쿼리주소"] for df in frames.values()], ignore_index=True)
+    unique_addrs = all_queries.value_counts().index.tolist()
+    n_per_year = sum(df["쿼리주소"].nunique() for df in frames.values())
+    print(f"[INFO] 일괄 계획: {len(frames)}개 연도, 연도별 고유 쿼리 합 {n_per_year} → 전체 고유 {len(unique_addrs)} "
+          f"(연도 간 중복 {n_per_year - len(unique_addrs)}건 1회 조회)")
+
+    store = open_pipeline_store()
+    checkpoint = PartCheckpoint(BATCH_CHECKPOINT_DIR)
+    results, failed_addrs = resolve_addresses(unique_addrs, store, checkpoint, offline=offline, fuzzy=fuzzy)
+    failed = set(failed_addrs)
+
+    for label, df in frames.items():
+        out_csv = OUTPUT_PATTERN.format(label=label)
+        os.makedirs(os.path.dirname(out_csv), exist_ok=True)
+        df = attach_coords(df, results)
+        df.to_csv(out_csv, index=False, encoding="utf-8-sig")
+        grouped = group_by_coordinate(df)
+        grouped.to_csv(GROUPED_PATTERN.format(label=label), index=False, encoding="utf-8-sig")
+        print(f"[완료] {label}: {out_csv} | 성공률: {df['지오코딩성공'].mean()*100:.1f}% "
+              f"({df['지오코딩성공'].sum()} / {len(df)}) | 고유 좌표 {len(grouped)}")
+        save_failed([a for a in df["쿼리주소"].unique() if a in failed], FAILED_PATTERN.format(label=label))
+    checkpoint.clear()
+
+    print(f"[참고] 지오코딩 저장소: {store.summary()}")
+    store.close()
 
 if __name__ == "__main__":
-    main()
+    args = sys.argv[1:]
+    if "--key-report" in args:
+        report_key_savings()
+    elif "--batch" in args:
+        # --batch [22년 23년 ...]: 지정 연도만 (없으면 ENFORCEMENT_CSVS 전부)
+        labels = [a for a in args if not a.startswith("--")]
+        paths = {k: v for k, v in ENFORCEMENT_CSVS.items() if not labels or k in labels}
+        run_batch(paths, offline="--offline" in args, fuzzy="--fuzzy" in args)
+    else:
+        main(offline="--offline" in args, fuzzy="--fuzzy" in args)
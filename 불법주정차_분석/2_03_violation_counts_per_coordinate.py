@@ -1,20 +1,15 @@
 import pandas as pd
 
+import _repo_path  # noqa: F401  저장소 루트의 공용 CSV 판별 모듈(csv_sniff) 사용
+from csv_sniff import read_csv_auto, sniff_csv
+
 # 1) CSV 파일 경로 설정
 in_path  = "data/천안시_단속장소_위도경도_24년.csv"
 out_path = "data/천안시_단속장소_위도경도_24년_grouped.csv"
 
-# 2) 인코딩 자동 시도하여 로드
-df = None
-for enc in ("utf-8-sig", "utf-8", "cp949", "euc-kr"):
-    try:
-        df = pd.read_csv(in_path, encoding=enc, low_memory=False)
-        print(f"[INFO] 로드 성공: {enc}")
-        break
-    except Exception as e:
-        last_err = e
-if df is None:
-    raise last_err
+# 2) 인코딩/구분자 자동 판별 후 로드 (파일당 1회 파싱)
+df = read_csv_auto(in_path)
+print(f"[INFO] 로드 성공: {sniff_csv(in_path)['encoding']}")
 
 # 3) 위도/경도 컬럼 찾기 (후보 이름 중 첫 매칭 사용)
 lat_candidates = ["위도", "lat", "Lat", "LAT", "Latitude", "latitude"]
@@ -0,0 +1,13 @@
+# -*- coding: utf-8 -*-
+"""
+불법주정차_분석 스크립트 공용 경로 설정
+- 저장소 루트의 공용 모듈(csv_sniff, geocode_store, kakao_geocoder_async 등)을 import 경로에 추가
+- 사용: 각 스크립트에서 공용 모듈보다 먼저 `import _repo_path`
+"""
+
+import os
+import sys
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+if REPO_ROOT not in sys.path:
+    sys.path.append(REPO_ROOT)